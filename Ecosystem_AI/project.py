@@ -7,17 +7,24 @@ Version: 1.0
 '''
 
 # Import necessary modules
-from scripts.neuralnetwork import train_neural, AI_test
-import numpy as np
+import time
+START_TIME = time.perf_counter()  # Taken first so the startup report covers every import
+
 import tkinter as tk
 from scripts.gui import App  # Import the App class from gui.py
+from scripts.startup import report_startup  # TensorFlow is only imported once training starts
+
+# Guarded so worker processes started with 'spawn' (see ensemble.py) import this file without opening a window
+if __name__ == '__main__':
+    # Initialize the Tkinter window
+    root = tk.Tk()
+    root.geometry("900x600") 
 
-# Initialize the Tkinter window
-root = tk.Tk()
-root.geometry("900x600") 
+    # Create the app
+    app = App(root)
 
-# Create the app
-app = App(root)
+    # Report how long it took to draw the first screen
+    root.after_idle(report_startup, START_TIME)
 
-# Run the Tkinter main loop
-root.mainloop()
\ No newline at end of file
+    # Run the Tkinter main loop
+    root.mainloop()
\ No newline at end of file
@@ -11,10 +11,9 @@ Version: 1.0
 import tkinter as tk
 import random
 import numpy as np
-from scripts.species_creation import ecosystem, Species, Forest  # Import ecosystem and relevant classes
+from scripts.species_creation import ecosystem, Forest  # Import ecosystem and relevant classes
 from scripts.symbolic_ai_test import RuleEngine, rule_resource_health, rule_predator_prey, rule_self_aggression, rule_reproduction  # Import RuleEngine and rules
 from scripts.player_stats import Player  # Import Player class
-from scripts.neuralnetwork import AI_test  # Import AI_test function
 from scenes.training_screens import TrainingScreen  # Import TrainingScreen class
 
 
@@ -24,6 +23,8 @@ class Area3Screen(tk.Frame):
     Allows the player to interact with the ecosystem by hunting, collecting resources, and managing actions.
     '''
 
+    meat_per_hunt = 0  # Meat added to the inventory by each hunt
+
     def __init__(self, parent) -> None:
         '''
         Initialize the Area3Screen with GUI components and buttons for player actions.
@@ -189,21 +190,15 @@ class Area3Screen(tk.Frame):
 
                 model = self.parent.trained_model
                 if model:
-                    game_data = np.array([[player.health, target.current_aggression]]) / 100
-                    results = AI_test(model, game_data)
-
-                    if any(action == 'Action' for _, action in results):
-                        player.update_health(-health_loss_ranges[0])
-                        message = f'You hunted a {target.name}! + 1 Meat | Aggressive behavior caused -{health_loss_ranges[0]} HP.'
-                    elif any(action == 'Warning' for _, action in results):
-                        player.update_health(-health_loss_ranges[1])
-                        message = f'You hunted a {target.name}! + 1 Meat | Warning behavior caused -{health_loss_ranges[1]} HP.'
-                    elif any(action == 'Nothing' for _, action in results):
-                        random_health_loss = random.randint(*health_loss_ranges[2])
-                        player.update_health(-random_health_loss)
-                        message = f'You hunted a {target.name}! + 1 Meat | Neutral behavior caused -{random_health_loss} HP.'
-                    else:
-                        message = 'No action taken by the AI.'
+                    game_data = np.array([player.health, target.current_aggression]) / 100
+                    if self.meat_per_hunt:
+                        player.add_item_to_inventory('Meat', self.meat_per_hunt)
+
+                    # Classify on the inference worker; the base screen applies the outcome when the result arrives
+                    base_screen = self.parent.frames['Base']
+                    self.parent.inference_service.submit(game_data, lambda action, _: self.update_screen(
+                        base_screen.resolve_hunt(target, action, health_loss_ranges, game_data, self.meat_per_hunt)))
+                    message = f'{base_screen.hunt_message(target, self.meat_per_hunt)} | Watching how the {target.name} reacts...'
                 else:
                     message = 'Error: No trained model available!'
             else:
@@ -268,4 +263,4 @@ class Area3Screen(tk.Frame):
         for forest in ecosystem:
             if forest.name == area_name:
                 return forest
-        return None
\ No newline at end of file
+        return None
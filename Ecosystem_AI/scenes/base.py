@@ -13,8 +13,13 @@ import numpy as np
 from scripts.player_stats import Player
 from scripts.house import House
 from scenes.training_screens import TrainingScreen
-from scripts.neuralnetwork import AI_test
-from scripts.symbolic_ai_test import RuleEngine, rule_resource_health, rule_self_aggression, rule_predator_prey, rule_reproduction
+from scripts.neuralnetwork import AI_classify
+from scripts.numpy_model import ActionLabel, Predictions
+from scripts.online_learning import encounter_outcome
+from scripts.species_creation import Species
+from scripts.symbolic_ai_test import IncrementalRuleEngine, PartitionedRuleEngine, rule_resource_health, rule_self_aggression, rule_predator_prey, rule_reproduction
+from scripts.species_arrays import ArrayRuleEngine, USE_ARRAY_RULES
+from scripts.rule_dsl import load_rules, USE_RULE_FILE
 
 
 class BaseScreen(tk.Frame):
@@ -33,54 +38,43 @@ class BaseScreen(tk.Frame):
         super().__init__(parent.root)
         self.parent = parent
 
-        # Initialize the Rule Engine
-        self.rule_engine = RuleEngine()
-        self.rule_engine.add_rule(rule_resource_health)
-        self.rule_engine.add_rule(rule_self_aggression)
-        self.rule_engine.add_rule(rule_predator_prey)
-        self.rule_engine.add_rule(rule_reproduction)
+        # Initialize the Rule Engine, with one partition per forest
+        self.rule_engine = PartitionedRuleEngine(ArrayRuleEngine if USE_ARRAY_RULES else IncrementalRuleEngine)
+        if USE_RULE_FILE:
+            rules = load_rules()
+        else:
+            rules = (rule_resource_health, rule_self_aggression, rule_predator_prey, rule_reproduction)
+        for rule in rules:
+            self.rule_engine.add_rule(rule)
 
-        # Initialize context for the Rule Engine
-        self.context = {
-            'species': self.get_species_data(),
-            'resources': self.get_resource_data()
-        }
+        # Initialize the per-forest contexts for the Rule Engine
+        self.contexts = self.get_forest_contexts()
 
         # Initialize GUI elements
         self.init_gui()
 
-    def get_species_data(self) -> list:
+    def destroy(self) -> None:
         '''
-        Retrieve species data for the rule engine context.
-
-        Returns:
-            list: A list of species objects from the ecosystem.
+        Shut down the rule engine's threads and stop it watching species, then destroy the screen.
         '''
-        from scripts.species_creation import ecosystem
-        species = []
-        for forest in ecosystem:
-            species.extend(forest.carnivores + forest.herbivores + forest.herbs)
-        return species
+        self.rule_engine.close()
+        super().destroy()
 
-    def get_resource_data(self) -> list:
+    def get_forest_contexts(self) -> dict:
         '''
-        Retrieve resource data for the rule engine context.
+        Retrieve one rule engine context per forest, so each forest's resources only affect its own species.
 
         Returns:
-            list: A list of resource objects from the ecosystem.
+            dict: The context of each forest, by forest name.
         '''
         from scripts.species_creation import ecosystem
-        resources = []
-        for forest in ecosystem:
-            resources.extend(forest.resources)
-        return resources
+        return {forest.name: forest.context() for forest in ecosystem}
 
     def update_context(self) -> None:
         '''
-        Update the context with the latest species and resource data.
+        Update the contexts with the latest species and resource data.
         '''
-        self.context['species'] = self.get_species_data()
-        self.context['resources'] = self.get_resource_data()
+        self.contexts = self.get_forest_contexts()
 
     def init_gui(self) -> None:
         '''
@@ -238,14 +232,14 @@ class BaseScreen(tk.Frame):
 
         # Update context and evaluate rules
         self.update_context()
-        self.rule_engine.evaluate(self.context)
+        self.rule_engine.evaluate(self.contexts)
 
         # Check for farm raids
-        farm_raid_chance = self.check_aggressive_prey()
-        if 'Action' in farm_raid_chance and base.farm:
+        forest_results = self.check_aggressive_prey()
+        if any(p.contains(ActionLabel.ACTION) for p in forest_results.values()) and base.farm:
             message = 'Aggressive prey raided the farm! They ate all your crops!'
             base.set_farm()
-        elif 'Warning' in farm_raid_chance and base.farm:
+        elif any(p.contains(ActionLabel.WARNING) for p in forest_results.values()) and base.farm:
             if random.randint(1, 2) == 1:
                 message = 'Agitated prey raided the farm! They ate all your crops!'
                 base.set_farm()
@@ -256,26 +250,86 @@ class BaseScreen(tk.Frame):
 
         self._update_and_display_message(message)
 
-    def check_aggressive_prey(self) -> str:
+    def check_aggressive_prey(self) -> dict[str, Predictions]:
         '''
         Use ANN to check for aggressive prey actions.
+        All herbivores across all forests are classified in a single batched call.
 
         Returns:
-            str: The result of the AI test for aggressive prey.
+            dict[str, Predictions]: For each forest name, the herbivores' probabilities and labels.
         '''
         model = self.parent.trained_model
         base = self.parent.get_base_instance()
         from scripts.species_creation import ecosystem
 
-        species_action = ''
+        herbivores = [herbivore for forest in ecosystem for herbivore in forest.herbivores]
+        if model is None or not herbivores:
+            return {}
+
+        game_data = np.array([[base.health, herbivore.current_aggression] for herbivore in herbivores]) / 100.0
+        predictions = AI_classify(model, game_data)
+
+        # Split the batch back into per-forest results
+        forest_results = {}
+        start = 0
         for forest in ecosystem:
-            forest_status = [f'\n{forest.name} Ecosystem:']
-            for herbivore in forest.herbivores:
-                game_data = np.array([[base.health, herbivore.current_aggression]]) / 100.0
-                results = AI_test(model, game_data)
-                forest_status.append(str(results))
-            species_action += '\n'.join(forest_status) + '\n'
-        return species_action
+            end = start + len(forest.herbivores)
+            forest_results[forest.name] = predictions.select(slice(start, end))
+            start = end
+        return forest_results
+
+    @staticmethod
+    def hunt_message(target: Species, meat: int) -> str:
+        '''
+        Describe a successful hunt and the meat it gave.
+
+        Args:
+            target (Species): The species that was hunted.
+            meat (int): The meat added to the inventory, if any.
+
+        Returns:
+            str: The start of the hunt message.
+        '''
+        return f'You hunted a {target.name}!' + (f' + {meat} Meat' if meat else '')
+
+    def resolve_hunt(self, target: Species, action: ActionLabel | None, health_loss_ranges: tuple,
+                     game_data: np.ndarray, meat: int) -> str:
+        '''
+        Apply the outcome of a hunt in any area once the AI has classified the target's behavior.
+
+        Args:
+            target (Species): The species that was hunted.
+            action (ActionLabel | None): The predicted action, or None if no result was available.
+            health_loss_ranges (tuple): The health loss ranges for different AI actions.
+            game_data (np.ndarray): The model input the prediction was made from.
+            meat (int): The meat the hunt added to the inventory.
+
+        Returns:
+            str: The message for the hunting area to display.
+        '''
+        player = self.parent.get_player_instance()
+        health_before = player.health
+        hunted = self.hunt_message(target, meat)
+
+        if action == ActionLabel.ACTION:
+            player.update_health(-health_loss_ranges[0])
+            message = f'{hunted} | Aggressive behavior caused -{health_loss_ranges[0]} HP.'
+        elif action == ActionLabel.WARNING:
+            player.update_health(-health_loss_ranges[1])
+            message = f'{hunted} | Warning behavior caused -{health_loss_ranges[1]} HP.'
+        elif action == ActionLabel.NOTHING:
+            random_health_loss = random.randint(*health_loss_ranges[2])
+            player.update_health(-random_health_loss)
+            message = f'{hunted} | Neutral behavior caused -{random_health_loss} HP.'
+        else:
+            message = 'No action taken by the AI.'
+
+        # Learn from the HP the hunt actually cost, not from the prediction itself
+        if action is not None:
+            outcome = encounter_outcome(health_before - player.health, health_loss_ranges)
+            self.parent.record_encounter(game_data, action, outcome)
+
+        return message
 
     def goto_gui(self) -> None:
         '''
@@ -293,4 +347,4 @@ class BaseScreen(tk.Frame):
         player_data = self.parent.get_player_data()
         base_data = self.parent.get_base_data()
         self.update_data(player_data, base_data)
-        self.player_data_text.insert(tk.END, f'\n{message}')
\ No newline at end of file
+        self.player_data_text.insert(tk.END, f'\n{message}')
@@ -7,8 +7,7 @@ Version: 1.0
 '''
 
 import tkinter as tk
-import threading
-from scripts.neuralnetwork import train_neural  # Import the training function
+from scripts.neuralnetwork import load_or_train, build_inference_model  # Import the training functions
 
 
 class TrainingScreen(tk.Frame):
@@ -41,17 +40,33 @@ class TrainingScreen(tk.Frame):
 
     def start_training(self) -> None:
         '''
-        Start the AI training process in a separate thread.
+        Start the AI training process in a background thread.
         '''
         self.train_button.config(state='disabled')  # Disable the button to prevent multiple clicks
-        threading.Thread(target=self.train_ai).start()
+        self.parent.model_registry.retrain_async(self.train_ai, on_done=self.training_done)
 
-    def train_ai(self) -> None:
+    @staticmethod
+    def train_ai() -> object:
+        '''
+        Train the AI. Runs on the registry's background thread.
+
+        Returns:
+            object: The model to publish.
         '''
-        Train the AI and enable the 'Next' button after completion.
+        trained_model = load_or_train()  # Load cached weights or train the neural network on a cache miss
+        return build_inference_model(trained_model)  # Publish a TensorFlow-free copy for fast inference
+
+    def training_done(self, version: int | None) -> None:
+        '''
+        Update the screen once the trained model is published. Runs on the GUI thread.
+
+        Args:
+            version (int | None): The published model version, or None if training failed.
         '''
-        trained_model = train_neural()  # Train the neural network and store the model as an instance attribute
-        self.parent.trained_model = trained_model  # Store the trained model in the parent object
+        if version is None:
+            self.label.config(text='Training failed, please try again.')
+            self.train_button.config(state='normal')
+            return
         self.label.config(text='Training complete!')  # Update the label
         self.next_button.config(state='normal')  # Enable the 'Next' button
 
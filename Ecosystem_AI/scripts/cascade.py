@@ -0,0 +1,211 @@
+'''
+Script: cascade.py
+Description: Implements a rule-gated cascade in front of the action classifier. Cheap symbolic predicates
+             over HP and aggression decide clear-cut encounters directly, and only the ambiguous rows near
+             the decision boundaries are passed to the model. Counters show how much model work is skipped.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import threading
+from typing import Callable, NamedTuple
+import numpy as np
+from scripts.numpy_model import ActionLabel, Predictions
+from scripts.quantized import calibration_grid
+
+# Constants
+CASCADE_MIN_AGREEMENT = 1.0  # Share of the rows a rule covers where it must match the model to be used
+
+
+class ClearCutRule(NamedTuple):
+    '''
+    A symbolic shortcut: every row matching the condition gets the label without running the model.
+    '''
+    name: str
+    label: ActionLabel
+    condition: Callable[[np.ndarray, np.ndarray], np.ndarray]  # (hp, aggression) in game units -> bool mask
+
+
+# Rules are tried in order; a row takes the first rule it matches
+CLEAR_CUT_RULES = (
+    # Aggression far above what the player's health can face down
+    ClearCutRule('outmatched', ActionLabel.ACTION, lambda hp, aggression: aggression >= hp * 0.8 + 20),
+    # A healthy player meeting a species with next to no aggression
+    ClearCutRule('calm', ActionLabel.NOTHING, lambda hp, aggression: (hp >= 40) & (aggression <= (hp - 40) * 0.25)),
+)
+
+
+class CascadeModel:
+    '''
+    Wraps a model so clear-cut inputs are answered by symbolic rules and the rest by the model.
+    Exposes the same predict API as the wrapped model.
+    '''
+
+    def __init__(self, model, rules: tuple = CLEAR_CUT_RULES) -> None:
+        '''
+        Initialize the CascadeModel.
+
+        Args:
+            model: The model for ambiguous rows, with a predict method.
+            rules (tuple): The ClearCutRules to try, in order. Defaults to CLEAR_CUT_RULES.
+        '''
+        self.model = model
+        self.rules = tuple(rules)
+        self.lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        '''
+        Zero the counters.
+        '''
+        with self.lock:
+            self.calls = 0
+            self.rows = 0
+            self.short_circuited = 0
+            self.model_calls = 0
+            self.rule_hits = {rule.name: 0 for rule in self.rules}
+
+    def calibrate(self, inputs: np.ndarray | None = None,
+                  min_agreement: float = CASCADE_MIN_AGREEMENT) -> dict[str, float]:
+        '''
+        Check each rule against the model and drop any that disagree with it.
+
+        Args:
+            inputs (np.ndarray | None): Rows to check on, divided by 100. Defaults to the full calibration grid.
+            min_agreement (float): Share of covered rows that must match. Defaults to CASCADE_MIN_AGREEMENT.
+
+        Returns:
+            dict[str, float]: The agreement of every rule checked. Rules covering no rows count as agreeing.
+        '''
+        inputs = calibration_grid() if inputs is None else inputs
+        labels = self._model_labels(inputs)
+        hp, aggression = self._game_units(inputs)
+
+        agreement, kept = {}, []
+        for rule in self.rules:
+            covered = rule.condition(hp, aggression)
+            agreement[rule.name] = float(np.mean(labels[covered] == rule.label)) if covered.any() else 1.0
+            if agreement[rule.name] >= min_agreement:
+                kept.append(rule)
+            else:
+                print(f'Cascade rule {rule.name!r} dropped: {agreement[rule.name]:.2%} agreement with the model.')
+        self.rules = tuple(kept)
+        self.reset_stats()
+        return agreement
+
+    @staticmethod
+    def _game_units(test_data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        '''Return the HP and aggression columns in game units.'''
+        rows = np.asarray(test_data, dtype=np.float32).reshape(-1, 2) * 100
+        return rows[:, 0], rows[:, 1]
+
+    def _model_labels(self, test_data: np.ndarray) -> np.ndarray:
+        '''Return the wrapped model's labels from a single predict call.'''
+        return np.argmax(self.model.predict(test_data, verbose=0), axis=1)
+
+    def _decide(self, test_data: np.ndarray) -> np.ndarray:
+        '''
+        Apply the rules to every row.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            np.ndarray: The rule label of each row, or -1 where no rule matched.
+        '''
+        hp, aggression = self._game_units(test_data)
+        decided = np.full(len(hp), -1, dtype=np.int8)
+        hits = {}
+        for rule in self.rules:
+            matched = (decided < 0) & rule.condition(hp, aggression)
+            decided[matched] = rule.label
+            hits[rule.name] = int(np.count_nonzero(matched))
+
+        with self.lock:
+            self.calls += 1
+            self.rows += len(decided)
+            for name, count in hits.items():
+                self.rule_hits[name] += count
+                self.short_circuited += count
+        return decided
+
+    def classify(self, test_data: np.ndarray) -> Predictions:
+        '''
+        Classify a batch, running the model only on the rows no rule decided.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            Predictions: One-hot probabilities for rule-decided rows and model probabilities for the rest.
+        '''
+        rows = np.asarray(test_data, dtype=np.float32).reshape(-1, 2)
+        labels = self._decide(rows)
+        probabilities = np.eye(len(ActionLabel), dtype=np.float32)[np.maximum(labels, 0)]
+
+        ambiguous = labels < 0
+        if ambiguous.any():
+            with self.lock:
+                self.model_calls += 1
+            probabilities[ambiguous] = self.model.predict(rows[ambiguous], verbose=0)
+            labels[ambiguous] = np.argmax(probabilities[ambiguous], axis=1)
+        return Predictions(probabilities, labels)
+
+    def predict(self, test_data: np.ndarray, verbose: int = 0) -> np.ndarray:
+        '''
+        Return class probabilities, one-hot for rule-decided rows.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+            verbose (int): Accepted for compatibility with Sequential.predict. Ignored.
+
+        Returns:
+            np.ndarray: Probabilities of shape (rows, classes).
+        '''
+        return self.classify(test_data).probabilities
+
+    def predict_labels(self, test_data: np.ndarray) -> np.ndarray:
+        '''
+        Return the predicted class index for each input row.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            np.ndarray: Class indices into ACTIONS.
+        '''
+        rows = np.asarray(test_data, dtype=np.float32).reshape(-1, 2)
+        labels = self._decide(rows)
+        ambiguous = labels < 0
+        if ambiguous.any():
+            with self.lock:
+                self.model_calls += 1
+            labels[ambiguous] = self._model_labels(rows[ambiguous])
+        return labels
+
+    def get_weights(self) -> list[np.ndarray]:
+        '''
+        Return the wrapped model's weights.
+
+        Returns:
+            list[np.ndarray]: Alternating kernels and biases, stacked per member for ensembles.
+        '''
+        return self.model.get_weights()
+
+    def stats(self) -> dict:
+        '''
+        Return the cascade counters.
+
+        Returns:
+            dict: Calls, rows, rows decided by rules (total, share and per rule) and model calls.
+        '''
+        with self.lock:
+            return {
+                'calls': self.calls,
+                'rows': self.rows,
+                'short_circuited': self.short_circuited,
+                'short_circuit_share': self.short_circuited / self.rows if self.rows else 0.0,
+                'model_calls': self.model_calls,
+                'rule_hits': dict(self.rule_hits),
+            }
@@ -0,0 +1,133 @@
+'''
+Script: convergence.py
+Description: Implements convergence-driven stopping for classifier training. Stops when the model is good
+             enough, when the loss plateaus or when a wall-clock budget runs out, and can restore the best weights.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import time
+from typing import Callable
+import numpy as np
+
+# Constants
+PATIENCE = 20  # Epochs without loss improvement before training stops
+MIN_DELTA = 1e-4  # Smallest loss decrease that counts as an improvement
+TARGET_ACCURACY = 1.0  # Accuracy needed for the model to count as good enough
+TARGET_LOSS = 0.05  # Loss needed, together with TARGET_ACCURACY, to stop early
+TIME_BUDGET = 30.0  # Hard limit on training time in seconds
+
+
+class ConvergenceMonitor:
+    '''
+    Tracks loss and accuracy per epoch and decides when training should stop.
+    Works with both training backends: the NumPy trainer calls update() directly,
+    and keras_callback() wraps it for model.fit.
+    '''
+
+    def __init__(self, patience: int = PATIENCE, min_delta: float = MIN_DELTA,
+                 target_accuracy: float = TARGET_ACCURACY, target_loss: float = TARGET_LOSS,
+                 time_budget: float = TIME_BUDGET, restore_best_weights: bool = True) -> None:
+        '''
+        Initialize the ConvergenceMonitor.
+
+        Args:
+            patience (int): Epochs without improvement before stopping. Defaults to PATIENCE.
+            min_delta (float): Smallest loss decrease that counts as an improvement. Defaults to MIN_DELTA.
+            target_accuracy (float): Accuracy that counts as good enough. Defaults to TARGET_ACCURACY.
+            target_loss (float): Loss that counts as good enough. Defaults to TARGET_LOSS.
+            time_budget (float): Seconds allowed for training. Defaults to TIME_BUDGET.
+            restore_best_weights (bool): Keep a copy of the lowest-loss weights. Defaults to True.
+        '''
+        self.patience = patience
+        self.min_delta = min_delta
+        self.target_accuracy = target_accuracy
+        self.target_loss = target_loss
+        self.time_budget = time_budget
+        self.restore_best_weights = restore_best_weights
+        self.start()
+
+    def start(self) -> None:
+        '''
+        Reset the monitor and start the wall-clock budget.
+        '''
+        self.start_time = time.perf_counter()
+        self.best_loss = np.inf
+        self.best_epoch = -1
+        self.best_weights = None
+        self.wait = 0
+        self.stopped_epoch = None
+        self.stop_reason = None
+
+    def update(self, epoch: int, loss: float, accuracy: float,
+               get_weights: Callable[[], list[np.ndarray]]) -> bool:
+        '''
+        Record one epoch and decide whether to stop.
+
+        Args:
+            epoch (int): The zero-based epoch number.
+            loss (float): The training loss for the epoch.
+            accuracy (float): The training accuracy for the epoch.
+            get_weights (Callable[[], list[np.ndarray]]): Returns the current weights. Only called on improvement.
+
+        Returns:
+            bool: True if training should stop.
+        '''
+        if loss < self.best_loss - self.min_delta:
+            self.best_loss = loss
+            self.best_epoch = epoch
+            self.wait = 0
+            if self.restore_best_weights:
+                self.best_weights = [np.array(w, copy=True) for w in get_weights()]
+        else:
+            self.wait += 1
+
+        if accuracy >= self.target_accuracy and loss <= self.target_loss:
+            self.stop_reason = 'target reached'
+        elif self.wait >= self.patience:
+            self.stop_reason = 'loss plateaued'
+        elif time.perf_counter() - self.start_time > self.time_budget:
+            self.stop_reason = 'time budget exhausted'
+        else:
+            return False
+        self.stopped_epoch = epoch
+        return True
+
+    def summary(self) -> str:
+        '''
+        Describe why and when training stopped.
+
+        Returns:
+            str: A one-line summary.
+        '''
+        elapsed = time.perf_counter() - self.start_time
+        if self.stop_reason is None:
+            return f'Ran all epochs in {elapsed:.2f}s, best loss {self.best_loss:.4f} at epoch {self.best_epoch + 1}'
+        return (f'Stopped at epoch {self.stopped_epoch + 1} ({self.stop_reason}) after {elapsed:.2f}s, '
+                f'best loss {self.best_loss:.4f} at epoch {self.best_epoch + 1}')
+
+    def keras_callback(self):
+        '''
+        Wrap the monitor in a Keras callback for model.fit. Imports TensorFlow.
+
+        Returns:
+            Callback: A callback that stops training and restores the best weights.
+        '''
+        from tensorflow.keras.callbacks import Callback  # type: ignore
+        monitor = self
+
+        class ConvergenceCallback(Callback):
+            def on_train_begin(self, logs=None):
+                monitor.start()
+
+            def on_epoch_end(self, epoch, logs=None):
+                logs = logs or {}
+                if monitor.update(epoch, logs['loss'], logs.get('accuracy', 0.0), self.model.get_weights):
+                    self.model.stop_training = True
+
+            def on_train_end(self, logs=None):
+                if monitor.restore_best_weights and monitor.best_weights is not None:
+                    self.model.set_weights(monitor.best_weights)
+
+        return ConvergenceCallback()
\ No newline at end of file
@@ -0,0 +1,128 @@
+'''
+Script: decision_table.py
+Description: Implements a precomputed lookup table of the classifier's decisions over the integer
+             (HP, Aggression) grid, so in-game inference becomes an array lookup.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import numpy as np
+from scripts.numpy_model import Predictions
+
+HP_MAX = 150  # Highest player/base HP including armor
+AGGRESSION_MAX = 100  # Highest aggression a species can reach
+GRID_TOLERANCE = 1e-6  # How far a scaled input may be from an integer and still hit the table
+
+
+class DecisionTable:
+    '''
+    Stores the label and probabilities of a trained model for every integer (HP, Aggression) pair.
+    Inputs that are off the grid or out of range are passed to the wrapped model instead.
+    '''
+
+    def __init__(self, model, hp_max: int = HP_MAX, aggression_max: int = AGGRESSION_MAX) -> None:
+        '''
+        Initialize the DecisionTable by evaluating the model once over the whole grid.
+
+        Args:
+            model: Any model with a predict method (Sequential or NumpyModel).
+            hp_max (int): The highest HP value stored in the table. Defaults to HP_MAX.
+            aggression_max (int): The highest aggression value stored in the table. Defaults to AGGRESSION_MAX.
+        '''
+        self.model = model
+        self.hp_max = hp_max
+        self.aggression_max = aggression_max
+
+        hp, aggression = np.meshgrid(np.arange(hp_max + 1), np.arange(aggression_max + 1), indexing='ij')
+        grid = np.stack([hp.ravel(), aggression.ravel()], axis=1) / 100.0
+        probabilities = np.asarray(model.predict(grid, verbose=0), dtype=np.float32)
+
+        # Flat float32 rows, so a lookup is one take with no conversion; the 2-D views index by (HP, Aggression)
+        self._flat_labels = np.argmax(probabilities, axis=1).astype(np.int8)
+        self._flat_probabilities = np.ascontiguousarray(probabilities)
+        shape = (hp_max + 1, aggression_max + 1)
+        self.labels = self._flat_labels.reshape(shape)
+        self.probabilities = self._flat_probabilities.reshape(shape + (probabilities.shape[1],))
+
+    def _flat_index(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray | None]:
+        '''
+        Map scaled inputs to positions in the flattened table.
+        The whole batch is checked with a few reductions first, so the usual all-on-grid batch skips the row mask.
+
+        Args:
+            rows (np.ndarray): Input rows of (HP, Aggression), already divided by 100, shape (rows, 2).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray | None]: Table positions, and None if every row is on the grid, otherwise
+            a mask of the rows on the grid. Positions of rows off the grid are 0.
+        '''
+        scaled = rows * 100.0
+        rounded = np.rint(scaled)
+        if (np.abs(scaled - rounded).max() <= GRID_TOLERANCE and rounded.min() >= 0
+                and rounded[:, 0].max() <= self.hp_max and rounded[:, 1].max() <= self.aggression_max):
+            on_grid = None
+        else:
+            on_grid = (
+                np.all(np.abs(scaled - rounded) <= GRID_TOLERANCE, axis=1)
+                & (rounded[:, 0] >= 0) & (rounded[:, 0] <= self.hp_max)
+                & (rounded[:, 1] >= 0) & (rounded[:, 1] <= self.aggression_max)
+            )
+            rounded[~on_grid] = 0
+        index = rounded.astype(np.intp)
+        return index[:, 0] * (self.aggression_max + 1) + index[:, 1], on_grid
+
+    def classify(self, test_data: np.ndarray) -> Predictions:
+        '''
+        Look up probabilities and labels with one index computation, passing rows off the grid to the model once.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            Predictions: The probability matrix and an int8 array of ActionLabel values.
+        '''
+        rows = np.asarray(test_data, dtype=np.float64).reshape(-1, 2)
+        index, on_grid = self._flat_index(rows)
+        probabilities = self._flat_probabilities.take(index, axis=0)
+        labels = self._flat_labels.take(index)
+        if on_grid is not None:
+            off_grid = ~on_grid
+            fallback = np.asarray(self.model.predict(rows[off_grid], verbose=0), dtype=np.float32)
+            probabilities[off_grid] = fallback
+            labels[off_grid] = np.argmax(fallback, axis=1)
+        return Predictions(probabilities, labels)
+
+    def predict(self, test_data: np.ndarray, verbose: int = 0) -> np.ndarray:
+        '''
+        Return class probabilities, looked up from the table where possible.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+            verbose (int): Accepted for compatibility with Sequential.predict. Ignored.
+
+        Returns:
+            np.ndarray: Probabilities with one row per input.
+        '''
+        return self.classify(test_data).probabilities
+
+    def predict_labels(self, test_data: np.ndarray) -> np.ndarray:
+        '''
+        Return the predicted class index for each input row.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            np.ndarray: Class indices into the action list.
+        '''
+        return self.classify(test_data).labels
+
+    def get_weights(self) -> list[np.ndarray]:
+        '''
+        Return the weights of the wrapped model.
+
+        Returns:
+            list[np.ndarray]: The weights in Keras order, stacked per member for ensembles.
+        '''
+        return self.model.get_weights()
@@ -0,0 +1,335 @@
+'''
+Script: distill.py
+Description: Distills the trained classifier into a small decision tree. The tree is fitted to the model's own
+             decisions over the (HP, Aggression) grid and compiled into a plain Python function, so decisions
+             need no ML libraries at all.
+             Run from the project folder with: python -m scripts.distill
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import numpy as np
+from scripts.numpy_model import Predictions
+from scripts.decision_table import HP_MAX, AGGRESSION_MAX
+
+# Constants
+MAX_DEPTH = 12  # Deepest split allowed in the tree
+MIN_AGREEMENT = 0.995  # Share of decisions the tree must reproduce, on and off the grid, to replace the model
+SCALAR_ROWS = 64  # Batches up to this size use the compiled policy instead of array operations
+FEATURE_NAMES = ('hp', 'aggression')  # Argument names of the compiled policy
+HOLDOUT_POINTS = 20_000  # Random off-grid inputs the tree's held-out agreement is measured on
+
+
+class TreePolicy:
+    '''
+    A decision tree with the same predict API as the neural network models.
+    The tree is stored in flat arrays for batched predictions and compiled to nested ifs for single decisions.
+    '''
+
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, left: np.ndarray, right: np.ndarray,
+                 labels: np.ndarray, probabilities: np.ndarray, model=None) -> None:
+        '''
+        Initialize the TreePolicy from its flattened nodes. Node 0 is the root.
+
+        Args:
+            feature (np.ndarray): The input column each node splits on, -1 for leaves.
+            threshold (np.ndarray): Rows with a value at or below the threshold go left.
+            left (np.ndarray): The left child of each node.
+            right (np.ndarray): The right child of each node.
+            labels (np.ndarray): The class index of each leaf.
+            probabilities (np.ndarray): The model's mean probabilities over each leaf's inputs.
+            model: The model the tree was distilled from. Defaults to None.
+        '''
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.labels = labels
+        self.probabilities = probabilities
+        self.model = model
+        self.agreement = None  # Share of grid decisions reproduced, set by distill
+        self.holdout_agreement = None  # Share of decisions reproduced between grid points, set by distill
+        self.depth = self._depth(0)
+        self.source = self._to_source()
+        namespace = {}
+        exec(compile(self.source, '<distilled policy>', 'exec'), namespace)
+        exec(compile(self._to_source(leaves=True), '<distilled policy leaves>', 'exec'), namespace)
+        self.decide = namespace['policy']
+        self.leaf = namespace['leaf']
+
+    @property
+    def leaves(self) -> int:
+        '''Return the number of leaves.'''
+        return int(np.sum(self.feature < 0))
+
+    def _depth(self, node: int) -> int:
+        '''Return the depth of the subtree below a node.'''
+        if self.feature[node] < 0:
+            return 0
+        return 1 + max(self._depth(self.left[node]), self._depth(self.right[node]))
+
+    def _to_source(self, leaves: bool = False) -> str:
+        '''
+        Generate the tree as the source of a Python function policy(hp, aggression) returning a class index.
+
+        Args:
+            leaves (bool): Generate leaf(hp, aggression) returning the leaf's node index instead. Defaults to False.
+
+        Returns:
+            str: The function source.
+        '''
+        lines = [f'def {"leaf" if leaves else "policy"}({", ".join(FEATURE_NAMES)}):']
+
+        def emit(node: int, indent: str) -> None:
+            if self.feature[node] < 0:
+                lines.append(f'{indent}return {node if leaves else int(self.labels[node])}')
+                return
+            lines.append(f'{indent}if {FEATURE_NAMES[self.feature[node]]} <= {float(self.threshold[node])!r}:')
+            emit(self.left[node], indent + '    ')
+            lines.append(f'{indent}else:')
+            emit(self.right[node], indent + '    ')
+
+        emit(0, '    ')
+        return '\n'.join(lines) + '\n'
+
+    def _leaf_index(self, test_data: np.ndarray) -> np.ndarray:
+        '''
+        Walk every row down the tree at once.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            np.ndarray: The leaf reached by each row.
+        '''
+        rows = np.asarray(test_data, dtype=np.float64).reshape(-1, len(FEATURE_NAMES))
+        index = np.arange(len(rows))
+        node = np.zeros(len(rows), dtype=np.intp)
+        for _ in range(self.depth):
+            feature = self.feature[node]
+            inner = feature >= 0
+            go_left = rows[index, np.maximum(feature, 0)] <= self.threshold[node]
+            node = np.where(inner, np.where(go_left, self.left[node], self.right[node]), node)
+        return node
+
+    def leaves_of(self, test_data: np.ndarray) -> np.ndarray:
+        '''
+        Return the leaf each row falls into, with the compiled policy for small batches.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            np.ndarray: Node indices of the leaves.
+        '''
+        rows = np.asarray(test_data, dtype=np.float64).reshape(-1, len(FEATURE_NAMES))
+        if len(rows) <= SCALAR_ROWS:
+            leaf = self.leaf
+            return np.array([leaf(hp, aggression) for hp, aggression in rows.tolist()], dtype=np.intp)
+        return self._leaf_index(rows)
+
+    def classify(self, test_data: np.ndarray) -> Predictions:
+        '''
+        Return the probabilities and labels of a batch, walking the tree once per row.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            Predictions: The leaf probabilities and labels.
+        '''
+        leaves = self.leaves_of(test_data)
+        return Predictions(self.probabilities[leaves], self.labels[leaves])
+
+    def predict(self, test_data: np.ndarray, verbose: int = 0) -> np.ndarray:
+        '''
+        Return the class probabilities of the leaf each row falls into.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+            verbose (int): Ignored, accepted for Keras compatibility.
+
+        Returns:
+            np.ndarray: Probabilities of shape (rows, classes).
+        '''
+        return self.probabilities[self.leaves_of(test_data)]
+
+    def predict_labels(self, test_data: np.ndarray) -> np.ndarray:
+        '''
+        Return the predicted class index for each input row.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            np.ndarray: Class indices into the action list.
+        '''
+        return self.labels[self.leaves_of(test_data)]
+
+    def get_weights(self) -> list[np.ndarray]:
+        '''
+        Return the weights of the model the tree was distilled from.
+
+        Returns:
+            list[np.ndarray]: The weights in Keras order, stacked per member for ensembles.
+        '''
+        return self.model.get_weights()
+
+
+def _best_split(inputs: np.ndarray, labels: np.ndarray, classes: int) -> tuple[float, int, float] | None:
+    '''
+    Find the split with the lowest weighted Gini impurity.
+
+    Args:
+        inputs (np.ndarray): The inputs reaching the node.
+        labels (np.ndarray): The model's decision for each input.
+        classes (int): Number of classes.
+
+    Returns:
+        tuple[float, int, float] | None: The impurity, feature and threshold, or None if no split is possible.
+    '''
+    count = len(labels)
+    best = None
+    for feature in range(inputs.shape[1]):
+        order = np.argsort(inputs[:, feature], kind='stable')
+        values = inputs[order, feature]
+        splits = np.nonzero(values[:-1] < values[1:])[0]  # Split between equal values is impossible
+        if splits.size == 0:
+            continue
+
+        left_counts = np.cumsum(np.eye(classes)[labels[order]], axis=0)[splits]
+        right_counts = np.bincount(labels, minlength=classes) - left_counts
+        left_size = (splits + 1)[:, None]
+        right_size = count - left_size
+        impurity = (left_size[:, 0] * (1 - np.sum((left_counts / left_size) ** 2, axis=1))
+                    + right_size[:, 0] * (1 - np.sum((right_counts / right_size) ** 2, axis=1))) / count
+
+        i = int(np.argmin(impurity))
+        if best is None or impurity[i] < best[0]:
+            best = (float(impurity[i]), feature, float((values[splits[i]] + values[splits[i] + 1]) / 2))
+    return best
+
+
+def fit_tree(inputs: np.ndarray, labels: np.ndarray, probabilities: np.ndarray, max_depth: int = MAX_DEPTH,
+             model=None) -> TreePolicy:
+    '''
+    Fit a CART decision tree to a model's decisions. Sibling leaves with the same class are merged.
+
+    Args:
+        inputs (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+        labels (np.ndarray): The model's decision for each row.
+        probabilities (np.ndarray): The model's probabilities for each row.
+        max_depth (int): Deepest split allowed. Defaults to MAX_DEPTH.
+        model: The model being distilled, kept for get_weights. Defaults to None.
+
+    Returns:
+        TreePolicy: The fitted tree.
+    '''
+    classes = probabilities.shape[1]
+    feature, threshold, left, right, leaf_labels, leaf_probabilities = [], [], [], [], [], []
+
+    def add_node() -> int:
+        for column in (feature, threshold, left, right, leaf_labels):
+            column.append(-1)
+        leaf_probabilities.append(np.zeros(classes, dtype=np.float32))
+        return len(feature) - 1
+
+    def make_leaf(node: int, rows: np.ndarray) -> None:
+        feature[node] = -1
+        leaf_labels[node] = int(np.argmax(np.bincount(labels[rows], minlength=classes)))
+        leaf_probabilities[node] = probabilities[rows].mean(axis=0)
+
+    def build(node: int, rows: np.ndarray, depth: int) -> None:
+        split = None
+        if depth < max_depth and np.any(labels[rows] != labels[rows[0]]):
+            split = _best_split(inputs[rows], labels[rows], classes)
+        if split is None:
+            make_leaf(node, rows)
+            return
+
+        _, feature[node], threshold[node] = split
+        goes_left = inputs[rows, feature[node]] <= threshold[node]
+        left[node], right[node] = add_node(), add_node()
+        build(left[node], rows[goes_left], depth + 1)
+        build(right[node], rows[~goes_left], depth + 1)
+
+        # A split whose leaves agree changes nothing, so collapse it
+        children = (left[node], right[node])
+        if all(feature[c] < 0 for c in children) and leaf_labels[children[0]] == leaf_labels[children[1]]:
+            make_leaf(node, rows)
+
+    build(add_node(), np.arange(len(labels)), 0)
+
+    # Drop nodes orphaned by merging and renumber the rest
+    keep, order = {}, [0]
+    while order:
+        node = order.pop(0)
+        keep[node] = len(keep)
+        if feature[node] >= 0:
+            order.extend((left[node], right[node]))
+    nodes = list(keep)
+    return TreePolicy(
+        feature=np.array([feature[n] for n in nodes], dtype=np.int8),
+        threshold=np.array([threshold[n] for n in nodes], dtype=np.float64),
+        left=np.array([keep.get(left[n], -1) for n in nodes], dtype=np.intp),
+        right=np.array([keep.get(right[n], -1) for n in nodes], dtype=np.intp),
+        labels=np.array([leaf_labels[n] for n in nodes], dtype=np.int8),
+        probabilities=np.array([leaf_probabilities[n] for n in nodes], dtype=np.float32),
+        model=model,
+    )
+
+
+def distill(model, hp_max: int = HP_MAX, aggression_max: int = AGGRESSION_MAX,
+            max_depth: int = MAX_DEPTH) -> TreePolicy:
+    '''
+    Distill a model into a decision tree over the whole (HP, Aggression) grid and measure their agreement,
+    both on the grid and on held-out random points between grid points.
+
+    Args:
+        model: Any model with a predict method (Sequential, NumpyModel or DecisionTable).
+        hp_max (int): The highest HP value on the grid. Defaults to HP_MAX.
+        aggression_max (int): The highest aggression value on the grid. Defaults to AGGRESSION_MAX.
+        max_depth (int): Deepest split allowed. Defaults to MAX_DEPTH.
+
+    Returns:
+        TreePolicy: The tree, with its grid agreement in .agreement and held-out agreement in .holdout_agreement.
+    '''
+    rng = np.random.default_rng(0)  # Fixed, so the held-out agreement is the same on every run
+    hp, aggression = np.meshgrid(np.arange(hp_max + 1), np.arange(aggression_max + 1), indexing='ij')
+    grid = np.stack([hp.ravel(), aggression.ravel()], axis=1) / 100.0
+    probabilities = np.asarray(model.predict(grid, verbose=0), dtype=np.float32)
+    labels = np.argmax(probabilities, axis=1)
+
+    policy = fit_tree(grid, labels, probabilities, max_depth, model)
+    policy.agreement = float(np.mean(policy.labels[policy._leaf_index(grid)] == labels))
+    held_out = rng.uniform((0, 0), (hp_max, aggression_max), size=(HOLDOUT_POINTS, 2)) / 100.0
+    held_out_labels = np.argmax(model.predict(held_out, verbose=0), axis=1)
+    policy.holdout_agreement = float(np.mean(policy.labels[policy._leaf_index(held_out)] == held_out_labels))
+    return policy
+
+
+def main() -> None:
+    '''
+    Distill the trained model, then print the agreement, the tree size, timings and the compiled policy.
+    '''
+    import timeit
+    from scripts.neuralnetwork import load_or_train
+
+    model = load_or_train()
+    policy = distill(model)
+    print(f'Grid agreement: {policy.agreement:.4f}, held-out agreement: {policy.holdout_agreement:.4f} '
+          f'with {policy.leaves} leaves, depth {policy.depth}')
+
+    row = np.array([[0.5, 0.15]])
+    runs = 10_000
+    model_time = timeit.timeit(lambda: model.predict(row), number=runs) / runs
+    policy_time = timeit.timeit(lambda: policy.decide(0.5, 0.15), number=runs) / runs
+    classify_time = timeit.timeit(lambda: policy.classify(row), number=runs) / runs
+    print(f'Single decision: model {model_time * 1e6:.1f} us, tree classify {classify_time * 1e6:.1f} us, '
+          f'compiled policy {policy_time * 1e9:.0f} ns')
+    print(f'\n{policy.source}')
+
+
+if __name__ == '__main__':
+    main()
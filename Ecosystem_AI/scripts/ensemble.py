@@ -0,0 +1,200 @@
+'''
+Script: ensemble.py
+Description: Implements an ensemble of action classifiers trained from different seeds in parallel processes.
+             Member weights are stacked into 3-D arrays so every member runs in the same batched matrix
+             multiplications, returning averaged probabilities and how much the members disagree.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from scripts.numpy_trainer import train_numpy
+from scripts.convergence import ConvergenceMonitor
+
+
+class EnsembleModel:
+    '''
+    K classifiers with the same architecture, evaluated together.
+    Exposes the same predict API as NumpyModel, returning the mean of the members' probabilities.
+    '''
+
+    def __init__(self, members: list[list[np.ndarray]]) -> None:
+        '''
+        Initialize the EnsembleModel by stacking the members' weights.
+
+        Args:
+            members (list[list[np.ndarray]]): Each member's weights in Keras get_weights() order.
+        '''
+        if not members:
+            raise ValueError('An ensemble needs at least one member.')
+        self.kernels = [np.stack([np.asarray(m[i], dtype=np.float32) for m in members])
+                        for i in range(0, len(members[0]), 2)]  # (K, inputs, units)
+        self.biases = [np.stack([np.asarray(m[i], dtype=np.float32) for m in members])[:, np.newaxis, :]
+                       for i in range(1, len(members[0]), 2)]  # (K, 1, units), broadcast over rows
+
+    @classmethod
+    def from_stacked(cls, weights: list[np.ndarray]) -> 'EnsembleModel':
+        '''
+        Rebuild an ensemble from the arrays returned by stacked_weights().
+
+        Args:
+            weights (list[np.ndarray]): Alternating (K, inputs, units) kernels and (K, units) biases.
+
+        Returns:
+            EnsembleModel: The ensemble.
+        '''
+        return cls(member_weights(weights))
+
+    @property
+    def size(self) -> int:
+        '''Return the number of members.'''
+        return self.kernels[0].shape[0]
+
+    def stacked_weights(self) -> list[np.ndarray]:
+        '''
+        Return all members' weights as stacked arrays, e.g. for the model cache.
+
+        Returns:
+            list[np.ndarray]: Alternating (K, inputs, units) kernels and (K, units) biases.
+        '''
+        weights = []
+        for kernel, bias in zip(self.kernels, self.biases):
+            weights.extend([kernel, bias[:, 0, :]])
+        return weights
+
+    def get_weights(self) -> list[np.ndarray]:
+        '''
+        Return all members' weights as stacked arrays. There is no single set of weights for an ensemble;
+        use member_weights() to split them.
+
+        Returns:
+            list[np.ndarray]: Alternating (K, inputs, units) kernels and (K, units) biases.
+        '''
+        return self.stacked_weights()
+
+    def member_probabilities(self, test_data: np.ndarray) -> np.ndarray:
+        '''
+        Run every member's forward pass at once.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            np.ndarray: Softmax probabilities of shape (members, rows, classes).
+        '''
+        x = np.asarray(test_data, dtype=np.float32)
+        if x.ndim == 1:
+            x = x[np.newaxis, :]
+
+        # Equivalent to einsum('kni,kio->kno'), but matmul batches over members with BLAS
+        x = np.matmul(x, self.kernels[0]) + self.biases[0]  # Rows broadcast to every member
+        for kernel, bias in zip(self.kernels[1:], self.biases[1:]):
+            np.maximum(x, 0.0, out=x)  # ReLU on hidden layers
+            x = np.matmul(x, kernel) + bias
+        x -= x.max(axis=2, keepdims=True)  # Softmax on the output layer
+        np.exp(x, out=x)
+        x /= x.sum(axis=2, keepdims=True)
+        return x
+
+    def predict_with_disagreement(self, test_data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Return the averaged probabilities and the share of members that disagree with the ensemble's choice.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Mean probabilities of shape (rows, classes), and a disagreement
+            score per row from 0 (unanimous) up to (K - 1) / K.
+        '''
+        members = self.member_probabilities(test_data)
+        probabilities = members.mean(axis=0)
+        choice = np.argmax(probabilities, axis=1)
+        disagreement = np.mean(np.argmax(members, axis=2) != choice, axis=0)
+        return probabilities, disagreement
+
+    def predict(self, test_data: np.ndarray, verbose: int = 0) -> np.ndarray:
+        '''
+        Return the members' mean probabilities.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+            verbose (int): Accepted for compatibility with Sequential.predict. Ignored.
+
+        Returns:
+            np.ndarray: Mean softmax probabilities with one row per input.
+        '''
+        return self.member_probabilities(test_data).mean(axis=0)
+
+    def predict_labels(self, test_data: np.ndarray) -> np.ndarray:
+        '''
+        Return the ensemble's class index for each input row.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            np.ndarray: Class indices into ACTIONS.
+        '''
+        return np.argmax(self.predict(test_data), axis=1)
+
+
+def member_weights(weights: list[np.ndarray]) -> list[list[np.ndarray]]:
+    '''
+    Split weights into one list per member. Single-network weights are one member.
+
+    Args:
+        weights (list[np.ndarray]): Stacked ensemble weights or a single network's weights, in Keras order.
+
+    Returns:
+        list[list[np.ndarray]]: Each member's weights.
+    '''
+    if weights[0].ndim != 3:
+        return [list(weights)]
+    return [[w[k] for w in weights] for k in range(weights[0].shape[0])]
+
+
+def _train_member(training_data: np.ndarray, labels: np.ndarray, hidden_layers: tuple, epochs: int,
+                  learning_rate: float, seed: int, early_stopping: bool) -> list[np.ndarray]:
+    '''
+    Train one member with the NumPy trainer. Runs inside a worker process.
+
+    Returns:
+        list[np.ndarray]: The member's weights.
+    '''
+    monitor = ConvergenceMonitor() if early_stopping else None
+    return train_numpy(training_data, labels, hidden_layers, epochs, learning_rate, seed=seed, monitor=monitor)
+
+
+def train_ensemble(training_data: np.ndarray, labels: np.ndarray, hidden_layers: tuple, epochs: int,
+                   learning_rate: float, size: int, early_stopping: bool = True,
+                   workers: int | None = None) -> EnsembleModel:
+    '''
+    Train an ensemble, one seed per member, across a process pool.
+
+    Args:
+        training_data (np.ndarray): Input rows, already divided by 100.
+        labels (np.ndarray): One-hot labels.
+        hidden_layers (tuple): Neurons in each hidden layer.
+        epochs (int): Maximum training epochs per member.
+        learning_rate (float): The Adam learning rate.
+        size (int): Number of members. The game's setting is neuralnetwork.ENSEMBLE_SIZE.
+        early_stopping (bool): Stop each member once converged. Defaults to True.
+        workers (int | None): Number of processes. Defaults to one per member, up to the CPU count.
+
+    Returns:
+        EnsembleModel: The trained ensemble.
+    '''
+    workers = workers or min(size, os.cpu_count() or 1)
+    # Spawn rather than fork: training is started from the GUI's worker thread, and forking a threaded
+    # process can copy locks held by other threads into the children
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [executor.submit(_train_member, training_data, labels, hidden_layers, epochs, learning_rate,
+                                   seed, early_stopping) for seed in range(size)]
+        members = [future.result() for future in futures]
+    return EnsembleModel(members)
@@ -17,7 +17,12 @@ from scenes.base import BaseScreen
 from scenes.gui_screen import GuiScreen
 from scenes.training_screens import TrainingScreen, TrainedScreen
 from scripts.house import House  # Import the House class
-from scripts.neuralnetwork import train_neural, AI_test
+from scripts.neuralnetwork import train_neural, AI_test, build_inference_model
+from scripts.inference_service import InferenceService
+from scripts.model_registry import ModelRegistry
+from scripts.gui_dispatch import GuiDispatcher
+from scripts.numpy_model import ActionLabel
+from scripts.online_learning import ReplayBuffer, OnlineTrainer, ONLINE_LEARNING
 
 
 class App:
@@ -37,6 +42,19 @@ class App:
         # Create a House instance
         self.base = House()
 
+        # Worker threads hand results to the Tkinter thread through this queue, never by calling Tkinter
+        self.dispatcher = GuiDispatcher(self.root)
+
+        # Versioned model slot, empty until training completes (bypass mode keeps it empty)
+        self.model_registry = ModelRegistry(self.dispatcher)
+
+        # Background inference so hunts never block the event loop
+        self.inference_service = InferenceService(self.dispatcher, self.model_registry.get)
+
+        # Fine-tune the model in the background from what happens during play (off unless ONLINE_LEARNING)
+        self.online_trainer = (OnlineTrainer(ReplayBuffer(), self.model_registry, build_inference_model)
+                               if ONLINE_LEARNING else None)
+
         # Initialize all frames (screens)
         # Designed to mimic video game scene logic
         self.frames = {}
@@ -97,6 +115,28 @@ class App:
             player_data = self.get_player_data()
             frame.update_data(ecosystem_data, player_data)
 
+    @property
+    def trained_model(self) -> object:
+        '''Return the current model from the registry, or None if there is none yet.'''
+        return self.model_registry.get()
+
+    @trained_model.setter
+    def trained_model(self, model) -> None:
+        '''Publish a model as the new current version.'''
+        self.model_registry.publish(model)
+
+    def record_encounter(self, game_data, predicted: ActionLabel, outcome: int) -> None:
+        '''
+        Record the predicted and observed behavior of a species for online fine-tuning, if it is on.
+
+        Args:
+            game_data (np.ndarray): The model input row of (HP, Aggression), divided by 100.
+            predicted (ActionLabel): The action the model predicted.
+            outcome (int): The class index observed in the encounter, e.g. from encounter_outcome.
+        '''
+        if self.online_trainer is not None:
+            self.online_trainer.record(game_data, int(predicted), outcome)
+
     def get_player_data(self) -> str:
         '''
         Fetch player data from the existing Player instance.
@@ -210,4 +250,4 @@ if __name__ == '__main__':
     app = App(root)
 
     # Run the Tkinter main loop
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
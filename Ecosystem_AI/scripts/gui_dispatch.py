@@ -0,0 +1,68 @@
+'''
+Script: gui_dispatch.py
+Description: Implements the hand-off of results from worker threads to the Tkinter thread. Tkinter may only be
+             called from the thread running mainloop, so workers post callbacks to a queue and the Tkinter
+             thread drains it on a timer.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import queue
+from typing import Callable
+
+# Constants
+POLL_INTERVAL_MS = 10  # How often the Tkinter thread runs posted callbacks
+
+
+class GuiDispatcher:
+    '''
+    Runs callbacks posted from any thread on the Tkinter thread.
+    post() only touches a thread-safe queue; the queue is drained by an after() timer started on the Tkinter thread.
+    '''
+
+    def __init__(self, root, interval_ms: int = POLL_INTERVAL_MS) -> None:
+        '''
+        Initialize the GuiDispatcher and start polling. Must be called on the Tkinter thread.
+
+        Args:
+            root: The Tkinter root whose event loop runs the callbacks.
+            interval_ms (int): Milliseconds between polls. Defaults to POLL_INTERVAL_MS.
+        '''
+        self.root = root
+        self.interval_ms = interval_ms
+        self.callbacks = queue.SimpleQueue()
+        self.job = self.root.after(self.interval_ms, self._poll)
+
+    def post(self, callback: Callable, *args) -> None:
+        '''
+        Queue a callback to run on the Tkinter thread. Safe to call from any thread.
+
+        Args:
+            callback (Callable): The function to call.
+            *args: Its arguments.
+        '''
+        self.callbacks.put((callback, args))
+
+    def _poll(self) -> None:
+        '''
+        Run every queued callback, then schedule the next poll. Runs on the Tkinter thread.
+        '''
+        while True:
+            try:
+                callback, args = self.callbacks.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as error:  # Report like any other Tkinter callback and keep polling
+                self.root.report_callback_exception(type(error), error, error.__traceback__)
+        self.job = self.root.after(self.interval_ms, self._poll)
+
+    def stop(self) -> None:
+        '''
+        Stop polling. Callbacks still queued are not run.
+        '''
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
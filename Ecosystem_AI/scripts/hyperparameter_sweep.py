@@ -0,0 +1,168 @@
+'''
+Script: hyperparameter_sweep.py
+Description: Implements a parallel hyperparameter sweep for the action classifier. Trains a grid of layer widths,
+             learning rates and epoch counts across a process pool and ranks them by test accuracy and cost.
+             Run from the project folder with: python -m scripts.hyperparameter_sweep
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from scripts.neuralnetwork import TRAINING_DATA, TRAINING_LABELS, TEST_DATA, TEST_LABELS, build_keras_model
+from scripts.numpy_model import NumpyModel
+from scripts.numpy_trainer import train_numpy
+
+# Sweep grid
+LAYER_WIDTHS = [(4,), (8,), (8, 4), (16, 8), (32, 16)]
+LEARNING_RATES = [0.001, 0.01, 0.1]
+EPOCH_COUNTS = [50, 100, 200]
+REPEATS = 3  # Seeds trained per configuration, results are averaged
+LATENCY_REPEATS = 200  # Single-row predictions timed per configuration
+MIN_ACCURACY = 0.8  # Test accuracy needed to be recommended. Some main() test rows disagree with the training data
+
+
+def run_trial(hidden_layers: tuple, learning_rate: float, epochs: int, backend: str = 'numpy',
+              repeats: int = REPEATS) -> dict:
+    '''
+    Train one configuration several times and measure it. Runs inside a worker process.
+
+    Args:
+        hidden_layers (tuple): Neurons in each hidden layer.
+        learning_rate (float): The Adam learning rate.
+        epochs (int): Number of training epochs.
+        backend (str): 'numpy' or 'keras'. Defaults to 'numpy'.
+        repeats (int): Number of seeds to train. Defaults to REPEATS.
+
+    Returns:
+        dict: The configuration with mean test accuracy, training time, inference latency and parameter count.
+    '''
+    accuracies, train_times, latencies = [], [], []
+    for seed in range(repeats):
+        if backend == 'keras':
+            from tensorflow.keras.utils import set_random_seed  # type: ignore
+            set_random_seed(seed)  # Seeds Python, NumPy and TensorFlow in this worker, like train_numpy's seed
+        start = time.perf_counter()
+        if backend == 'keras':
+            model = build_keras_model(hidden_layers=hidden_layers, learning_rate=learning_rate)
+            model.fit(TRAINING_DATA, TRAINING_LABELS, epochs=epochs, verbose=0)
+            weights = model.get_weights()
+        else:
+            weights = train_numpy(TRAINING_DATA, TRAINING_LABELS, hidden_layers, epochs, learning_rate, seed=seed)
+        train_times.append(time.perf_counter() - start)
+
+        # Accuracy and latency are measured on the NumPy model the game uses for inference
+        model = NumpyModel(weights)
+        accuracies.append(float(np.mean(model.predict_labels(TEST_DATA) == TEST_LABELS)))
+        row = TEST_DATA[:1]
+        start = time.perf_counter()
+        for _ in range(LATENCY_REPEATS):
+            model.predict(row)
+        latencies.append((time.perf_counter() - start) / LATENCY_REPEATS)
+
+    return {
+        'hidden_layers': hidden_layers,
+        'learning_rate': learning_rate,
+        'epochs': epochs,
+        'accuracy': float(np.mean(accuracies)),
+        'accuracy_min': float(np.min(accuracies)),
+        'train_seconds': float(np.mean(train_times)),
+        'latency_us': float(np.median(latencies)) * 1e6,
+        'parameters': int(sum(np.asarray(w).size for w in weights)),
+    }
+
+
+def run_sweep(layer_widths: list = LAYER_WIDTHS, learning_rates: list = LEARNING_RATES,
+              epoch_counts: list = EPOCH_COUNTS, backend: str = 'numpy', workers: int | None = None) -> list[dict]:
+    '''
+    Train every configuration in the grid across a process pool.
+
+    Args:
+        layer_widths (list): Hidden layer sizes to try. Defaults to LAYER_WIDTHS.
+        learning_rates (list): Learning rates to try. Defaults to LEARNING_RATES.
+        epoch_counts (list): Epoch counts to try. Defaults to EPOCH_COUNTS.
+        backend (str): 'numpy' or 'keras'. Defaults to 'numpy'.
+        workers (int | None): Number of processes. Defaults to all CPU cores.
+
+    Returns:
+        list[dict]: One result per configuration, ranked best first.
+    '''
+    grid = list(itertools.product(layer_widths, learning_rates, epoch_counts))
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [executor.submit(run_trial, layers, rate, epochs, backend) for layers, rate, epochs in grid]
+        results = [future.result() for future in futures]
+    return rank_results(results)
+
+
+def rank_results(results: list[dict]) -> list[dict]:
+    '''
+    Sort results by accuracy, then by the cheapest model to run and train.
+
+    Args:
+        results (list[dict]): Sweep results.
+
+    Returns:
+        list[dict]: The results, best first.
+    '''
+    return sorted(results, key=lambda r: (-r['accuracy'], -r['accuracy_min'], r['parameters'],
+                                          r['train_seconds']))
+
+
+def cheapest_model(results: list[dict], min_accuracy: float = MIN_ACCURACY) -> dict | None:
+    '''
+    Pick the configuration with the fewest parameters that meets the accuracy target on every seed.
+
+    Args:
+        results (list[dict]): Sweep results.
+        min_accuracy (float): Required test accuracy. Defaults to MIN_ACCURACY.
+
+    Returns:
+        dict | None: The cheapest qualifying configuration, or None if none qualify.
+    '''
+    qualifying = [r for r in results if r['accuracy_min'] >= min_accuracy]
+    if not qualifying:
+        return None
+    return min(qualifying, key=lambda r: (r['parameters'], r['epochs'], r['train_seconds']))
+
+
+def format_report(results: list[dict]) -> str:
+    '''
+    Format ranked results as a text table.
+
+    Args:
+        results (list[dict]): Ranked sweep results.
+
+    Returns:
+        str: The report.
+    '''
+    lines = [f'{"rank":>4} {"layers":<10} {"lr":>6} {"epochs":>6} {"acc":>6} {"min acc":>7} '
+             f'{"train ms":>9} {"latency us":>10} {"params":>6}']
+    for rank, r in enumerate(results, start=1):
+        layers = '-'.join(str(units) for units in r['hidden_layers'])
+        lines.append(f'{rank:>4} {layers:<10} {r["learning_rate"]:>6g} {r["epochs"]:>6} {r["accuracy"]:>6.2f} '
+                     f'{r["accuracy_min"]:>7.2f} {r["train_seconds"] * 1000:>9.1f} {r["latency_us"]:>10.1f} '
+                     f'{r["parameters"]:>6}')
+    return '\n'.join(lines)
+
+
+def main() -> None:
+    '''
+    Run the default sweep and print the ranked report and the recommended configuration.
+    '''
+    results = run_sweep()
+    print(format_report(results))
+
+    best = cheapest_model(results)
+    if best is None:
+        print(f'\nNo configuration reached {MIN_ACCURACY:.0%} test accuracy on every seed.')
+    else:
+        print(f'\nCheapest configuration with at least {MIN_ACCURACY:.0%} test accuracy: '
+              f'layers {best["hidden_layers"]}, learning rate {best["learning_rate"]}, {best["epochs"]} epochs.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+'''
+Script: inference_service.py
+Description: Implements a background inference service for the GUI. Requests are queued, coalesced into
+             micro-batches on a worker thread and answered on the GUI thread through a GuiDispatcher.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable
+import numpy as np
+from scripts.neuralnetwork import AI_classify
+from scripts.numpy_model import ActionLabel
+
+# Constants
+BATCH_WINDOW = 0.005  # Seconds to wait for more requests after the first one in a batch
+MAX_BATCH_SIZE = 64  # Largest number of requests classified in one model call
+LATENCY_WINDOW = 1000  # Number of recent request latencies kept for percentiles
+
+
+class InferenceService:
+    '''
+    Runs model inference on a worker thread so the Tkinter event loop never blocks.
+    Callbacks receive the predicted ActionLabel and probability row, or (None, None) if no model is loaded.
+    '''
+
+    def __init__(self, dispatcher, get_model: Callable[[], object], batch_window: float = BATCH_WINDOW,
+                 max_batch_size: int = MAX_BATCH_SIZE) -> None:
+        '''
+        Initialize the InferenceService and start its worker thread.
+
+        Args:
+            dispatcher: The GuiDispatcher that delivers results on the GUI thread.
+            get_model (Callable[[], object]): Returns the model to use for each batch, e.g. ModelRegistry.get,
+                so a newly published model is used from the next batch on.
+            batch_window (float): Seconds to wait for more requests to join a batch. Defaults to BATCH_WINDOW.
+            max_batch_size (int): Largest batch sent to the model. Defaults to MAX_BATCH_SIZE.
+        '''
+        self.dispatcher = dispatcher
+        self.get_model = get_model
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.requests = queue.Queue()
+
+        # Counters, guarded by the lock since stats() is read from the GUI thread
+        self.lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def submit(self, game_data: np.ndarray, callback: Callable[[ActionLabel | None, np.ndarray | None], None]) -> None:
+        '''
+        Queue one input row for classification.
+
+        Args:
+            game_data (np.ndarray): One row of (HP, Aggression), already divided by 100.
+            callback (Callable): Called on the GUI thread with the ActionLabel and probability row.
+        '''
+        with self.lock:
+            self.submitted += 1
+        self.requests.put((np.asarray(game_data, dtype=np.float32).reshape(-1), callback, time.perf_counter()))
+
+    def stop(self) -> None:
+        '''
+        Stop the worker thread once the queued requests are answered.
+        '''
+        self.requests.put(None)
+
+    def _run(self) -> None:
+        '''
+        Worker loop: wait for a request, gather more until the batch window closes, then classify them together.
+        '''
+        while True:
+            first = self.requests.get()
+            if first is None:
+                return
+            batch = [first]
+            stopping = False
+            deadline = time.perf_counter() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self.requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+            self._process(batch)
+            if stopping:
+                return
+
+    def _process(self, batch: list[tuple]) -> None:
+        '''
+        Classify a batch and schedule each callback on the GUI thread.
+
+        Args:
+            batch (list[tuple]): Queued (row, callback, submit time) requests.
+        '''
+        results = [(None, None)] * len(batch)
+        model = self.get_model()
+        if model is not None:
+            try:
+                probabilities, labels = AI_classify(model, np.stack([row for row, _, _ in batch]))
+                results = [(ActionLabel(label), probabilities[i]) for i, label in enumerate(labels.tolist())]
+            except Exception as error:  # Keep the worker alive; callers treat None as no result
+                print(f'Inference failed: {error}')
+
+        finished = time.perf_counter()
+        with self.lock:
+            self.batches += 1
+            self.completed += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+            self.latencies.extend(finished - submitted for _, _, submitted in batch)
+
+        for (_, callback, _), (action, probability) in zip(batch, results):
+            self.dispatcher.post(callback, action, probability)
+
+    def stats(self) -> dict:
+        '''
+        Return the service counters.
+
+        Returns:
+            dict: Queue depth, request and batch counts, batch sizes and latency percentiles in milliseconds.
+        '''
+        with self.lock:
+            latencies = np.array(self.latencies) * 1000.0
+            stats = {
+                'queue_depth': self.requests.qsize(),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'batches': self.batches,
+                'mean_batch_size': self.completed / self.batches if self.batches else 0.0,
+                'largest_batch': self.largest_batch,
+            }
+        for percentile in (50, 95, 99):
+            stats[f'latency_p{percentile}_ms'] = float(np.percentile(latencies, percentile)) if latencies.size else 0.0
+        return stats
@@ -0,0 +1,199 @@
+'''
+Script: metrics.py
+Description: Implements pluggable metrics sinks for classifier training. Sinks receive per-epoch loss and
+             accuracy from either training backend; weights are only fetched by sinks that ask for them.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import csv
+import datetime
+from typing import Callable
+import numpy as np
+
+# Constants
+LOG_ROOT = 'logs/fit/'  # TensorBoard log folder, relative to the project folder
+HISTOGRAM_STRIDE = 10  # Epochs between TensorBoard weight histograms, 0 to disable
+CSV_FLUSH_EVERY = 50  # Rows buffered before the CSV sink writes to disk
+
+
+class MetricsSink:
+    '''
+    Base class for training metrics sinks. Does nothing, so it also serves as the no-op sink.
+    '''
+
+    def log_epoch(self, epoch: int, logs: dict, get_weights: Callable[[], list[np.ndarray]]) -> None:
+        '''
+        Record the metrics of one epoch.
+
+        Args:
+            epoch (int): The zero-based epoch number.
+            logs (dict): Metric values such as 'loss' and 'accuracy'.
+            get_weights (Callable[[], list[np.ndarray]]): Returns the current weights. Only call it when needed.
+        '''
+
+    def close(self) -> None:
+        '''
+        Flush buffered metrics and release any files.
+        '''
+
+
+class NullSink(MetricsSink):
+    '''
+    A sink that discards everything.
+    '''
+
+
+class MemorySink(MetricsSink):
+    '''
+    Buffers metrics in memory, one list per metric.
+    '''
+
+    def __init__(self) -> None:
+        '''
+        Initialize the MemorySink with an empty history.
+        '''
+        self.epochs = []
+        self.history = {}
+
+    def log_epoch(self, epoch: int, logs: dict, get_weights: Callable[[], list[np.ndarray]]) -> None:
+        '''
+        Append the epoch's metrics to the history.
+        '''
+        self.epochs.append(epoch)
+        for name, value in logs.items():
+            self.history.setdefault(name, []).append(float(value))
+
+    def as_arrays(self) -> dict[str, np.ndarray]:
+        '''
+        Return the history as NumPy arrays.
+
+        Returns:
+            dict[str, np.ndarray]: One array per metric, plus 'epoch'.
+        '''
+        arrays = {name: np.array(values) for name, values in self.history.items()}
+        arrays['epoch'] = np.array(self.epochs)
+        return arrays
+
+
+class CSVSink(MetricsSink):
+    '''
+    Writes metrics to a CSV file, buffering rows to keep file writes off the training loop.
+    '''
+
+    def __init__(self, path: str, flush_every: int = CSV_FLUSH_EVERY) -> None:
+        '''
+        Initialize the CSVSink.
+
+        Args:
+            path (str): The CSV file to write.
+            flush_every (int): Rows buffered between writes. Defaults to CSV_FLUSH_EVERY.
+        '''
+        self.path = path
+        self.flush_every = flush_every
+        self.rows = []
+        self.fieldnames = None
+
+    def log_epoch(self, epoch: int, logs: dict, get_weights: Callable[[], list[np.ndarray]]) -> None:
+        '''
+        Buffer the epoch's metrics, writing them out every flush_every rows.
+        '''
+        self.rows.append({'epoch': epoch, **{name: float(value) for name, value in logs.items()}})
+        if len(self.rows) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        '''
+        Write buffered rows to the file.
+        '''
+        if not self.rows:
+            return
+        first_write = self.fieldnames is None
+        if first_write:
+            self.fieldnames = list(self.rows[0].keys())
+        with open(self.path, 'w' if first_write else 'a', newline='') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=self.fieldnames, extrasaction='ignore')
+            if first_write:
+                writer.writeheader()
+            writer.writerows(self.rows)
+        self.rows = []
+
+    def close(self) -> None:
+        '''
+        Write any remaining rows.
+        '''
+        self.flush()
+
+
+class TensorBoardSink(MetricsSink):
+    '''
+    Writes scalars every epoch and weight histograms every stride epochs to TensorBoard. Imports TensorFlow when created.
+    '''
+
+    def __init__(self, log_dir: str | None = None, stride: int = HISTOGRAM_STRIDE) -> None:
+        '''
+        Initialize the TensorBoardSink.
+
+        Args:
+            log_dir (str | None): Where to write the logs. Defaults to a timestamped folder under LOG_ROOT.
+            stride (int): Epochs between weight histograms, 0 to disable them. Defaults to HISTOGRAM_STRIDE.
+        '''
+        import tensorflow as tf  # Imported here so the other sinks work without TensorFlow
+        self.log_dir = log_dir or LOG_ROOT + datetime.datetime.now().strftime('%Y%m%d-%H%M%S')
+        self.stride = stride
+        self.summary = tf.summary
+        self.writer = self.summary.create_file_writer(self.log_dir + '/train')
+
+    def log_epoch(self, epoch: int, logs: dict, get_weights: Callable[[], list[np.ndarray]]) -> None:
+        '''
+        Write the epoch's scalars, and the weight histograms on stride epochs.
+        '''
+        with self.writer.as_default(step=epoch):
+            for name, value in logs.items():
+                self.summary.scalar(f'epoch_{name}', value)
+            if self.stride and epoch % self.stride == 0:
+                for i, weight in enumerate(get_weights()):
+                    self.summary.histogram(f'dense_{i // 2}/{"kernel" if i % 2 == 0 else "bias"}', weight)
+
+    def close(self) -> None:
+        '''
+        Flush and close the log writer.
+        '''
+        if self.writer is not None:
+            self.writer.flush()
+            self.writer.close()
+            self.writer = None
+
+
+def log_epoch(sinks: list[MetricsSink], epoch: int, logs: dict, get_weights: Callable[[], list[np.ndarray]]) -> None:
+    '''
+    Send one epoch's metrics to every sink.
+
+    Args:
+        sinks (list[MetricsSink]): The sinks to notify.
+        epoch (int): The zero-based epoch number.
+        logs (dict): Metric values such as 'loss' and 'accuracy'.
+        get_weights (Callable[[], list[np.ndarray]]): Returns the current weights.
+    '''
+    for sink in sinks:
+        sink.log_epoch(epoch, logs, get_weights)
+
+
+def keras_callback(sinks: list[MetricsSink]):
+    '''
+    Wrap metrics sinks in a Keras callback for model.fit. Imports TensorFlow.
+
+    Args:
+        sinks (list[MetricsSink]): The sinks to notify each epoch.
+
+    Returns:
+        Callback: A callback forwarding epoch logs to the sinks.
+    '''
+    from tensorflow.keras.callbacks import Callback  # type: ignore
+
+    class MetricsCallback(Callback):
+        def on_epoch_end(self, epoch, logs=None):
+            log_epoch(sinks, epoch, logs or {}, self.model.get_weights)
+
+    return MetricsCallback()
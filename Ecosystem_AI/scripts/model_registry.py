@@ -0,0 +1,106 @@
+'''
+Script: model_registry.py
+Description: Implements a versioned, thread-safe slot for the model used in game. New models are published
+             atomically, readers take a (version, model) snapshot that stays valid for as long as they use it,
+             and training runs in the background while the GUI stays responsive.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import threading
+from typing import Callable
+
+
+class ModelRegistry:
+    '''
+    Holds the current model and its version number. Version 0 means no model has been published.
+    Readers such as the inference service fetch the current model on every use, so a publish takes effect
+    at their next call without notifying them.
+    '''
+
+    def __init__(self, dispatcher=None) -> None:
+        '''
+        Initialize an empty ModelRegistry.
+
+        Args:
+            dispatcher: The GuiDispatcher used to run retrain_async's on_done on the GUI thread. Without one,
+                on_done is called on the training thread. Defaults to None.
+        '''
+        self.dispatcher = dispatcher
+        self.lock = threading.Lock()
+        self.version = 0
+        self.model = None
+        self.retraining = threading.Lock()
+
+    def current(self) -> tuple[int, object]:
+        '''
+        Return a consistent snapshot of the current version and model.
+
+        Returns:
+            tuple[int, object]: The version and the model, which is None before the first publish.
+        '''
+        with self.lock:
+            return self.version, self.model
+
+    def get(self) -> object:
+        '''
+        Return the current model, or None before the first publish.
+        '''
+        return self.current()[1]
+
+    def publish(self, model, expected_version: int | None = None) -> int | None:
+        '''
+        Make a model the current one. Calls already using the previous model finish with it.
+
+        Args:
+            model: The model to publish.
+            expected_version (int | None): Only publish if this is still the current version, so an update
+                derived from an older model cannot overwrite a newer one. Defaults to None (always publish).
+
+        Returns:
+            int | None: The new version, or None if expected_version was out of date.
+        '''
+        with self.lock:
+            if expected_version is not None and expected_version != self.version:
+                return None
+            self.version += 1
+            self.model = model
+            return self.version
+
+    def _notify(self, callback: Callable, *args) -> None:
+        '''Call a callback on the GUI thread if there is a dispatcher, otherwise directly.'''
+        if self.dispatcher is not None:
+            self.dispatcher.post(callback, *args)
+        else:
+            callback(*args)
+
+    def retrain_async(self, train: Callable[[], object],
+                      on_done: Callable[[int | None], None] | None = None) -> bool:
+        '''
+        Build a new model on a background thread and publish it when ready.
+
+        Args:
+            train (Callable[[], object]): Trains and returns the new model.
+            on_done (Callable[[int | None], None] | None): Called on the GUI thread with the new version,
+                or None if training failed. Defaults to None.
+
+        Returns:
+            bool: True if retraining started, False if a retrain is already running.
+        '''
+        if not self.retraining.acquire(blocking=False):
+            return False
+
+        def run() -> None:
+            version = None
+            try:
+                version = self.publish(train())
+            except Exception as error:
+                print(f'Retraining failed: {error}')
+            finally:
+                self.retraining.release()
+                if on_done is not None:
+                    self._notify(on_done, version)
+
+        threading.Thread(target=run, daemon=True).start()
+        return True
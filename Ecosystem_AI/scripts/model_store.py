@@ -0,0 +1,173 @@
+'''
+Script: model_store.py
+Description: Implements an on-disk cache of trained classifier weights, keyed by a fingerprint of the
+             training data, architecture and hyperparameters, with corruption checks and eviction.
+             Entries are weight_format files, so their CRC32 is checked on every load.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import hashlib
+import os
+from typing import Callable
+import numpy as np
+from scripts.numpy_model import NumpyModel
+from scripts.ensemble import EnsembleModel
+from scripts.weight_format import save_weights, load_weights, load_model
+
+# Constants
+MODEL_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'model_cache')
+MAX_CACHE_BYTES = 5 * 1024 * 1024  # Total size allowed for cached entries
+MAX_CACHE_ENTRIES = 16  # Number of cached models kept before the oldest are evicted
+CACHE_FORMAT_VERSION = 2  # Bump when the entry layout changes to invalidate old entries. 2: weight_format files
+ENTRY_SUFFIX = '.weights'
+LEGACY_SUFFIXES = ('.npz',)  # Entries of older cache versions, removed on eviction
+
+
+class ModelStore:
+    '''
+    Stores trained model weights on disk so unchanged training runs can be skipped.
+    Entries are validated with a checksum on load and evicted least-recently-used first.
+    '''
+
+    def __init__(self, directory: str = MODEL_CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES,
+                 max_entries: int = MAX_CACHE_ENTRIES) -> None:
+        '''
+        Initialize the ModelStore.
+
+        Args:
+            directory (str): The folder holding cached entries. Defaults to MODEL_CACHE_DIR.
+            max_bytes (int): The total size allowed for all entries. Defaults to MAX_CACHE_BYTES.
+            max_entries (int): The number of entries allowed. Defaults to MAX_CACHE_ENTRIES.
+        '''
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+    @staticmethod
+    def fingerprint(training_data: np.ndarray, labels: np.ndarray, architecture: tuple,
+                    hyperparameters: dict) -> str:
+        '''
+        Build a cache key from everything that determines the trained weights.
+
+        Args:
+            training_data (np.ndarray): The training inputs.
+            labels (np.ndarray): The training labels.
+            architecture (tuple): The layer sizes of the model, with their activations.
+            hyperparameters (dict): Training settings such as epochs, learning rate and optimizer.
+
+        Returns:
+            str: A hex digest identifying the training run.
+        '''
+        digest = hashlib.sha256()
+        digest.update(f'v{CACHE_FORMAT_VERSION}'.encode())
+        for array in (training_data, labels):
+            array = np.ascontiguousarray(array)
+            digest.update(f'{array.dtype.str}{array.shape}'.encode())
+            digest.update(array.tobytes())
+        digest.update(repr(tuple(architecture)).encode())
+        digest.update(repr(sorted(hyperparameters.items())).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        '''Return the file path for a cache key.'''
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def _read(self, key: str, reader: Callable[..., object]) -> object | None:
+        '''
+        Read an entry, discarding it if it is unreadable or fails its checksum.
+        Entries are read rather than memory-mapped, so they can still be replaced and evicted.
+
+        Args:
+            key (str): The cache key from fingerprint().
+            reader (Callable[..., object]): load_weights or load_model.
+
+        Returns:
+            object | None: The reader's result, or None on a miss.
+        '''
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            result = reader(path, mmap=False)
+        except (OSError, ValueError):
+            self._remove(path)
+            return None
+
+        os.utime(path)  # Mark as recently used for eviction
+        return result
+
+    def load(self, key: str) -> list[np.ndarray] | None:
+        '''
+        Load cached weights, discarding the entry if it is unreadable or fails its checksum.
+
+        Args:
+            key (str): The cache key from fingerprint().
+
+        Returns:
+            list[np.ndarray] | None: The weights, read-only, or None on a miss.
+        '''
+        return self._read(key, load_weights)
+
+    def load_model(self, key: str) -> NumpyModel | EnsembleModel | None:
+        '''
+        Load a cached model, discarding the entry if it is unreadable or fails its checksum.
+
+        Args:
+            key (str): The cache key from fingerprint().
+
+        Returns:
+            NumpyModel | EnsembleModel | None: The model, an ensemble for stacked weights, or None on a miss.
+        '''
+        return self._read(key, load_model)
+
+    def save(self, key: str, weights: list[np.ndarray]) -> None:
+        '''
+        Save weights under a cache key, then evict old entries if the store is over budget.
+
+        Args:
+            key (str): The cache key from fingerprint().
+            weights (list[np.ndarray]): The weights to store, stacked per member for ensembles.
+        '''
+        os.makedirs(self.directory, exist_ok=True)
+        save_weights(self._path(key), weights)  # Replaced atomically, so a crash never leaves a half-written entry
+        self.evict(keep=key)
+
+    def evict(self, keep: str | None = None) -> None:
+        '''
+        Remove the least recently used entries until the store is within its size and count limits.
+
+        Args:
+            keep (str | None): A cache key never to evict, e.g. the entry just saved, even if it alone
+                exceeds the limits. Defaults to None.
+        '''
+        if not os.path.isdir(self.directory):
+            return
+        entries = []
+        kept, kept_count, total_bytes = self._path(keep) if keep is not None else None, 0, 0
+        for name in os.listdir(self.directory):
+            if name.endswith(LEGACY_SUFFIXES):
+                self._remove(os.path.join(self.directory, name))
+            elif name.endswith(ENTRY_SUFFIX):
+                path = os.path.join(self.directory, name)
+                stat = os.stat(path)
+                total_bytes += stat.st_size
+                if path == kept:
+                    kept_count = 1  # Counts towards the limits but is never removed
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()  # Oldest first
+
+        while entries and (len(entries) + kept_count > self.max_entries or total_bytes > self.max_bytes):
+            _, size, path = entries.pop(0)
+            self._remove(path)
+            total_bytes -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        '''Delete a file, ignoring it if already gone.'''
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
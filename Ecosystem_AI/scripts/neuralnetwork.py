@@ -1,116 +1,328 @@
 '''
 Script: neuralnetwork.py
 Description: Implements a neural network using TensorFlow/Keras for training and testing AI actions.
+             TensorFlow is imported lazily so inference and GUI startup never pay for it.
 Author: Patrick Davis
 Date: April 5, 2025
 Version: 1.0
 '''
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 import numpy as np
-import tensorflow as tf
-from tensorflow.keras.models import Sequential  # type: ignore
-from tensorflow.keras.layers import Dense, Input  # type: ignore
-from tensorflow.keras.optimizers import Adam  # type: ignore
+from scripts.numpy_model import NumpyModel, Predictions, ACTIONS
+from scripts.decision_table import DecisionTable
+from scripts.distill import TreePolicy, distill, MIN_AGREEMENT
+from scripts.quantized import QuantizedModel, quantize
+from scripts.ensemble import EnsembleModel, train_ensemble
+from scripts.warmup import warm_up
+from scripts.cascade import CascadeModel
+from scripts.model_store import ModelStore
+from scripts.numpy_trainer import train_numpy, BETA_1, BETA_2, EPSILON
+from scripts.convergence import ConvergenceMonitor, PATIENCE, MIN_DELTA, TARGET_ACCURACY, TARGET_LOSS
+from scripts.metrics import MetricsSink, keras_callback
+
+if TYPE_CHECKING:
+    from tensorflow.keras.models import Sequential  # type: ignore
 
 # Constants
 INPUT_SHAPE = (2,)  # Input features: HP and Aggression
 OUTPUT_CLASSES = 3  # Output classes: Action, Warning, Nothing
-EPOCHS = 200  # Number of training epochs, can be changed to 50: not reccomended
+EPOCHS = 200  # Number of training epochs, can be changed to 50: not reccomended. Upper limit when EARLY_STOPPING is on
 LEARNING_RATE = 0.01  # Learning rate for the optimizer, do not set to 0.1: too high
+HIDDEN_LAYERS = (16, 8)  # Neurons in each hidden layer
+HIDDEN_ACTIVATION = 'relu'  # Activation of the hidden layers (the NumPy trainer and models only support ReLU)
+OUTPUT_ACTIVATION = 'softmax'  # Activation of the output layer (the NumPy trainer and models only support softmax)
+LOSS = 'categorical_crossentropy'  # Training loss
+TRAINING_BACKEND = 'keras'  # 'keras' trains with model.fit, 'numpy' trains with the plain NumPy Adam trainer
+EARLY_STOPPING = True  # Stop once the model converges instead of always running EPOCHS (see convergence.py)
+ENSEMBLE_SIZE = 1  # Models trained from different seeds and averaged, 1 for a single model
+USE_LOOKUP_TABLE = True  # Precompute decisions over the (HP, Aggression) grid after training
+USE_DISTILLED_POLICY = True  # Replace the network with a decision tree when it reproduces MIN_AGREEMENT of decisions
+USE_INT8 = False  # Run the network with int8 weights when it reproduces QUANT_MIN_AGREEMENT of decisions
+WARM_UP = True  # Run the inference model once when it is built, so the first hunt does not stall
+USE_CASCADE = False  # Let symbolic rules decide clear-cut inputs before a network runs (see cascade.py)
 
+# Training dataset (Input HP, Input Aggression)
+TRAINING_DATA = np.array([
+    [100, 0],  # Nothing (2)
+    [70, 0],  # Nothing (2)
+    [40, 0],  # Nothing (2)
+    [30, 0],  # Warning (1)
+    [50, 20],  # Warning (1)
+    [90, 50],  # Warning (1)
+    [100, 70],  # Action (0)
+    [60, 40],  # Action (0)
+    [20, 40],  # Action (0),
+]) / 100.0
 
-def train_neural() -> Sequential:
-    # Training dataset (Input HP, Input Aggression)
-    training_data = np.array([
-        [100, 0],  # Nothing (2)
-        [70, 0],  # Nothing (2)
-        [40, 0],  # Nothing (2)
-        [30, 0],  # Warning (1)
-        [50, 20],  # Warning (1)
-        [90, 50],  # Warning (1)
-        [100, 70],  # Action (0)
-        [60, 40],  # Action (0)
-        [20, 40],  # Action (0),
-    ]) / 100.0
-
-    # Labels for the training dataset
-    labels = np.array([
-        [0, 0, 1],  # Nothing (2)
-        [0, 0, 1],  # Nothing (2)
-        [0, 0, 1],  # Nothing (2)
-        [0, 1, 0],  # Warning (1)
-        [0, 1, 0],  # Warning (1)
-        [0, 1, 0],  # Warning (1)
-        [1, 0, 0],  # Action (0)
-        [1, 0, 0],  # Action (0)
-        [1, 0, 0],  # Action (0),
-    ])
+# Labels for the training dataset
+TRAINING_LABELS = np.array([
+    [0, 0, 1],  # Nothing (2)
+    [0, 0, 1],  # Nothing (2)
+    [0, 0, 1],  # Nothing (2)
+    [0, 1, 0],  # Warning (1)
+    [0, 1, 0],  # Warning (1)
+    [0, 1, 0],  # Warning (1)
+    [1, 0, 0],  # Action (0)
+    [1, 0, 0],  # Action (0)
+    [1, 0, 0],  # Action (0),
+])
+
+# Example test data (Input HP, Input Aggression)
+TEST_DATA = np.array([
+    [95, 80],  # Action  
+    [50, 15],  # Warning
+    [69, 22],  # Nothing
+    [100, 100],  # Action
+    [20, 30],  # Action  
+    [35, 5],  # Warning 
+    [80, 49],  # Warning
+    [100, 60],  # Nothing  
+    [42, 1],  # Nothing
+    [50, 9],  # Nothing
+]) / 100.0
+
+# Expected class index for each test row
+TEST_LABELS = np.array([0, 1, 2, 0, 0, 1, 1, 2, 2, 2])
+
+
+def build_keras_model(weights: list[np.ndarray] | None = None, hidden_layers: tuple = HIDDEN_LAYERS,
+                      learning_rate: float = LEARNING_RATE) -> Sequential:
+    '''
+    Build and compile the Keras classifier, optionally loading existing weights.
+
+    Args:
+        weights (list[np.ndarray] | None): Weights in get_weights() order, e.g. from the NumPy trainer. Defaults to None.
+        hidden_layers (tuple): Neurons in each hidden layer. Defaults to HIDDEN_LAYERS.
+        learning_rate (float): The Adam learning rate. Defaults to LEARNING_RATE.
+
+    Returns:
+        Sequential: The compiled model.
+    '''
+    # Import TensorFlow only when a Keras model is requested
+    from tensorflow.keras.models import Sequential  # type: ignore
+    from tensorflow.keras.layers import Dense, Input  # type: ignore
+    from tensorflow.keras.optimizers import Adam  # type: ignore
 
     # Define the model
     model = Sequential([
         Input(shape=INPUT_SHAPE),
-        Dense(16, activation='relu'),
-        Dense(8, activation='relu'),
-        Dense(OUTPUT_CLASSES, activation='softmax')
+        *[Dense(units, activation=HIDDEN_ACTIVATION) for units in hidden_layers],
+        Dense(OUTPUT_CLASSES, activation=OUTPUT_ACTIVATION)
     ])
 
     # Compile the model
-    model.compile(optimizer=Adam(learning_rate=LEARNING_RATE), 
-                  loss='categorical_crossentropy', 
+    model.compile(optimizer=Adam(learning_rate=learning_rate, beta_1=BETA_1, beta_2=BETA_2, epsilon=EPSILON),
+                  loss=LOSS,
                   metrics=['accuracy'])
 
-    # Train the model
-    model.fit(
-        training_data,
-        labels,
-        epochs=EPOCHS,
-        verbose=1,
-    )
+    if weights is not None:
+        model.set_weights(weights)
     return model
 
 
-def AI_test(data_model: Sequential, test_data: np.ndarray) -> list[tuple[np.ndarray, str]]:
+def train_neural(backend: str = TRAINING_BACKEND, early_stopping: bool = EARLY_STOPPING,
+                 sinks: list[MetricsSink] | None = None,
+                 ensemble_size: int = ENSEMBLE_SIZE) -> Sequential | NumpyModel | EnsembleModel:
+    '''
+    Train the action classifier on the built-in dataset.
+
+    Args:
+        backend (str): 'keras' to train with model.fit, or 'numpy' for the NumPy Adam trainer. Defaults to TRAINING_BACKEND.
+        early_stopping (bool): Stop once converged and keep the best weights. Defaults to EARLY_STOPPING.
+        sinks (list[MetricsSink] | None): Metrics sinks such as MemorySink or TensorBoardSink. Defaults to None (no-op).
+        ensemble_size (int): Models to train from different seeds. Above 1 the members are trained with the NumPy
+            trainer in parallel processes and sinks are not used. Defaults to ENSEMBLE_SIZE.
+
+    Returns:
+        Sequential | NumpyModel | EnsembleModel: The trained model. All expose get_weights() in Keras order,
+        stacked per member for ensembles.
+    '''
+    if backend not in ('keras', 'numpy'):
+        raise ValueError(f'Unknown training backend: {backend}')
+
+    training_data = TRAINING_DATA
+    labels = TRAINING_LABELS
+    if ensemble_size > 1:
+        for sink in sinks or []:
+            sink.close()
+        return train_ensemble(training_data, labels, HIDDEN_LAYERS, EPOCHS, LEARNING_RATE, ensemble_size,
+                              early_stopping)
+    monitor = ConvergenceMonitor() if early_stopping else None
+    sinks = sinks or []
+
+    try:
+        if backend == 'numpy':
+            weights = train_numpy(training_data, labels, HIDDEN_LAYERS, EPOCHS, LEARNING_RATE, verbose=1,
+                                  monitor=monitor, sinks=sinks)
+            model = NumpyModel(weights)
+        else:
+            model = build_keras_model()
+
+            # Sinks run before the monitor so the final epoch is always logged
+            callbacks = [keras_callback(sinks)] if sinks else []
+            if monitor is not None:
+                callbacks.append(monitor.keras_callback())
+
+            # Train the model
+            model.fit(
+                training_data,
+                labels,
+                epochs=EPOCHS,
+                verbose=1,
+                callbacks=callbacks,
+            )
+    finally:
+        for sink in sinks:
+            sink.close()
+
+    if monitor is not None:
+        print(monitor.summary())
+    return model
+
+
+def model_fingerprint() -> str:
+    '''
+    Build the cache key for the current dataset, architecture and hyperparameters.
+
+    Returns:
+        str: A hex digest identifying the training run.
+    '''
+    architecture = (INPUT_SHAPE[0], *[(units, HIDDEN_ACTIVATION) for units in HIDDEN_LAYERS],
+                    (OUTPUT_CLASSES, OUTPUT_ACTIVATION))
+    # Ensemble members are always trained with the NumPy trainer, whatever TRAINING_BACKEND says
+    backend = 'numpy' if ENSEMBLE_SIZE > 1 else TRAINING_BACKEND
+    hyperparameters = {'epochs': EPOCHS, 'learning_rate': LEARNING_RATE, 'backend': backend, 'loss': LOSS,
+                       'optimizer': ('adam', BETA_1, BETA_2, EPSILON)}
+    if ENSEMBLE_SIZE > 1:
+        hyperparameters['ensemble_size'] = ENSEMBLE_SIZE
+    if EARLY_STOPPING:
+        hyperparameters.update(patience=PATIENCE, min_delta=MIN_DELTA, target_accuracy=TARGET_ACCURACY,
+                               target_loss=TARGET_LOSS)
+    return ModelStore.fingerprint(TRAINING_DATA, TRAINING_LABELS, architecture, hyperparameters)
+
+
+def load_or_train(store: ModelStore | None = None) -> NumpyModel | EnsembleModel:
+    '''
+    Load the trained weights from the model cache, training and caching them on a miss.
+
+    Args:
+        store (ModelStore | None): The cache to use. Defaults to a ModelStore in the default folder.
+
+    Returns:
+        NumpyModel | EnsembleModel: The trained model, an ensemble when ENSEMBLE_SIZE is above 1.
+    '''
+    store = store if store is not None else ModelStore()
+    key = model_fingerprint()
+    model = store.load_model(key)
+    if model is None:
+        weights = train_neural().get_weights()
+        store.save(key, weights)
+        # Ensembles are cached as stacked 3-D kernels
+        model = EnsembleModel.from_stacked(weights) if weights[0].ndim == 3 else NumpyModel(weights)
+    return model
+
+
+def build_inference_model(model: Sequential | NumpyModel | EnsembleModel, lookup_table: bool = USE_LOOKUP_TABLE,
+                          distilled: bool = USE_DISTILLED_POLICY,
+                          int8: bool = USE_INT8,
+                          cascade: bool = USE_CASCADE) -> NumpyModel | DecisionTable | TreePolicy | QuantizedModel | CascadeModel:
+    '''
+    Convert a trained model into the form used for in-game inference.
+
+    Args:
+        model (Sequential | NumpyModel | EnsembleModel): The trained neural network model.
+        lookup_table (bool): Whether to precompute a DecisionTable over the input grid. Defaults to USE_LOOKUP_TABLE.
+        distilled (bool): Whether to try a distilled decision tree first. Defaults to USE_DISTILLED_POLICY.
+        int8 (bool): Whether to try an int8 quantized network next. Defaults to USE_INT8.
+        cascade (bool): Whether to put symbolic rules in front of a network result. Lookup tables and trees
+            already answer in constant time, so they are never wrapped. Defaults to USE_CASCADE.
+
+    Returns:
+        NumpyModel | DecisionTable | TreePolicy | QuantizedModel | CascadeModel: A TensorFlow-free model with
+        the same predict API.
+    '''
+    inference_model = model if isinstance(model, (NumpyModel, EnsembleModel)) else NumpyModel.from_keras(model)
+    if distilled:
+        policy = distill(inference_model)
+        if min(policy.agreement, policy.holdout_agreement) >= MIN_AGREEMENT:
+            inference_model = policy
+    if int8 and isinstance(inference_model, NumpyModel) and isinstance(quantized := quantize(inference_model),
+                                                                        QuantizedModel):
+        inference_model = quantized
+    if lookup_table and isinstance(inference_model, (NumpyModel, EnsembleModel)):
+        inference_model = DecisionTable(inference_model)
+    if cascade and isinstance(inference_model, (NumpyModel, EnsembleModel, QuantizedModel)):
+        inference_model = CascadeModel(inference_model)
+        inference_model.calibrate()
+    if WARM_UP:
+        warm_up(inference_model)
+        if isinstance(inference_model, CascadeModel):
+            inference_model.reset_stats()  # Count only real hunts
+    return inference_model
+
+
+def AI_classify(data_model: Sequential | NumpyModel | DecisionTable | TreePolicy, test_data: np.ndarray) -> Predictions:
+    '''
+    Classifies a batch of inputs in a single model call.
+
+    Args:
+        data_model (Sequential | NumpyModel | DecisionTable | TreePolicy): The trained neural network model.
+        test_data (np.ndarray): The input rows of (HP, Aggression), already divided by 100.
+
+    Returns:
+        Predictions: The probability matrix and an int8 array of ActionLabel values. Unpacks like a tuple.
+    '''
+    if hasattr(data_model, 'classify'):
+        return data_model.classify(test_data)
+
+    probabilities = np.asarray(data_model.predict(test_data, verbose=0))
+    if hasattr(data_model, 'predict_labels'):
+        choices = data_model.predict_labels(test_data)
+    else:
+        choices = np.argmax(probabilities, axis=1)
+    return Predictions(probabilities.astype(np.float32, copy=False), np.asarray(choices, dtype=np.int8))
+
+
+def AI_test(data_model: Sequential | NumpyModel, test_data: np.ndarray) -> list[tuple[np.ndarray, str]]:
     '''
     Tests the trained neural network model on test data.
+    Kept for printing and existing callers; batch code should use AI_classify.
 
     Args:
-        data_model (Sequential): The trained neural network model.
+        data_model (Sequential | NumpyModel): The trained neural network model.
         test_data: The test dataset.
 
     Returns:
         list[tuple[np.ndarray, str]]: A list of tuples containing input data and predicted actions.
     '''
-    # Predict the actions for the test data
-    AI_choices = data_model.predict(test_data)
+    # Predict the actions for the test data, using stored labels when the model provides them
+    if hasattr(data_model, 'predict_labels'):
+        AI_choices = data_model.predict_labels(test_data)
+    else:
+        AI_choices = np.argmax(data_model.predict(test_data), axis=1)
 
-    actions = ['Action', 'Warning', 'Nothing']
     results = []
-    for i, pred in enumerate(AI_choices):
-        results.append((test_data[i], actions[np.argmax(pred)]))
+    for i, choice in enumerate(AI_choices):
+        results.append((test_data[i], ACTIONS[choice]))
     return results
 
 
-def main() -> None:
+def main(sinks: list[MetricsSink] | None = None) -> None:
     '''
     Main function to train the neural network and test it on example data.
     Not called when ran from project.py.
+
+    Args:
+        sinks (list[MetricsSink] | None): Metrics sinks used during training. Defaults to None.
     '''
     # Train the neural network
-    trained_AI = train_neural()
+    trained_AI = train_neural(sinks=sinks)
 
     # Example test data (Input HP, Input Aggression)
-    test_data = np.array([
-        [95, 80],  # Action  
-        [50, 15],  # Warning
-        [69, 22],  # Nothing
-        [100, 100],  # Action
-        [20, 30],  # Action  
-        [35, 5],  # Warning 
-        [80, 49],  # Warning
-        [100, 60],  # Nothing  
-        [42, 1],  # Nothing
-        [50, 9],  # Nothing
-    ]) / 100.0
+    test_data = TEST_DATA
 
     # Test the AI
     results = AI_test(trained_AI, test_data)
@@ -122,4 +334,4 @@ def main() -> None:
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,126 @@
+'''
+Script: numpy_model.py
+Description: Implements a standalone NumPy forward pass for the trained action classifier.
+             Mirrors the Dense stack built by train_neural without importing TensorFlow.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+from enum import IntEnum
+from typing import NamedTuple
+import numpy as np
+
+ACTIONS = ['Action', 'Warning', 'Nothing']  # Output classes in label order, as shown to the player
+
+
+class ActionLabel(IntEnum):
+    '''
+    The classifier's output classes. Values match the label indices, so label arrays compare directly.
+    '''
+    ACTION = 0
+    WARNING = 1
+    NOTHING = 2
+
+    def __str__(self) -> str:
+        '''Return the display name, e.g. 'Action'.'''
+        return ACTIONS[self]
+
+
+class Predictions(NamedTuple):
+    '''
+    Batched classifier output: one probability row and one label per input row.
+    '''
+    probabilities: np.ndarray  # float32, shape (rows, classes)
+    labels: np.ndarray  # int8 ActionLabel values, shape (rows,)
+
+    def contains(self, label: ActionLabel) -> bool:
+        '''Return True if any row was given the label.'''
+        return bool(np.any(self.labels == label))
+
+    def select(self, rows: slice) -> 'Predictions':
+        '''Return the predictions for a slice of rows, without copying.'''
+        return Predictions(self.probabilities[rows], self.labels[rows])
+
+
+class NumpyModel:
+    '''
+    A NumPy copy of a trained Dense/ReLU/softmax classifier.
+    Exposes the same predict method as a Keras Sequential so it can be passed to AI_test.
+    '''
+
+    def __init__(self, weights: list[np.ndarray]) -> None:
+        '''
+        Initialize the NumpyModel from a flat list of layer weights.
+
+        Args:
+            weights (list[np.ndarray]): Alternating kernels and biases, as returned by Sequential.get_weights().
+        '''
+        if len(weights) % 2 != 0:
+            raise ValueError('Weights must alternate kernel and bias arrays.')
+        self.kernels = [np.ascontiguousarray(w, dtype=np.float32) for w in weights[0::2]]
+        self.biases = [np.ascontiguousarray(b, dtype=np.float32) for b in weights[1::2]]
+        for kernel, bias in zip(self.kernels, self.biases):
+            if kernel.ndim != 2 or bias.shape != (kernel.shape[1],):
+                raise ValueError(f'Layer shapes do not match: kernel {kernel.shape}, bias {bias.shape}.')
+
+    @classmethod
+    def from_keras(cls, model) -> 'NumpyModel':
+        '''
+        Export the weights of a trained Keras Sequential model.
+
+        Args:
+            model (Sequential): The trained neural network model.
+
+        Returns:
+            NumpyModel: A NumPy copy of the model.
+        '''
+        return cls(model.get_weights())
+
+    def get_weights(self) -> list[np.ndarray]:
+        '''
+        Return the weights in Keras get_weights() order.
+
+        Returns:
+            list[np.ndarray]: Alternating kernels and biases.
+        '''
+        weights = []
+        for kernel, bias in zip(self.kernels, self.biases):
+            weights.extend([kernel, bias])
+        return weights
+
+    def predict(self, test_data: np.ndarray, verbose: int = 0) -> np.ndarray:
+        '''
+        Run the forward pass on a batch of inputs.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+            verbose (int): Accepted for compatibility with Sequential.predict. Ignored.
+
+        Returns:
+            np.ndarray: Softmax probabilities with one row per input.
+        '''
+        x = np.asarray(test_data, dtype=np.float32)
+        if x.ndim == 1:
+            x = x[np.newaxis, :]
+        last = len(self.kernels) - 1
+        for i, (kernel, bias) in enumerate(zip(self.kernels, self.biases)):
+            x = x @ kernel + bias
+            if i < last:
+                np.maximum(x, 0.0, out=x)  # ReLU on hidden layers
+        x -= x.max(axis=1, keepdims=True)  # Softmax on the output layer
+        np.exp(x, out=x)
+        x /= x.sum(axis=1, keepdims=True)
+        return x
+
+    def predict_labels(self, test_data: np.ndarray) -> np.ndarray:
+        '''
+        Return the predicted class index for each input row.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            np.ndarray: Class indices into ACTIONS.
+        '''
+        return np.argmax(self.predict(test_data), axis=1)
\ No newline at end of file
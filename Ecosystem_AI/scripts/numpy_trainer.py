@@ -0,0 +1,202 @@
+'''
+Script: numpy_trainer.py
+Description: Implements a plain NumPy trainer for the action classifier. Trains the same Dense/ReLU/softmax
+             architecture as the Keras model with full-batch Adam, producing weights in Keras get_weights() order.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+from typing import Iterable
+import numpy as np
+from scripts.convergence import ConvergenceMonitor
+from scripts.metrics import MetricsSink, log_epoch
+
+# Adam defaults, matching tensorflow.keras.optimizers.Adam
+BETA_1 = 0.9
+BETA_2 = 0.999
+EPSILON = 1e-7
+
+
+def init_weights(layer_sizes: tuple, seed: int | None = None) -> list[np.ndarray]:
+    '''
+    Create Glorot-uniform kernels and zero biases, the same initialization Keras Dense layers use.
+
+    Args:
+        layer_sizes (tuple): Sizes of every layer, from inputs to outputs, e.g. (2, 16, 8, 3).
+        seed (int | None): Seed for the random generator. Defaults to None.
+
+    Returns:
+        list[np.ndarray]: Alternating kernels and biases.
+    '''
+    rng = np.random.default_rng(seed)
+    weights = []
+    for fan_in, fan_out in zip(layer_sizes[:-1], layer_sizes[1:]):
+        limit = np.sqrt(6.0 / (fan_in + fan_out))
+        weights.append(rng.uniform(-limit, limit, size=(fan_in, fan_out)).astype(np.float32))
+        weights.append(np.zeros(fan_out, dtype=np.float32))
+    return weights
+
+
+def forward(weights: list[np.ndarray], inputs: np.ndarray) -> list[np.ndarray]:
+    '''
+    Run the forward pass and keep every layer's output for backpropagation.
+
+    Args:
+        weights (list[np.ndarray]): Alternating kernels and biases.
+        inputs (np.ndarray): The input batch.
+
+    Returns:
+        list[np.ndarray]: The inputs followed by each layer's activations. The last entry is the softmax output.
+    '''
+    activations = [np.asarray(inputs, dtype=np.float32)]
+    last = len(weights) // 2 - 1
+    for i in range(0, len(weights), 2):
+        x = activations[-1] @ weights[i] + weights[i + 1]
+        if i // 2 < last:
+            x = np.maximum(x, 0.0)
+        else:
+            x = np.exp(x - x.max(axis=1, keepdims=True))
+            x /= x.sum(axis=1, keepdims=True)
+        activations.append(x)
+    return activations
+
+
+def loss_and_gradients(weights: list[np.ndarray], inputs: np.ndarray,
+                       labels: np.ndarray) -> tuple[float, float, list[np.ndarray]]:
+    '''
+    Compute the categorical cross-entropy loss, accuracy and weight gradients for a batch.
+
+    Args:
+        weights (list[np.ndarray]): Alternating kernels and biases.
+        inputs (np.ndarray): The input batch.
+        labels (np.ndarray): One-hot labels for the batch.
+
+    Returns:
+        tuple[float, float, list[np.ndarray]]: The mean loss, the accuracy and gradients in weight order.
+    '''
+    activations = forward(weights, inputs)
+    probabilities = activations[-1]
+    labels = np.asarray(labels, dtype=np.float32)
+    count = len(inputs)
+
+    loss = float(-np.sum(labels * np.log(np.clip(probabilities, EPSILON, 1.0))) / count)
+    accuracy = float(np.mean(np.argmax(probabilities, axis=1) == np.argmax(labels, axis=1)))
+
+    gradients = [None] * len(weights)
+    delta = (probabilities - labels) / count  # Softmax + cross-entropy gradient
+    for i in range(len(weights) - 2, -1, -2):
+        gradients[i] = activations[i // 2].T @ delta
+        gradients[i + 1] = delta.sum(axis=0)
+        if i > 0:
+            delta = (delta @ weights[i].T) * (activations[i // 2] > 0)
+    return loss, accuracy, gradients
+
+
+class AdamOptimizer:
+    '''
+    The Adam optimizer, updating a list of NumPy weight arrays in place.
+    '''
+
+    def __init__(self, weights: list[np.ndarray], learning_rate: float) -> None:
+        '''
+        Initialize the optimizer state for the given weights.
+
+        Args:
+            weights (list[np.ndarray]): The weights that will be updated.
+            learning_rate (float): The step size.
+        '''
+        self.learning_rate = learning_rate
+        self.iterations = 0
+        self.m = [np.zeros_like(w) for w in weights]
+        self.v = [np.zeros_like(w) for w in weights]
+
+    def step(self, weights: list[np.ndarray], gradients: list[np.ndarray]) -> None:
+        '''
+        Apply one Adam update.
+
+        Args:
+            weights (list[np.ndarray]): The weights to update in place.
+            gradients (list[np.ndarray]): Gradients in the same order as the weights.
+        '''
+        self.iterations += 1
+        step_size = self.learning_rate * np.sqrt(1 - BETA_2 ** self.iterations) / (1 - BETA_1 ** self.iterations)
+        for w, g, m, v in zip(weights, gradients, self.m, self.v):
+            m *= BETA_1
+            m += (1 - BETA_1) * g
+            v *= BETA_2
+            v += (1 - BETA_2) * g * g
+            w -= (step_size * m / (np.sqrt(v) + EPSILON)).astype(w.dtype)
+
+
+def train_numpy(training_data: np.ndarray, labels: np.ndarray, hidden_layers: tuple, epochs: int,
+                learning_rate: float, seed: int | None = None, verbose: int = 0,
+                monitor: ConvergenceMonitor | None = None, sinks: list[MetricsSink] | None = None) -> list[np.ndarray]:
+    '''
+    Train a Dense/ReLU/softmax classifier with full-batch Adam.
+
+    Args:
+        training_data (np.ndarray): The training inputs.
+        labels (np.ndarray): One-hot training labels.
+        hidden_layers (tuple): Neurons in each hidden layer.
+        epochs (int): Number of full-batch updates.
+        learning_rate (float): The Adam step size.
+        seed (int | None): Seed for weight initialization. Defaults to None.
+        verbose (int): Print loss and accuracy each epoch when set to 1. Defaults to 0.
+        monitor (ConvergenceMonitor | None): Stops training early once converged. Defaults to None.
+        sinks (list[MetricsSink] | None): Receive loss and accuracy each epoch. Defaults to None.
+
+    Returns:
+        list[np.ndarray]: The trained weights in Keras get_weights() order.
+    '''
+    layer_sizes = (training_data.shape[1], *hidden_layers, labels.shape[1])
+    weights = init_weights(layer_sizes, seed)
+    optimizer = AdamOptimizer(weights, learning_rate)
+
+    if monitor is not None:
+        monitor.start()
+
+    for epoch in range(epochs):
+        loss, accuracy, gradients = loss_and_gradients(weights, training_data, labels)
+        if verbose:
+            print(f'Epoch {epoch + 1}/{epochs} - accuracy: {accuracy:.4f} - loss: {loss:.4f}')
+        if sinks:
+            log_epoch(sinks, epoch, {'loss': loss, 'accuracy': accuracy}, lambda: weights)
+        # Check before stepping so the recorded loss matches the weights that get stored
+        if monitor is not None and monitor.update(epoch, loss, accuracy, lambda: weights):
+            break
+        optimizer.step(weights, gradients)
+
+    if monitor is not None and monitor.restore_best_weights and monitor.best_weights is not None:
+        weights = monitor.best_weights
+    return weights
+
+
+def train_numpy_stream(batches: Iterable[tuple[np.ndarray, np.ndarray]], hidden_layers: tuple, learning_rate: float,
+                       seed: int | None = None, sinks: list[MetricsSink] | None = None) -> list[np.ndarray]:
+    '''
+    Train a Dense/ReLU/softmax classifier with mini-batch Adam on a stream of batches.
+    Only one batch is held in memory at a time.
+
+    Args:
+        batches (Iterable[tuple[np.ndarray, np.ndarray]]): Yields (inputs, one-hot labels) batches.
+        hidden_layers (tuple): Neurons in each hidden layer.
+        learning_rate (float): The Adam step size.
+        seed (int | None): Seed for weight initialization. Defaults to None.
+        sinks (list[MetricsSink] | None): Receive loss and accuracy after each batch. Defaults to None.
+
+    Returns:
+        list[np.ndarray]: The trained weights in Keras get_weights() order.
+    '''
+    weights, optimizer = None, None
+    for step, (inputs, labels) in enumerate(batches):
+        if weights is None:
+            weights = init_weights((inputs.shape[1], *hidden_layers, labels.shape[1]), seed)
+            optimizer = AdamOptimizer(weights, learning_rate)
+        loss, accuracy, gradients = loss_and_gradients(weights, inputs, labels)
+        if sinks:
+            log_epoch(sinks, step, {'loss': loss, 'accuracy': accuracy}, lambda: weights)
+        optimizer.step(weights, gradients)
+    if weights is None:
+        raise ValueError('The batch stream was empty.')
+    return weights
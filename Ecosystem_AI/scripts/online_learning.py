@@ -0,0 +1,231 @@
+'''
+Script: online_learning.py
+Description: Implements online fine-tuning of the action classifier from gameplay. Encounters are recorded in a
+             fixed-size, array-backed replay buffer and the model is updated in small batches on a background thread.
+             Off by default (ONLINE_LEARNING): each update also rebuilds the inference model.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import threading
+from typing import Callable
+import numpy as np
+from scripts.numpy_model import NumpyModel, ActionLabel
+from scripts.ensemble import EnsembleModel, member_weights
+from scripts.model_registry import ModelRegistry
+from scripts.numpy_trainer import AdamOptimizer, loss_and_gradients
+
+# Constants
+ONLINE_LEARNING = False  # Fine-tune the game model from hunt outcomes during play
+REPLAY_CAPACITY = 4096  # Encounters kept before the oldest are overwritten
+FINE_TUNE_BATCH = 32  # Encounters per fine-tuning step
+FINE_TUNE_STEPS = 5  # Steps run each time fine-tuning is triggered
+FINE_TUNE_EVERY = 8  # New encounters recorded between fine-tuning runs
+FINE_TUNE_LEARNING_RATE = 0.001  # Kept below LEARNING_RATE so single encounters cannot undo training
+MIN_REPLAY_SIZE = 16  # Encounters needed before fine-tuning starts
+
+
+class ReplayBuffer:
+    '''
+    A ring buffer of (input, predicted action, observed outcome) records stored in preallocated arrays.
+    '''
+
+    def __init__(self, capacity: int = REPLAY_CAPACITY, features: int = 2) -> None:
+        '''
+        Initialize the ReplayBuffer.
+
+        Args:
+            capacity (int): Number of records kept. Defaults to REPLAY_CAPACITY.
+            features (int): Number of model inputs per record. Defaults to 2.
+        '''
+        self.capacity = capacity
+        self.inputs = np.zeros((capacity, features), dtype=np.float32)
+        self.predicted = np.zeros(capacity, dtype=np.int8)
+        self.outcomes = np.zeros(capacity, dtype=np.int8)
+        self.index = 0  # Next slot to write
+        self.size = 0
+        self.total_added = 0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        '''Return the number of records stored.'''
+        return self.size
+
+    def add(self, inputs: np.ndarray, predicted: int, outcome: int) -> None:
+        '''
+        Record one encounter, overwriting the oldest record when full.
+
+        Args:
+            inputs (np.ndarray): The model input row, already divided by 100.
+            predicted (int): The class index the model predicted.
+            outcome (int): The class index observed in the game.
+        '''
+        with self.lock:
+            self.inputs[self.index] = inputs
+            self.predicted[self.index] = predicted
+            self.outcomes[self.index] = outcome
+            self.index = (self.index + 1) % self.capacity
+            self.size = min(self.size + 1, self.capacity)
+            self.total_added += 1
+
+    def sample(self, batch_size: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Draw a random batch of records.
+
+        Args:
+            batch_size (int): Number of records to draw.
+            rng (np.random.Generator): The random generator.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Copies of the inputs and observed outcomes.
+        '''
+        with self.lock:
+            rows = rng.integers(0, self.size, size=min(batch_size, self.size))
+            return self.inputs[rows], self.outcomes[rows]
+
+    def disagreement(self) -> float:
+        '''
+        Return the share of stored records where the prediction differed from the outcome.
+
+        Returns:
+            float: A value between 0 and 1.
+        '''
+        with self.lock:
+            if self.size == 0:
+                return 0.0
+            return float(np.mean(self.predicted[:self.size] != self.outcomes[:self.size]))
+
+
+def encounter_outcome(health_lost: int, health_loss_ranges: tuple) -> int:
+    '''
+    Classify the HP a hunt actually cost the player into the behavior that costs that much.
+    Differs from the prediction when the player's HP ran out or neutral damage reached the warning amount.
+
+    Args:
+        health_lost (int): HP the player lost in the encounter.
+        health_loss_ranges (tuple): The hunt's HP losses for Action, Warning and the (min, max) of Nothing.
+
+    Returns:
+        int: The observed class index.
+    '''
+    if health_lost >= health_loss_ranges[0]:
+        return int(ActionLabel.ACTION)
+    if health_lost >= health_loss_ranges[1]:
+        return int(ActionLabel.WARNING)
+    return int(ActionLabel.NOTHING)
+
+
+class OnlineTrainer:
+    '''
+    Fine-tunes the current model on replayed encounters without restarting training.
+    Every member of an ensemble is fine-tuned. Runs on a background thread and publishes each updated
+    model to the registry.
+    '''
+
+    def __init__(self, buffer: ReplayBuffer, registry: ModelRegistry,
+                 prepare: Callable[[NumpyModel], object] = lambda model: model,
+                 learning_rate: float = FINE_TUNE_LEARNING_RATE,
+                 batch_size: int = FINE_TUNE_BATCH, steps: int = FINE_TUNE_STEPS, every: int = FINE_TUNE_EVERY,
+                 seed: int | None = None) -> None:
+        '''
+        Initialize the OnlineTrainer.
+
+        Args:
+            buffer (ReplayBuffer): The encounters to learn from.
+            registry (ModelRegistry): Holds the model in use. That model must provide get_weights().
+            prepare (Callable[[NumpyModel], object]): Converts each fine-tuned model into the form that is
+                published, e.g. build_inference_model. Defaults to publishing it unchanged.
+            learning_rate (float): The Adam step size. Defaults to FINE_TUNE_LEARNING_RATE.
+            batch_size (int): Encounters per step. Defaults to FINE_TUNE_BATCH.
+            steps (int): Steps per fine-tuning run. Defaults to FINE_TUNE_STEPS.
+            every (int): New encounters between runs. Defaults to FINE_TUNE_EVERY.
+            seed (int | None): Seed for batch sampling. Defaults to None.
+        '''
+        self.buffer = buffer
+        self.registry = registry
+        self.prepare = prepare
+        self.learning_rate = learning_rate
+        self.batch_size = batch_size
+        self.steps = steps
+        self.every = every
+        self.rng = np.random.default_rng(seed)
+        self.running = threading.Lock()
+        self.members = None  # Weights being fine-tuned, one list per ensemble member
+        self.optimizers = None
+        self.ensemble = False
+        self.source = None  # The live model the current weights came from or were published as
+        self.last_trained_at = 0
+        self.updates = 0
+        self.last_loss = None
+
+    def record(self, inputs: np.ndarray, predicted: int, outcome: int) -> None:
+        '''
+        Record an encounter and start a fine-tuning run in the background when enough new data has arrived.
+
+        Args:
+            inputs (np.ndarray): The model input row, already divided by 100.
+            predicted (int): The class index the model predicted.
+            outcome (int): The class index observed in the game.
+        '''
+        self.buffer.add(inputs, predicted, outcome)
+        if (len(self.buffer) >= MIN_REPLAY_SIZE
+                and self.buffer.total_added - self.last_trained_at >= self.every):
+            self.fine_tune_async()
+
+    def fine_tune_async(self) -> bool:
+        '''
+        Start a fine-tuning run on a background thread unless one is already running.
+
+        Returns:
+            bool: True if a run was started.
+        '''
+        if not self.running.acquire(blocking=False):
+            return False
+        self.last_trained_at = self.buffer.total_added
+        threading.Thread(target=self._run, daemon=True).start()
+        return True
+
+    def _run(self) -> None:
+        '''Run fine_tune and release the running flag.'''
+        try:
+            self.fine_tune()
+        finally:
+            self.running.release()
+
+    def fine_tune(self) -> None:
+        '''
+        Run a few mini-batch Adam steps on replayed encounters and publish the result.
+        '''
+        version, model = self.registry.current()
+        if model is None or len(self.buffer) == 0:
+            return
+
+        # Start from the live model if it was replaced (e.g. retrained) since the last run. Ensembles
+        # return stacked weights, which are split so each member keeps its own weights and optimizer
+        if model is not self.source:
+            weights = model.get_weights()
+            self.ensemble = weights[0].ndim == 3
+            self.members = [[np.array(w, dtype=np.float32, copy=True) for w in member]
+                            for member in member_weights(weights)]
+            self.optimizers = [AdamOptimizer(member, self.learning_rate) for member in self.members]
+
+        one_hot = np.eye(self.members[0][-1].shape[-1], dtype=np.float32)
+        for _ in range(self.steps):
+            inputs, outcomes = self.buffer.sample(self.batch_size, self.rng)
+            losses = []
+            for member, optimizer in zip(self.members, self.optimizers):
+                loss, _, gradients = loss_and_gradients(member, inputs, one_hot[outcomes])
+                optimizer.step(member, gradients)
+                losses.append(loss)
+            self.last_loss = float(np.mean(losses))
+
+        # Publish a copy so further steps never modify a model that is in use. If the model was replaced
+        # (e.g. retrained) while these steps ran, drop them and start from the new model next time
+        copies = [[w.copy() for w in member] for member in self.members]
+        prepared = self.prepare(EnsembleModel(copies) if self.ensemble else NumpyModel(copies[0]))
+        if self.registry.publish(prepared, expected_version=version) is None:
+            self.source = None
+            return
+        self.source = prepared
+        self.updates += 1
@@ -0,0 +1,209 @@
+'''
+Script: quantized.py
+Description: Implements int8 post-training quantization of the action classifier. Weights and activations
+             are stored as int8 with one scale per layer and multiplied with integer arithmetic. A quantized
+             model is only used when it reproduces the float model's decisions on a calibration grid.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import numpy as np
+from scripts.numpy_model import NumpyModel, Predictions
+from scripts.decision_table import HP_MAX, AGGRESSION_MAX
+
+# Constants
+INT8_MAX = 127  # Symmetric int8 range, -128 is left unused
+QUANT_MIN_AGREEMENT = 0.99  # Share of calibration decisions the int8 model must match to be used
+FLOAT32_EXACT = 2 ** 24  # Integers up to this magnitude are exact in float32
+
+
+def calibration_grid(hp_max: int = HP_MAX, aggression_max: int = AGGRESSION_MAX) -> np.ndarray:
+    '''
+    Build the calibration inputs: every integer (HP, Aggression) pair.
+
+    Args:
+        hp_max (int): The highest HP value. Defaults to HP_MAX.
+        aggression_max (int): The highest aggression value. Defaults to AGGRESSION_MAX.
+
+    Returns:
+        np.ndarray: Input rows, already divided by 100.
+    '''
+    hp, aggression = np.meshgrid(np.arange(hp_max + 1), np.arange(aggression_max + 1), indexing='ij')
+    return (np.stack([hp.ravel(), aggression.ravel()], axis=1) / 100.0).astype(np.float32)
+
+
+def _scale(values: np.ndarray) -> np.float32:
+    '''Return the symmetric int8 scale covering the largest magnitude in values.'''
+    largest = float(np.max(np.abs(values)))
+    return np.float32(largest / INT8_MAX if largest > 0 else 1.0)
+
+
+def _quantize(values: np.ndarray, scale: np.float32) -> np.ndarray:
+    '''Round values to int8 steps of scale, clipping to the symmetric range.'''
+    return np.clip(np.rint(values / scale), -INT8_MAX, INT8_MAX).astype(np.int8)
+
+
+def _softmax(x: np.ndarray) -> np.ndarray:
+    '''Turn a batch of logits into probabilities in place.'''
+    x -= x.max(axis=1, keepdims=True)
+    np.exp(x, out=x)
+    x /= x.sum(axis=1, keepdims=True)
+    return x
+
+
+class QuantizedModel:
+    '''
+    An int8 copy of a NumpyModel with the same predict API.
+    Each layer multiplies int8 activations by int8 weights with exact integer accumulation, then rescales once.
+    '''
+
+    def __init__(self, model: NumpyModel, calibration: np.ndarray) -> None:
+        '''
+        Quantize a model, choosing activation scales from the calibration inputs.
+
+        Args:
+            model (NumpyModel): The float model.
+            calibration (np.ndarray): Representative input rows, already divided by 100.
+        '''
+        self.weight_scales = [_scale(kernel) for kernel in model.kernels]
+        self.kernels = [_quantize(kernel, scale) for kernel, scale in zip(model.kernels, self.weight_scales)]
+
+        # Record the range of each layer's input on the calibration data
+        self.input_scales = []
+        x = np.asarray(calibration, dtype=np.float32)
+        last = len(model.kernels) - 1
+        for i, (kernel, bias) in enumerate(zip(model.kernels, model.biases)):
+            self.input_scales.append(_scale(x))
+            x = x @ kernel + bias
+            if i < last:
+                np.maximum(x, 0.0, out=x)
+
+        # Biases are added to the int32 accumulator, so they share its scale
+        self.biases = [np.rint(bias / (input_scale * weight_scale)).astype(np.int32)
+                       for bias, input_scale, weight_scale in zip(model.biases, self.input_scales, self.weight_scales)]
+        self.agreement = None
+        self._pack()
+
+    def _pack(self) -> None:
+        '''
+        Widen the int8 kernels and biases once for the forward pass, and fold each layer's rescale and the next
+        layer's quantization into one factor.
+        The products of int8 values are summed exactly in float32 while a layer's largest possible sum stays below
+        FLOAT32_EXACT, so the matrix products can use BLAS. Wider layers fall back to float64, which is exact far
+        beyond any int8 layer.
+        '''
+        self._kernels, self._biases = [], []
+        for kernel, bias in zip(self.kernels, self.biases):
+            exact = INT8_MAX * INT8_MAX * kernel.shape[0] + int(np.max(np.abs(bias))) < FLOAT32_EXACT
+            dtype = np.float32 if exact else np.float64
+            self._kernels.append(kernel.astype(dtype))
+            self._biases.append(bias.astype(dtype))
+        self._input_factor = np.float32(1.0) / self.input_scales[0]
+        # Hidden outputs go straight from the accumulator's scale to the next layer's int8 scale
+        self._requantize = [np.float32(input_scale * weight_scale / next_scale)
+                            for input_scale, weight_scale, next_scale
+                            in zip(self.input_scales, self.weight_scales, self.input_scales[1:])]
+        self._output_scale = np.float32(self.input_scales[-1] * self.weight_scales[-1])
+
+    def logits(self, test_data: np.ndarray) -> np.ndarray:
+        '''
+        Run the integer forward pass.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            np.ndarray: Output-layer logits as float32.
+        '''
+        x = np.asarray(test_data, dtype=np.float32)
+        if x.ndim == 1:
+            x = x[np.newaxis, :]
+        x = x * self._input_factor
+        for kernel, bias, factor in zip(self._kernels, self._biases, self._requantize):
+            np.rint(x, out=x)
+            np.clip(x, -INT8_MAX, INT8_MAX, out=x)
+            x = x @ kernel
+            x += bias
+            np.maximum(x, 0, out=x)  # ReLU directly on the integers
+            x *= factor
+        np.rint(x, out=x)
+        np.clip(x, -INT8_MAX, INT8_MAX, out=x)
+        x = x @ self._kernels[-1]
+        x += self._biases[-1]
+        return (x * self._output_scale).astype(np.float32, copy=False)
+
+    def predict(self, test_data: np.ndarray, verbose: int = 0) -> np.ndarray:
+        '''
+        Return softmax probabilities for a batch of inputs.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+            verbose (int): Accepted for compatibility with Sequential.predict. Ignored.
+
+        Returns:
+            np.ndarray: Softmax probabilities with one row per input.
+        '''
+        return _softmax(self.logits(test_data))
+
+    def classify(self, test_data: np.ndarray) -> Predictions:
+        '''
+        Return the probabilities and labels from a single forward pass.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            Predictions: The probability matrix and an int8 array of ActionLabel values.
+        '''
+        x = self.logits(test_data)
+        labels = np.argmax(x, axis=1).astype(np.int8)
+        return Predictions(_softmax(x), labels)
+
+    def predict_labels(self, test_data: np.ndarray) -> np.ndarray:
+        '''
+        Return the predicted class index for each input row.
+
+        Args:
+            test_data (np.ndarray): Input rows of (HP, Aggression), already divided by 100.
+
+        Returns:
+            np.ndarray: Class indices into ACTIONS.
+        '''
+        return np.argmax(self.logits(test_data), axis=1)
+
+    def get_weights(self) -> list[np.ndarray]:
+        '''
+        Return the dequantized weights in Keras get_weights() order.
+
+        Returns:
+            list[np.ndarray]: Alternating float32 kernels and biases.
+        '''
+        weights = []
+        for kernel, bias, input_scale, weight_scale in zip(self.kernels, self.biases,
+                                                           self.input_scales, self.weight_scales):
+            weights.extend([kernel.astype(np.float32) * weight_scale,
+                            bias.astype(np.float32) * (input_scale * weight_scale)])
+        return weights
+
+
+def quantize(model: NumpyModel, calibration: np.ndarray | None = None,
+             min_agreement: float = QUANT_MIN_AGREEMENT) -> NumpyModel | QuantizedModel:
+    '''
+    Quantize a model and keep it only if it makes the same decisions as the float model.
+
+    Args:
+        model (NumpyModel): The float model.
+        calibration (np.ndarray | None): Inputs for calibration and validation. Defaults to calibration_grid().
+        min_agreement (float): Share of decisions that must match. Defaults to QUANT_MIN_AGREEMENT.
+
+    Returns:
+        NumpyModel | QuantizedModel: The quantized model, or the float model if it was rejected.
+    '''
+    calibration = calibration_grid() if calibration is None else calibration
+    quantized = QuantizedModel(model, calibration)
+    quantized.agreement = float(np.mean(quantized.predict_labels(calibration) == model.predict_labels(calibration)))
+    if quantized.agreement < min_agreement:
+        print(f'Int8 model rejected: {quantized.agreement:.2%} agreement is below {min_agreement:.2%}.')
+        return model
+    return quantized
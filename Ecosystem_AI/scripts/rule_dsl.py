@@ -0,0 +1,413 @@
+'''
+Script: rule_dsl.py
+Description: Implements a small declarative format for symbolic AI rules, written as Python dicts or in a TOML
+             file. Each rule is compiled once into a specialized Python function for RuleEngine and a NumPy
+             version for ArrayRuleEngine, and declares its reads and writes for IncrementalRuleEngine.
+             Rule files are trusted input: validation keeps generated code to plain attribute reads and
+             writes, but the code is still run with exec, so only load rule files you would run as code.
+             Run from the project folder with: python -m scripts.rule_dsl [rules.toml]
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import keyword
+import operator
+import os
+import random
+import sys
+from typing import Any, Callable, Dict, List
+import numpy as np
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10: rules can still be given as dicts
+    tomllib = None
+
+# Constants
+RULES_PATH = os.path.join(os.path.dirname(__file__), 'rules.toml')  # Example rule file
+OPERATORS = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+             '==': operator.eq, '!=': operator.ne}
+RESOURCE_AGGREGATES = ('any', 'all', 'sum')  # How a resource condition combines the resources of a context
+RULE_KEYS = {'name', 'when', 'chance', 'band', 'if', 'set', 'else', 'add', 'sum'}
+ARRAY_ATTRIBUTES = {'current_population', 'starting_population', 'starting_aggression', 'aggression_x',
+                    'aggression_y', 'current_aggression', 'health', 'has_prey', 'can_spawn'}  # SpeciesArrays columns
+ARRAY_RESOURCE_ATTRIBUTES = {'current_population'}  # Resource columns of SpeciesArrays
+USE_RULE_FILE = False  # Take the game's symbolic AI rules from RULES_PATH instead of the built-in rules
+RESERVED_NAMES = {'random', 'resources', 'context', 'sum', 'any', 'all'}  # Names the generated code relies on
+
+# Rule format: a dict, or a [[rules]] table in TOML, with these keys, applied in this order to each species:
+#   name    The rule name.
+#   chance  Probability of acting on each species. Makes the rule volatile.
+#   when    Conditions that must all hold, or the species is left alone. A species condition is
+#           {attr, op, value} or {attr, op, other} to compare with another attribute. A resource condition
+#           adds resources = 'any' | 'all' | 'sum' and is checked once per context.
+#   band    Sets an attribute from a population percentage: {of = 'self' | 'prey', set, bands, default}.
+#           bands is a list of [low, high, value], both bounds inclusive, and the first match wins.
+#           With of = 'prey' the species' last prey is used and species without prey are left alone.
+#   if      Conditions choosing between 'set' and 'else'. Without 'if', 'set' always applies.
+#   set     Attribute values to assign when the 'if' conditions hold.
+#   else    Attribute values to assign when they do not.
+#   add     Amounts to add to attributes. Makes the rule volatile, as it is not idempotent.
+#   sum     Attributes to set to the sum of other attributes, e.g. current_aggression.
+
+
+class RuleSpecError(ValueError):
+    '''
+    Raised when a rule spec is malformed.
+    '''
+
+
+def _check_attribute(name: Any, rule: str) -> str:
+    '''Return an attribute name, rejecting anything that is not a plain, public identifier.'''
+    if not isinstance(name, str) or not name.isidentifier() or keyword.iskeyword(name) or name.startswith('_'):
+        raise RuleSpecError(f'Rule {rule!r}: {name!r} is not an attribute name.')
+    return name
+
+
+def _check_number(value: Any, rule: str) -> int | float:
+    '''Return a numeric value, rejecting bools and strings.'''
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise RuleSpecError(f'Rule {rule!r}: {value!r} is not a number.')
+    return value
+
+
+def _check_value(value: Any, rule: str) -> Any:
+    '''Return a literal value, rejecting types that cannot be written into generated code.'''
+    if not isinstance(value, (bool, int, float, str)):
+        raise RuleSpecError(f'Rule {rule!r}: {value!r} is not a number, bool or string.')
+    return value
+
+
+def _check_conditions(conditions: list, rule: str, allow_resources: bool) -> list[dict]:
+    '''Return validated conditions.'''
+    checked = []
+    for condition in conditions:
+        if condition.get('op') not in OPERATORS:
+            raise RuleSpecError(f'Rule {rule!r}: unknown operator {condition.get("op")!r}.')
+        aggregate = condition.get('resources')
+        if aggregate is not None and (not allow_resources or aggregate not in RESOURCE_AGGREGATES):
+            raise RuleSpecError(f'Rule {rule!r}: resource conditions go in "when" '
+                                f'and use one of {RESOURCE_AGGREGATES}.')
+        other = condition.get('other')
+        if other is not None and aggregate is not None:
+            raise RuleSpecError(f'Rule {rule!r}: resource conditions compare with a value, not another attribute.')
+        checked.append({'attr': _check_attribute(condition.get('attr'), rule), 'op': condition['op'],
+                        'value': None if other is not None else _check_value(condition.get('value'), rule),
+                        'other': None if other is None else _check_attribute(other, rule), 'resources': aggregate})
+    return checked
+
+
+def validate(spec: Dict[str, Any]) -> Dict[str, Any]:
+    '''
+    Check a rule spec and fill in defaults.
+
+    Args:
+        spec (Dict[str, Any]): The rule spec.
+
+    Returns:
+        Dict[str, Any]: The normalized spec.
+
+    Raises:
+        RuleSpecError: If the spec is malformed.
+    '''
+    name = spec.get('name')
+    if not isinstance(name, str) or not name.isidentifier() or keyword.iskeyword(name):
+        raise RuleSpecError(f'Rule name {name!r} must be an identifier.')
+    if name in RESERVED_NAMES:
+        raise RuleSpecError(f'Rule name {name!r} is reserved for the generated code.')
+    unknown = set(spec) - RULE_KEYS
+    if unknown:
+        raise RuleSpecError(f'Rule {name!r}: unknown keys {sorted(unknown)}.')
+
+    band = spec.get('band')
+    if band is not None:
+        if band.get('of', 'self') not in ('self', 'prey'):
+            raise RuleSpecError(f'Rule {name!r}: band "of" must be "self" or "prey".')
+        bands = [(_check_number(low, name), _check_number(high, name), _check_value(value, name))
+                 for low, high, value in band.get('bands', ())]
+        band = {'of': band.get('of', 'self'), 'set': _check_attribute(band.get('set'), name), 'bands': bands,
+                'default': _check_value(band.get('default', 0), name)}
+
+    chance = spec.get('chance')
+    if chance is not None and not 0 <= _check_number(chance, name) <= 1:
+        raise RuleSpecError(f'Rule {name!r}: chance must be between 0 and 1.')
+
+    def assignments(key: str) -> dict:
+        return {_check_attribute(attr, name): _check_value(value, name) for attr, value in spec.get(key, {}).items()}
+
+    return {
+        'name': name,
+        'when': _check_conditions(spec.get('when', []), name, allow_resources=True),
+        'chance': chance,
+        'band': band,
+        'if': _check_conditions(spec.get('if', []), name, allow_resources=False),
+        'set': assignments('set'),
+        'else': assignments('else'),
+        'add': assignments('add'),
+        'sum': {_check_attribute(attr, name): [_check_attribute(term, name) for term in terms]
+                for attr, terms in spec.get('sum', {}).items()},
+    }
+
+
+def dependencies(spec: Dict[str, Any]) -> tuple[frozenset, frozenset, bool]:
+    '''
+    Work out what a validated rule reads and writes, in the rule_dependencies notation.
+
+    Args:
+        spec (Dict[str, Any]): A validated rule spec.
+
+    Returns:
+        tuple[frozenset, frozenset, bool]: The reads, the writes and whether the rule is volatile.
+    '''
+    reads, writes = set(), set()
+    for condition in spec['when'] + spec['if']:
+        reads.add(f'resources.{condition["attr"]}' if condition['resources'] else condition['attr'])
+        if condition['other'] is not None:
+            reads.add(condition['other'])
+    if spec['band']:
+        if spec['band']['of'] == 'prey':
+            reads.update({'prey', 'prey.current_population', 'prey.starting_population'})
+        else:
+            reads.update({'current_population', 'starting_population'})
+        writes.add(spec['band']['set'])
+    writes.update(spec['set'], spec['else'], spec['add'], spec['sum'])
+    reads.update(spec['add'])
+    for terms in spec['sum'].values():
+        reads.update(terms)
+    return frozenset(reads), frozenset(writes), spec['chance'] is not None or bool(spec['add'])
+
+
+def _condition_source(condition: dict, subject: str) -> str:
+    '''Return a species condition as a Python expression.'''
+    if condition['other'] is not None:
+        return f'{subject}.{condition["attr"]} {condition["op"]} {subject}.{condition["other"]}'
+    return f'{subject}.{condition["attr"]} {condition["op"]} {condition["value"]!r}'
+
+
+def _resource_source(condition: dict) -> str:
+    '''Return a resource condition as a Python expression over the context's resources.'''
+    attr, op, value = condition['attr'], condition['op'], repr(condition['value'])
+    if condition['resources'] == 'sum':
+        return f'sum(resource.{attr} for resource in resources) {op} {value}'
+    return f'{condition["resources"]}(resource.{attr} {op} {value} for resource in resources)'
+
+
+def _band_source(band: dict, subject: str) -> list[str]:
+    '''Return the lines of a band assignment.'''
+    lines = [f'percentage = {subject}.current_population / {subject}.starting_population * 100']
+    for index, (low, high, value) in enumerate(band['bands']):
+        keyword = 'if' if index == 0 else 'elif'
+        lines += [f'{keyword} {low!r} <= percentage <= {high!r}:', f'    species.{band["set"]} = {value!r}']
+    if band['bands']:
+        lines += ['else:', f'    species.{band["set"]} = {band["default"]!r}']
+    else:
+        lines.append(f'species.{band["set"]} = {band["default"]!r}')
+    return lines
+
+
+def to_source(spec: Dict[str, Any]) -> str:
+    '''
+    Generate a validated rule as the source of a Python function taking the context.
+
+    Args:
+        spec (Dict[str, Any]): A validated rule spec.
+
+    Returns:
+        str: The function source.
+    '''
+    resource_conditions = [c for c in spec['when'] if c['resources']]
+    species_conditions = [c for c in spec['when'] if not c['resources']]
+
+    body = []
+    if spec['chance'] is not None:
+        body += [f'if random.random() >= {spec["chance"]!r}:', '    continue']
+    if species_conditions:
+        test = ' and '.join(_condition_source(c, 'species') for c in species_conditions)
+        body += [f'if not ({test}):', '    continue']
+    if spec['band']:
+        subject = 'species'
+        if spec['band']['of'] == 'prey':
+            body += ['if not species.prey:', '    continue', 'prey = species.prey[-1]']
+            subject = 'prey'
+        body += _band_source(spec['band'], subject)
+    if spec['set'] or spec['else']:
+        chosen = [f'species.{attr} = {value!r}' for attr, value in spec['set'].items()] or ['pass']
+        otherwise = [f'species.{attr} = {value!r}' for attr, value in spec['else'].items()]
+        if spec['if']:
+            body.append(f'if {" and ".join(_condition_source(c, "species") for c in spec["if"])}:')
+            body += ['    ' + line for line in chosen]
+            if otherwise:
+                body += ['else:'] + ['    ' + line for line in otherwise]
+        else:
+            body += chosen
+    body += [f'species.{attr} += {value!r}' for attr, value in spec['add'].items()]
+    body += [f'species.{attr} = {" + ".join(f"species.{term}" for term in terms)}'
+             for attr, terms in spec['sum'].items()]
+
+    lines = [f'def {spec["name"]}(context):', "    resources = context['resources']"]
+    if resource_conditions:
+        test = ' and '.join(_resource_source(c) for c in resource_conditions)
+        lines += [f'    if not ({test}):', '        return']
+    lines.append("    for species in context['species']:")
+    lines += ['        ' + line for line in (body or ['pass'])]
+    return '\n'.join(lines) + '\n'
+
+
+def _assign(state, attr: str, mask: np.ndarray, value) -> None:
+    '''Set an array column where the mask holds, keeping its dtype.'''
+    old = getattr(state, attr)
+    setattr(state, attr, np.where(mask, value, old).astype(old.dtype, copy=False))
+
+
+def _array_value(state, attr: str, value: Any) -> Any:
+    '''Return a spec value in the encoding of an array column (health states are codes).'''
+    return state.health_code(value) if attr == 'health' else value
+
+
+def _array_conditions(state, conditions: list[dict]) -> np.ndarray:
+    '''Return the rows of the arrays where all species conditions hold.'''
+    mask = np.ones(len(state), dtype=bool)
+    for condition in conditions:
+        compare = OPERATORS[condition['op']]
+        if condition['other'] is not None:
+            value = getattr(state, condition['other'])
+        else:
+            value = _array_value(state, condition['attr'], condition['value'])
+        mask &= compare(getattr(state, condition['attr']), value)
+    return mask
+
+
+def to_vectorized(spec: Dict[str, Any]) -> Callable | None:
+    '''
+    Build the NumPy version of a validated rule for ArrayRuleEngine.
+
+    Args:
+        spec (Dict[str, Any]): A validated rule spec.
+
+    Returns:
+        Callable | None: A function taking (SpeciesArrays, np.random.Generator), or None if the rule uses
+            attributes that SpeciesArrays does not hold.
+    '''
+    reads, writes, _ = dependencies(spec)
+    species_attributes = {name for name in reads | writes if '.' not in name} - {'prey'}
+    resource_attributes = {name.split('.', 1)[1] for name in reads if name.startswith('resources.')}
+    if not species_attributes <= ARRAY_ATTRIBUTES or not resource_attributes <= ARRAY_RESOURCE_ATTRIBUTES:
+        return None
+
+    resource_conditions = [c for c in spec['when'] if c['resources']]
+    species_conditions = [c for c in spec['when'] if not c['resources']]
+    band = spec['band']
+
+    def vectorized(state, rng: np.random.Generator) -> None:
+        for condition in resource_conditions:
+            compare = OPERATORS[condition['op']]
+            values = state.resource_population
+            if condition['resources'] == 'sum':
+                holds = compare(values.sum(), condition['value'])
+            else:
+                holds = getattr(np, condition['resources'])(compare(values, condition['value']))
+            if not holds:
+                return
+
+        mask = state.active.copy()
+        if spec['chance'] is not None:
+            mask &= rng.random(len(state)) < spec['chance']
+        mask &= _array_conditions(state, species_conditions)
+        if band:
+            if band['of'] == 'prey':
+                mask &= state.prey_index >= 0
+                subject = np.maximum(state.prey_index, 0)
+                current, starting = state.current_population[subject], state.starting_population[subject]
+            else:
+                current, starting = state.current_population, state.starting_population
+            with np.errstate(divide='ignore', invalid='ignore'):
+                percentage = current / starting * 100
+            value = np.select([(percentage >= low) & (percentage <= high) for low, high, _ in band['bands']],
+                              [value for _, _, value in band['bands']], default=band['default'])
+            _assign(state, band['set'], mask, value)
+        if spec['set'] or spec['else']:
+            chosen = _array_conditions(state, spec['if'])
+            for attr, value in spec['set'].items():
+                _assign(state, attr, mask & chosen, _array_value(state, attr, value))
+            for attr, value in spec['else'].items():
+                _assign(state, attr, mask & ~chosen, _array_value(state, attr, value))
+        for attr, value in spec['add'].items():
+            _assign(state, attr, mask, getattr(state, attr) + value)
+        for attr, terms in spec['sum'].items():
+            _assign(state, attr, mask, sum(getattr(state, term) for term in terms))
+
+    return vectorized
+
+
+def compile_rule(spec: Dict[str, Any]) -> Callable[[Dict[str, Any]], None]:
+    '''
+    Compile a rule spec into a function for RuleEngine.add_rule.
+
+    Args:
+        spec (Dict[str, Any]): The rule spec.
+
+    Returns:
+        Callable[[Dict[str, Any]], None]: The rule, with reads, writes and volatile attributes for
+            IncrementalRuleEngine, a vectorized attribute for ArrayRuleEngine and its generated source.
+
+    Raises:
+        RuleSpecError: If the spec is malformed.
+    '''
+    spec = validate(spec)
+    source = to_source(spec)
+    namespace = {'random': random}
+    exec(compile(source, f'<rule {spec["name"]}>', 'exec'), namespace)
+    rule = namespace[spec['name']]
+    rule.reads, rule.writes, rule.volatile = dependencies(spec)
+    rule.vectorized = to_vectorized(spec)
+    rule.source = source
+    rule.spec = spec
+    return rule
+
+
+def load_rules(path: str = RULES_PATH) -> List[Callable[[Dict[str, Any]], None]]:
+    '''
+    Compile the rules of a TOML file, given as a [[rules]] array of tables.
+
+    Args:
+        path (str): The TOML file. Defaults to RULES_PATH.
+
+    Returns:
+        List[Callable[[Dict[str, Any]], None]]: The compiled rules, in file order.
+
+    Raises:
+        RuntimeError: If this Python has no tomllib (before 3.11).
+    '''
+    if tomllib is None:
+        raise RuntimeError('Loading rule files needs Python 3.11 or higher (tomllib).')
+    with open(path, 'rb') as file:
+        return [compile_rule(spec) for spec in tomllib.load(file).get('rules', [])]
+
+
+def register(engine, rules: list) -> None:
+    '''
+    Compile rule specs as needed and add them to a rule engine, in order.
+
+    Args:
+        engine: A RuleEngine or any engine with add_rule.
+        rules (list): Rule specs and/or compiled rules.
+    '''
+    for rule in rules:
+        engine.add_rule(compile_rule(rule) if isinstance(rule, dict) else rule)
+
+
+def main() -> None:
+    '''
+    Compile a rule file and print the generated code of each rule.
+    '''
+    path = sys.argv[1] if len(sys.argv) > 1 else RULES_PATH
+    for rule in load_rules(path):
+        fast_path = 'yes' if rule.vectorized is not None else 'no'
+        print(f'# {rule.__name__}: reads {sorted(rule.reads)}, writes {sorted(rule.writes)}, '
+              f'volatile {rule.volatile}, vectorized {fast_path}')
+        print(rule.source)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,368 @@
+'''
+Script: species_arrays.py
+Description: Implements a structure-of-arrays backend for the symbolic rule engine. Species state is held in
+             parallel NumPy arrays and each built-in rule has a vectorized version, so one sleep tick costs a
+             few array passes however many species there are.
+             Run from the project folder with: python -m scripts.species_arrays
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import time
+from operator import attrgetter
+from typing import Any, Callable, Dict
+import numpy as np
+from scripts.symbolic_ai_test import RuleEngine, rule_resource_health, rule_self_aggression, rule_predator_prey, rule_reproduction
+
+# Constants
+HEALTH_STATES = ('Healthy', 'Diseased', 'Starved')  # Health codes, by position
+HEALTHY, DISEASED = 0, 1
+LOW_RESOURCE_POPULATION = 3  # Resource population below which species fall ill (rule_resource_health)
+USE_ARRAY_RULES = False  # Evaluate the base screen's sleep-time rules with ArrayRuleEngine
+
+
+class SpeciesArrays:
+    '''
+    Parallel arrays holding the rule-relevant state of a list of species.
+    Prey that are not in the list are added as inactive rows so their populations can be read.
+    The row layout and the fixed columns are built once; reload and write_back sync only the state rules change.
+    '''
+
+    def __init__(self, species: list, resources: list) -> None:
+        '''
+        Initialize the SpeciesArrays by copying state out of Species objects.
+
+        Args:
+            species (list): The species the rules apply to.
+            resources (list): The resources whose populations the rules read.
+        '''
+        self.species = list(species)
+        index = {id(s): i for i, s in enumerate(self.species)}
+        for s in species:
+            for prey in s.prey:
+                if id(prey) not in index:
+                    index[id(prey)] = len(self.species)
+                    self.species.append(prey)
+        self.active = np.arange(len(self.species)) < len(species)
+        self.resources = list(resources)
+
+        # Each predator's aggression follows its last prey, as in rule_predator_prey
+        self.prey_index = np.full(len(self.species), -1, dtype=np.intp)
+        self.prey_index[:len(species)] = [index[id(s.prey[-1])] if s.prey else -1 for s in species]
+        self.has_prey = np.array([s.has_prey for s in self.species], dtype=bool)
+        self.can_spawn = np.array([s.can_spawn for s in self.species], dtype=bool)
+        self.starting_population = self._column('starting_population')
+        self.starting_aggression = self._column('starting_aggression')
+        self.health_names = list(HEALTH_STATES)
+        self.health_codes = {name: code for code, name in enumerate(self.health_names)}
+        self.layout_key = self.layout(species, resources)
+        self.reload()
+
+    @staticmethod
+    def layout(species: list, resources: list) -> tuple:
+        '''
+        Return what the row layout is built from: the species, the prey each one follows and the resources.
+        Arrays whose layout_key equals this can be reloaded instead of rebuilt.
+
+        Args:
+            species (list): The species the rules apply to.
+            resources (list): The resources whose populations the rules read.
+
+        Returns:
+            tuple: The ids of the species, of their last prey (0 for none) and of the resources.
+        '''
+        last_prey = [id(prey[-1]) if prey else 0 for prey in map(attrgetter('prey'), species)]
+        return tuple(map(id, species)), tuple(last_prey), tuple(map(id, resources))
+
+    @classmethod
+    def from_context(cls, context: Dict[str, Any]) -> 'SpeciesArrays':
+        '''
+        Build the arrays for a rule context.
+
+        Args:
+            context (Dict[str, Any]): A context with 'species' and 'resources' lists.
+
+        Returns:
+            SpeciesArrays: The arrays.
+        '''
+        return cls(context['species'], context['resources'])
+
+    def __len__(self) -> int:
+        '''Return the number of rows, including inactive prey rows.'''
+        return len(self.species)
+
+    def health_code(self, health: str) -> int:
+        '''
+        Return the code of a health state, adding unknown states to the table.
+
+        Args:
+            health (str): The health state, e.g. 'Healthy'.
+
+        Returns:
+            int: Its code in the health column.
+        '''
+        code = self.health_codes.get(health)
+        if code is None:
+            code = self.health_codes[health] = len(self.health_names)
+            self.health_names.append(health)
+        return code
+
+    def _column(self, name: str) -> np.ndarray:
+        '''Return an integer attribute of every row as an int64 array.'''
+        return np.fromiter(map(attrgetter(name), self.species), dtype=np.int64, count=len(self.species))
+
+    def reload(self) -> None:
+        '''
+        Copy the state rules change from the Species objects into the arrays, and remember it for write_back.
+        '''
+        self.current_population = self._column('current_population')
+        self.aggression_x = self._column('aggression_x')
+        self.aggression_y = self._column('aggression_y')
+        self.current_aggression = self._column('current_aggression')
+        health = list(map(attrgetter('health'), self.species))
+        try:
+            codes = list(map(self.health_codes.__getitem__, health))
+        except KeyError:
+            codes = [self.health_code(name) for name in health]
+        self.health = np.array(codes, dtype=np.int8)
+        self.resource_population = np.fromiter([r.current_population for r in self.resources], dtype=np.int64,
+                                               count=len(self.resources))
+        self.loaded = (self.current_population.copy(), self.aggression_x.copy(), self.aggression_y.copy(),
+                       self.current_aggression.copy(), self.health.copy())
+
+    def write_back(self) -> None:
+        '''
+        Copy the arrays back into the active Species objects whose state changed since the last reload.
+        '''
+        population, x, y, aggression, health = self.loaded
+        changed = self.active & ((self.current_population != population) | (self.aggression_x != x)
+                                 | (self.aggression_y != y) | (self.current_aggression != aggression)
+                                 | (self.health != health))
+        rows = np.flatnonzero(changed)
+        columns = zip(rows.tolist(), self.current_population[rows].tolist(), self.aggression_x[rows].tolist(),
+                      self.aggression_y[rows].tolist(), self.current_aggression[rows].tolist(),
+                      self.health[rows].tolist())
+        for i, population, x, y, aggression, health in columns:
+            s = self.species[i]
+            s.current_population = population
+            s.aggression_x = x
+            s.aggression_y = y
+            s.current_aggression = aggression
+            s.health = self.health_names[health]
+        self.loaded = (self.current_population.copy(), self.aggression_x.copy(), self.aggression_y.copy(),
+                       self.current_aggression.copy(), self.health.copy())
+
+
+def population_band(current: np.ndarray, starting: np.ndarray) -> np.ndarray:
+    '''
+    Return the aggression bonus for each population, using the bands of rule_self_aggression.
+
+    Args:
+        current (np.ndarray): Current populations.
+        starting (np.ndarray): Starting populations.
+
+    Returns:
+        np.ndarray: 0 for 70-100%, 10 for 30-70%, 20 for 10-30% and 10 otherwise.
+    '''
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percentage = current / starting * 100
+    return np.select(
+        [(percentage >= 70) & (percentage <= 100), (percentage >= 30) & (percentage < 70),
+         (percentage >= 10) & (percentage < 30)],
+        [0, 10, 20],
+        default=10,
+    )
+
+
+def vector_resource_health(state: SpeciesArrays, rng: np.random.Generator) -> None:
+    '''Vectorized rule_resource_health.'''
+    if np.any(state.resource_population < LOW_RESOURCE_POPULATION):
+        health = np.where(state.has_prey & state.can_spawn, DISEASED, HEALTHY)
+        state.health = np.where(state.active, health, state.health).astype(np.int8)
+
+
+def vector_self_aggression(state: SpeciesArrays, rng: np.random.Generator) -> None:
+    '''Vectorized rule_self_aggression.'''
+    band = population_band(state.current_population, state.starting_population)
+    state.aggression_x = np.where(state.active, band, state.aggression_x)
+    aggression = state.starting_aggression + state.aggression_x + state.aggression_y
+    state.current_aggression = np.where(state.active, aggression, state.current_aggression)
+
+
+def vector_predator_prey(state: SpeciesArrays, rng: np.random.Generator) -> None:
+    '''Vectorized rule_predator_prey.'''
+    predators = state.active & (state.prey_index >= 0)
+    prey = state.prey_index[predators]
+    band = population_band(state.current_population[prey], state.starting_population[prey])
+    state.aggression_y = state.aggression_y.copy()
+    state.aggression_y[predators] = band
+    aggression = state.starting_aggression + state.aggression_x + state.aggression_y
+    state.current_aggression = np.where(predators, aggression, state.current_aggression)
+
+
+def vector_reproduction(state: SpeciesArrays, rng: np.random.Generator) -> None:
+    '''Vectorized rule_reproduction. Uses the NumPy generator, so draws differ from the random module's.'''
+    if state.resource_population.sum() <= 2:
+        return
+    reproduce = rng.integers(0, 2, size=len(state)) == 1
+    grows = (state.active & reproduce & (state.health == HEALTHY)
+             & (state.current_population < state.starting_population) & (state.current_population > 1))
+    state.current_population = state.current_population + grows
+
+
+# Vectorized versions of the built-in rules. Other rules can provide one as a 'vectorized' attribute
+VECTORIZED_RULES = {
+    rule_resource_health: vector_resource_health,
+    rule_self_aggression: vector_self_aggression,
+    rule_predator_prey: vector_predator_prey,
+    rule_reproduction: vector_reproduction,
+}
+
+
+def vectorized(rule: Callable) -> Callable | None:
+    '''
+    Return the vectorized version of a rule, or None if it has none.
+
+    Args:
+        rule (Callable): A rule registered with a RuleEngine.
+
+    Returns:
+        Callable | None: A function taking (SpeciesArrays, np.random.Generator).
+    '''
+    return getattr(rule, 'vectorized', None) or VECTORIZED_RULES.get(rule)
+
+
+class ArrayRuleEngine(RuleEngine):
+    '''
+    A RuleEngine that runs rules on SpeciesArrays. Rules without a vectorized version
+    run on the Species objects as usual, with the arrays synced around them.
+    The arrays of the last context are kept and only reloaded while its species, prey and resources stay the same.
+    '''
+
+    def __init__(self, seed: int | None = None) -> None:
+        '''
+        Initialize the ArrayRuleEngine.
+
+        Args:
+            seed (int | None): Seed for the random draws of rule_reproduction. Defaults to None.
+        '''
+        super().__init__()
+        self.rng = np.random.default_rng(seed)
+        self.state: SpeciesArrays | None = None  # Arrays of the last evaluated context
+
+    def arrays_for(self, context: Dict[str, Any]) -> SpeciesArrays:
+        '''
+        Return the arrays of a context, reloading the kept ones if its species set has not changed.
+
+        Args:
+            context (Dict[str, Any]): A context with 'species' and 'resources' lists.
+
+        Returns:
+            SpeciesArrays: The arrays, holding the current state of the context's species.
+        '''
+        state = self.state
+        if state is not None and state.layout_key == SpeciesArrays.layout(context['species'], context['resources']):
+            state.reload()
+        else:
+            state = self.state = SpeciesArrays.from_context(context)
+        return state
+
+    def close(self) -> None:
+        '''
+        Drop the kept arrays and the references they hold to the species.
+        '''
+        self.state = None
+
+    def evaluate_arrays(self, state: SpeciesArrays, context: Dict[str, Any] | None = None) -> None:
+        '''
+        Evaluate all rules on state held in arrays, in registration order.
+
+        Args:
+            state (SpeciesArrays): The species state. Updated in place.
+            context (Dict[str, Any] | None): The matching context, needed only for rules without a
+                vectorized version. Defaults to None.
+        '''
+        profiler = self.profiler
+        for rule in self.rules:
+            if profiler is not None:
+                start = time.perf_counter_ns()
+            vector_rule = vectorized(rule)
+            if vector_rule is not None:
+                vector_rule(state, self.rng)
+            elif context is not None:
+                state.write_back()
+                rule(context)
+                state.reload()
+            else:
+                raise ValueError(f'Rule {rule.__name__} has no vectorized version and no context was given.')
+            if profiler is not None:
+                profiler.record(rule, time.perf_counter_ns() - start, int(np.count_nonzero(state.active)))
+
+    def evaluate(self, context: Dict[str, Any]) -> None:
+        '''
+        Evaluate all rules in the given context, writing the results back to the Species objects.
+
+        Args:
+            context (Dict[str, Any]): The context in which to evaluate the rules.
+        '''
+        state = self.arrays_for(context)
+        self.evaluate_arrays(state, context)
+        state.write_back()
+
+
+def main() -> None:
+    '''
+    Time one rule tick over many species with the Python and the array rule engines.
+    '''
+    import copy
+    from scripts.species_creation import Species
+
+    count = 100_000
+    rng = np.random.default_rng(0)
+    species = []
+    for i in range(count):
+        s = Species(f'Species {i}', starting_population=10, aggression=int(rng.integers(0, 50)))
+        s.current_population = int(rng.integers(0, 11))
+        species.append(s)
+    for predator, prey in zip(species[::2], species[1::2]):
+        predator.prey.append(prey)
+    resources = [Species('Oak Trees', starting_population=10, aggression=0, has_prey=False)]
+    rules = (rule_resource_health, rule_predator_prey, rule_self_aggression, rule_reproduction)
+
+    python_engine, array_engine = RuleEngine(), ArrayRuleEngine(seed=0)
+    for rule in rules:
+        python_engine.add_rule(rule)
+        array_engine.add_rule(rule)
+
+    python_species = copy.deepcopy(species)
+    with python_engine.profile() as python_profile:
+        start = time.perf_counter()
+        python_engine.evaluate({'species': python_species, 'resources': resources})
+        python_time = time.perf_counter() - start
+
+    state = SpeciesArrays(species, resources)
+    with array_engine.profile() as array_profile:
+        start = time.perf_counter()
+        array_engine.evaluate_arrays(state)
+        array_time = time.perf_counter() - start
+
+    context = {'species': species, 'resources': resources}
+    start = time.perf_counter()
+    array_engine.evaluate(context)
+    first_tick_time = time.perf_counter() - start
+    start = time.perf_counter()
+    array_engine.evaluate(context)
+    round_trip_time = time.perf_counter() - start
+
+    print(f'{count:,} species, one tick:')
+    print(f'  Python rules:                 {python_time * 1000:8.1f} ms')
+    print(f'  Array rules:                  {array_time * 1000:8.1f} ms')
+    print(f'  Array rules with object sync: {round_trip_time * 1000:8.1f} ms'
+          f' (first tick, building the arrays: {first_tick_time * 1000:.1f} ms)')
+    print(f'\nPython rules:\n{python_profile.report()}')
+    print(f'\nArray rules:\n{array_profile.report()}')
+
+
+if __name__ == '__main__':
+    main()
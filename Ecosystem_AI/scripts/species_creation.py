@@ -8,7 +8,12 @@ Version: 1.0
 '''
 
 import random
-from scripts.symbolic_ai_test import RuleEngine, rule_resource_health, rule_predator_prey, rule_self_aggression, rule_reproduction
+from typing import Callable
+from scripts.symbolic_ai_test import IncrementalRuleEngine, rule_resource_health, rule_predator_prey, rule_self_aggression, rule_reproduction
+from scripts.rule_dsl import load_rules, USE_RULE_FILE
+
+
+_UNSET = object()  # Marks an attribute that has not been set yet
 
 
 class Species:
@@ -44,6 +49,56 @@ class Species:
         self.has_prey = has_prey
         self.can_spawn = can_spawn
 
+    def watch(self, callback: Callable[['Species', str], None]) -> None:
+        '''
+        Register a callback for attribute changes. In-place changes to the prey list are not reported.
+        The species becomes a WatchedSpecies until its last callback is removed, so species nobody
+        watches keep plain attribute writes.
+
+        Args:
+            callback (Callable[[Species, str], None]): Called with the species and the attribute name.
+        '''
+        self.__dict__.setdefault('watchers', []).append(callback)
+        if type(self) is Species:
+            self.__class__ = WatchedSpecies
+
+    def unwatch(self, callback: Callable[['Species', str], None]) -> None:
+        '''
+        Remove a callback registered with watch. Unknown callbacks are ignored.
+
+        Args:
+            callback (Callable[[Species, str], None]): The callback to remove.
+        '''
+        watchers = self.__dict__.get('watchers', [])
+        if callback in watchers:
+            watchers.remove(callback)
+        if not watchers:
+            self.__dict__.pop('watchers', None)
+            if type(self) is WatchedSpecies:
+                self.__class__ = Species
+
+    def __getstate__(self) -> dict:
+        '''
+        Return the state used by copy and pickle. Watchers are left out, so copies are not watched.
+
+        Returns:
+            dict: The species attributes.
+        '''
+        state = dict(self.__dict__)
+        state.pop('watchers', None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        '''
+        Restore a copied or unpickled species, unwatched.
+
+        Args:
+            state (dict): The species attributes.
+        '''
+        self.__dict__.update(state)
+        if type(self) is WatchedSpecies:
+            self.__class__ = Species
+
     def __str__(self) -> str:
         '''
         Return a string representation of the species.
@@ -54,6 +109,27 @@ class Species:
         return self.name
 
 
+class WatchedSpecies(Species):
+    '''
+    A species with at least one watcher. Attribute writes report actual changes to the watchers.
+    Created only by Species.watch.
+    '''
+
+    def __setattr__(self, name: str, value) -> None:
+        '''
+        Set an attribute, telling the watchers when its value actually changes.
+
+        Args:
+            name (str): The attribute name.
+            value: The new value.
+        '''
+        old = self.__dict__.get(name, _UNSET)
+        object.__setattr__(self, name, value)
+        if old is not value and old != value:
+            for callback in tuple(self.__dict__.get('watchers', ())):
+                callback(self, name)
+
+
 class Forest:
     '''
     Represents a forest ecosystem containing species and resources.
@@ -76,13 +152,27 @@ class Forest:
         self.herbivores = [herbivore]
         self.herbs = [herbs]
         self.resources = [resources]
-        self.rule_engine = RuleEngine()
+        self.rule_engine = IncrementalRuleEngine()
+
+        # Add rules to the engine, from the rule file if it is enabled
+        if USE_RULE_FILE:
+            rules = load_rules()
+        else:
+            rules = (rule_resource_health, rule_predator_prey, rule_self_aggression, rule_reproduction)
+        for rule in rules:
+            self.rule_engine.add_rule(rule)
 
-        # Add rules to the engine
-        self.rule_engine.add_rule(rule_resource_health)
-        self.rule_engine.add_rule(rule_predator_prey)
-        self.rule_engine.add_rule(rule_self_aggression)
-        self.rule_engine.add_rule(rule_reproduction)
+    def context(self) -> dict:
+        '''
+        Return the rule engine context of this forest.
+
+        Returns:
+            dict: The forest's species and resources.
+        '''
+        return {
+            'species': self.carnivores + self.herbivores + self.herbs,
+            'resources': self.resources
+        }
 
     def display_status(self) -> None:
         '''
@@ -170,15 +260,11 @@ def main() -> None:
                     carnivore.current_population = max(0, carnivore.current_population - 1)
 
             # Apply symbolic AI rules
-            context = {
-                'species': forest.carnivores + forest.herbivores + forest.herbs,
-                'resources': forest.resources
-            }
-            forest.rule_engine.evaluate(context)
+            forest.rule_engine.evaluate(forest.context())
 
             # Display the updated status
             forest.display_status()
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,92 @@
+'''
+Script: startup.py
+Description: Measures GUI startup cost. Times how long each project module takes to import in a fresh
+             interpreter, checks that TensorFlow stays unloaded, and reports time to the first screen.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import os
+import subprocess
+import sys
+import time
+
+# Constants
+STARTUP_BUDGET = 1.0  # Seconds allowed from launch until the first screen is drawn
+IMPORT_BUDGET = 0.5  # Seconds allowed for importing a single module in a fresh interpreter
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP_MODULES = [
+    'scripts.neuralnetwork',
+    'scripts.species_creation',
+    'scenes.training_screens',
+    'scenes.base',
+    'scenes.area_1',
+    'scripts.gui',
+]
+
+# Code run in the child interpreter: time the import and report whether TensorFlow was pulled in
+_IMPORT_PROBE = (
+    'import sys, time\n'
+    'start = time.perf_counter()\n'
+    'import {module}\n'
+    'print(time.perf_counter() - start, "tensorflow" in sys.modules)\n'
+)
+
+
+def measure_import(module: str) -> tuple[float, bool]:
+    '''
+    Import a module in a fresh interpreter and time it.
+
+    Args:
+        module (str): The dotted module name, relative to the project folder.
+
+    Returns:
+        tuple[float, bool]: The import time in seconds and whether TensorFlow was imported.
+    '''
+    output = subprocess.run(
+        [sys.executable, '-c', _IMPORT_PROBE.format(module=module)],
+        cwd=PROJECT_DIR, capture_output=True, text=True, check=True,
+    ).stdout.split()
+    return float(output[0]), output[1] == 'True'
+
+
+def report_startup(start_time: float, budget: float = STARTUP_BUDGET) -> float:
+    '''
+    Print the time from launch to the first screen and warn if it is over budget.
+
+    Args:
+        start_time (float): The time.perf_counter() value taken at launch.
+        budget (float): The startup budget in seconds. Defaults to STARTUP_BUDGET.
+
+    Returns:
+        float: The elapsed startup time in seconds.
+    '''
+    elapsed = time.perf_counter() - start_time
+    status = 'within budget' if elapsed <= budget else 'OVER BUDGET'
+    print(f'First screen drawn in {elapsed:.3f}s ({status}, budget {budget:.1f}s)')
+    if 'tensorflow' in sys.modules:
+        print('Warning: TensorFlow was imported during startup.')
+    return elapsed
+
+
+def main() -> None:
+    '''
+    Print the import time of each startup module and flag any that are over budget or import TensorFlow.
+    Run from the project folder with: python -m scripts.startup
+    '''
+    failures = 0
+    for module in STARTUP_MODULES:
+        seconds, loaded_tf = measure_import(module)
+        flags = []
+        if seconds > IMPORT_BUDGET:
+            flags.append('over budget')
+        if loaded_tf:
+            flags.append('imports TensorFlow')
+        failures += bool(flags)
+        print(f'{module:<28} {seconds * 1000:8.1f} ms  {", ".join(flags) if flags else "ok"}')
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -8,7 +8,109 @@ Version: 1.0
 '''
 
 import random
-from typing import Callable, Dict, List, Any
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, Iterator, List, Any
+
+# Constants
+PROFILE_SAMPLES = 4096  # Most recent call durations kept per rule for percentiles
+PROFILE_PERCENTILES = (50, 95, 99)  # Percentiles shown in RuleProfiler.report
+PARALLEL_MIN_SPECIES = 100_000  # Total species above which partitions run on threads (pays off with ArrayRuleEngine)
+
+
+class RuleProfiler:
+    '''
+    Per-rule call counts, wall times and entities touched, recorded by a RuleEngine with profiling enabled.
+    '''
+
+    def __init__(self, samples: int = PROFILE_SAMPLES) -> None:
+        '''
+        Initialize an empty RuleProfiler.
+
+        Args:
+            samples (int): Most recent durations kept per rule for percentiles. Defaults to PROFILE_SAMPLES.
+        '''
+        self.samples = samples
+        self.stats: Dict[str, dict] = {}
+        self.lock = threading.Lock()  # Partitions may record from several threads
+
+    def record(self, rule: Callable, elapsed_ns: int, entities: int) -> None:
+        '''
+        Record one call of a rule.
+
+        Args:
+            rule (Callable): The rule that ran.
+            elapsed_ns (int): Wall time of the call in nanoseconds, from time.perf_counter_ns.
+            entities (int): Number of species the call was given.
+        '''
+        name = getattr(rule, '__name__', repr(rule))
+        with self.lock:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = {'calls': 0, 'total_ns': 0, 'entities': 0,
+                                            'durations': deque(maxlen=self.samples)}
+            stats['calls'] += 1
+            stats['total_ns'] += elapsed_ns
+            stats['entities'] += entities
+            stats['durations'].append(elapsed_ns)
+
+    def reset(self) -> None:
+        '''
+        Discard everything recorded so far.
+        '''
+        with self.lock:
+            self.stats.clear()
+
+    @staticmethod
+    def _percentile(ordered: list, percentile: float) -> int:
+        '''Return the nearest-rank percentile of a sorted list.'''
+        return ordered[min(len(ordered) - 1, max(0, -(-len(ordered) * percentile // 100) - 1))]
+
+    def rows(self) -> List[Dict[str, Any]]:
+        '''
+        Return one summary row per rule, the most expensive first.
+
+        Returns:
+            List[Dict[str, Any]]: Rule name, calls, entities, total and mean milliseconds, percentile
+                milliseconds ('p50_ms', ...) and share of the total time.
+        '''
+        with self.lock:
+            snapshot = {name: dict(stats, durations=sorted(stats['durations'])) for name, stats in self.stats.items()}
+        grand_total = sum(stats['total_ns'] for stats in snapshot.values())
+        rows = []
+        for name, stats in snapshot.items():
+            ordered = stats['durations']
+            row = {
+                'rule': name,
+                'calls': stats['calls'],
+                'entities': stats['entities'],
+                'total_ms': stats['total_ns'] / 1e6,
+                'mean_ms': stats['total_ns'] / stats['calls'] / 1e6,
+            }
+            for percentile in PROFILE_PERCENTILES:
+                row[f'p{percentile}_ms'] = self._percentile(ordered, percentile) / 1e6
+            row['share'] = stats['total_ns'] / grand_total if grand_total else 0.0
+            rows.append(row)
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def report(self) -> str:
+        '''
+        Format the summary as a text table.
+
+        Returns:
+            str: One line per rule, the most expensive first.
+        '''
+        percentiles = [f'p{percentile}_ms' for percentile in PROFILE_PERCENTILES]
+        lines = [f'{"Rule":<24}{"Calls":>8}{"Entities":>12}{"Total ms":>11}{"Mean ms":>10}'
+                 + ''.join(f'{name:>10}' for name in percentiles) + f'{"Share":>8}']
+        for row in self.rows():
+            lines.append(f'{row["rule"]:<24}{row["calls"]:>8}{row["entities"]:>12}{row["total_ms"]:>11.3f}'
+                         f'{row["mean_ms"]:>10.3f}' + ''.join(f'{row[name]:>10.3f}' for name in percentiles)
+                         + f'{row["share"]:>8.1%}')
+        return '\n'.join(lines)
 
 
 class RuleEngine:
@@ -21,6 +123,7 @@ class RuleEngine:
         Initialize the RuleEngine with an empty list of rules.
         '''
         self.rules: List[Callable[[Dict[str, Any]], None]] = []
+        self.profiler: RuleProfiler | None = None  # Set while profiling is enabled
 
     def add_rule(self, rule: Callable[[Dict[str, Any]], None]) -> None:
         '''
@@ -38,11 +141,476 @@ class RuleEngine:
         Args:
             context (Dict[str, Any]): The context in which to evaluate the rules.
         '''
+        profiler = self.profiler
+        if profiler is None:
+            for rule in self.rules:
+                rule(context)
+            return
         for rule in self.rules:
+            start = time.perf_counter_ns()
             rule(context)
+            profiler.record(rule, time.perf_counter_ns() - start, len(context['species']))
+
+    def enable_profiling(self, profiler: RuleProfiler | None = None) -> RuleProfiler:
+        '''
+        Start recording per-rule timings.
+
+        Args:
+            profiler (RuleProfiler | None): The profiler to record into. Defaults to a new one.
+
+        Returns:
+            RuleProfiler: The profiler being recorded into.
+        '''
+        self.profiler = profiler if profiler is not None else RuleProfiler()
+        return self.profiler
+
+    def disable_profiling(self) -> RuleProfiler | None:
+        '''
+        Stop recording per-rule timings.
+
+        Returns:
+            RuleProfiler | None: The profiler that was being recorded into, if any.
+        '''
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    @contextmanager
+    def profile(self, profiler: RuleProfiler | None = None) -> Iterator[RuleProfiler]:
+        '''
+        Record per-rule timings for the duration of a with block.
+
+        Args:
+            profiler (RuleProfiler | None): The profiler to record into. Defaults to a new one.
+
+        Yields:
+            RuleProfiler: The profiler being recorded into.
+        '''
+        previous = self.profiler
+        try:
+            yield self.enable_profiling(profiler)
+        finally:
+            self.profiler = previous
+
+
+class PartitionedRuleEngine:
+    '''
+    Evaluates independent contexts, one per partition (e.g. per Forest), each with its own engine so rules
+    only see the species and resources of their own partition. Large worlds are evaluated on a thread pool.
+    Each species must then be written by one partition only, so partitions run in parallel only when no
+    species is in two contexts. Call close() to stop the pool and release the partitions' species.
+    '''
+
+    def __init__(self, engine_factory: Callable[[], RuleEngine] = RuleEngine,
+                 parallel_min_species: int = PARALLEL_MIN_SPECIES, max_workers: int | None = None) -> None:
+        '''
+        Initialize the PartitionedRuleEngine with no rules and no partitions.
+
+        Args:
+            engine_factory (Callable[[], RuleEngine]): Creates the engine of each partition. Defaults to RuleEngine.
+            parallel_min_species (int): Total species above which partitions run in parallel.
+                Defaults to PARALLEL_MIN_SPECIES.
+            max_workers (int | None): Threads in the pool. Defaults to the ThreadPoolExecutor default.
+        '''
+        self.engine_factory = engine_factory
+        self.parallel_min_species = parallel_min_species
+        self.max_workers = max_workers
+        self.rules: List[Callable[[Dict[str, Any]], None]] = []
+        self.engines: Dict[Hashable, RuleEngine] = {}
+        self.profiler: RuleProfiler | None = None
+        self.executor: ThreadPoolExecutor | None = None
+
+    def add_rule(self, rule: Callable[[Dict[str, Any]], None]) -> None:
+        '''
+        Add a new rule to every partition.
+
+        Args:
+            rule (Callable[[Dict[str, Any]], None]): A function representing the rule to add.
+        '''
+        self.rules.append(rule)
+        for engine in self.engines.values():
+            engine.add_rule(rule)
+
+    def engine(self, key: Hashable) -> RuleEngine:
+        '''
+        Return the engine of a partition, creating it on first use.
+
+        Args:
+            key (Hashable): The partition key, e.g. the forest name.
+
+        Returns:
+            RuleEngine: The partition's engine.
+        '''
+        engine = self.engines.get(key)
+        if engine is None:
+            engine = self.engines[key] = self.engine_factory()
+            for rule in self.rules:
+                engine.add_rule(rule)
+            engine.profiler = self.profiler
+        return engine
+
+    def evaluate(self, contexts: Dict[Hashable, Dict[str, Any]]) -> None:
+        '''
+        Evaluate all rules in each partition's context, in parallel if the world is large and no species
+        is in two contexts.
+
+        Args:
+            contexts (Dict[Hashable, Dict[str, Any]]): The context of each partition, by partition key.
+        '''
+        jobs = [(self.engine(key), context) for key, context in contexts.items()]
+        total = sum(len(context['species']) for context in contexts.values())
+        parallel = len(jobs) > 1 and total >= self.parallel_min_species
+        if not parallel or self._shared_species(contexts):
+            for engine, context in jobs:
+                engine.evaluate(context)
+            return
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='rules')
+        # Consume the results so errors from any partition are raised here
+        list(self.executor.map(lambda job: job[0].evaluate(job[1]), jobs))
+
+    @staticmethod
+    def _shared_species(contexts: Dict[Hashable, Dict[str, Any]]) -> bool:
+        '''Return whether any species is in more than one context, which rules out running them in parallel.'''
+        seen = set()
+        for context in contexts.values():
+            keys = {id(species) for species in context['species']}
+            if not seen.isdisjoint(keys):
+                return True
+            seen |= keys
+        return False
+
+    def close(self) -> None:
+        '''
+        Shut down the thread pool and close the partitions' engines. Partitions are created again on next use.
+        '''
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        for engine in self.engines.values():
+            if hasattr(engine, 'close'):
+                engine.close()
+        self.engines.clear()
+
+    def enable_profiling(self, profiler: RuleProfiler | None = None) -> RuleProfiler:
+        '''
+        Start recording per-rule timings from every partition into one profiler.
+
+        Args:
+            profiler (RuleProfiler | None): The profiler to record into. Defaults to a new one.
+
+        Returns:
+            RuleProfiler: The profiler being recorded into.
+        '''
+        self.profiler = profiler if profiler is not None else RuleProfiler()
+        for engine in self.engines.values():
+            engine.profiler = self.profiler
+        return self.profiler
+
+    def disable_profiling(self) -> RuleProfiler | None:
+        '''
+        Stop recording per-rule timings.
+
+        Returns:
+            RuleProfiler | None: The profiler that was being recorded into, if any.
+        '''
+        profiler, self.profiler = self.profiler, None
+        for engine in self.engines.values():
+            engine.profiler = None
+        return profiler
+
+    @contextmanager
+    def profile(self, profiler: RuleProfiler | None = None) -> Iterator[RuleProfiler]:
+        '''
+        Record per-rule timings from every partition for the duration of a with block.
+
+        Args:
+            profiler (RuleProfiler | None): The profiler to record into. Defaults to a new one.
+
+        Yields:
+            RuleProfiler: The profiler being recorded into.
+        '''
+        previous = self.profiler
+        try:
+            yield self.enable_profiling(profiler)
+        finally:
+            self.disable_profiling()
+            if previous is not None:
+                self.enable_profiling(previous)
+
+
+class IncrementalRuleEngine(RuleEngine):
+    '''
+    A rule engine that re-fires a rule only on the species whose inputs changed since it last ran there.
+    Rules declare their inputs and outputs with rule_dependencies; species report changes through Species.watch.
+    Undeclared and volatile rules run on every species, as in RuleEngine.
+    The engine tracks the species and resources of the context it last evaluated: entities that leave it are
+    untracked and unwatched. Call close() to release every entity when the engine is discarded.
+    Change reports may come from other threads (e.g. a prey evaluated in another partition), so the
+    bookkeeping is locked; rules themselves run outside the lock.
+    '''
+
+    def __init__(self) -> None:
+        '''
+        Initialize the IncrementalRuleEngine with no rules and nothing tracked.
+        '''
+        super().__init__()
+        self.scopes: List[tuple | None] = []  # Per rule, the attributes it depends on (see _scopes)
+        self.pending: List[set] = []  # Per rule, ids of the species it has to re-fire on
+        self.tracked: Dict[int, Any] = {}  # Species seen in a context, by id
+        self.resources: Dict[int, Any] = {}  # Resources seen in a context, by id
+        self.watched: Dict[int, Any] = {}  # Every entity this engine listens to, by id
+        self.predators: Dict[int, set] = {}  # Reverse prey index: id of a prey -> ids of its predators
+        self.indexed_prey: Dict[int, list] = {}  # Id of a predator -> the prey it is indexed under
+        self.exhaustive = False  # Set once an entity without Species.watch is seen; every rule then runs in full
+        self.running = None  # Index of the rule being fired
+        self.lock = threading.RLock()  # Guards the bookkeeping above against changes reported from other threads
+        self.last_stats: Dict[str, int] = {}
+        self.totals = dict.fromkeys(('evaluations', 'rules_fired', 'rules_skipped', 'entities_evaluated',
+                                     'entities_skipped'), 0)
+
+    def add_rule(self, rule: Callable[[Dict[str, Any]], None]) -> None:
+        '''
+        Add a new rule to the engine. It fires on every tracked species at the next evaluation.
+
+        Args:
+            rule (Callable[[Dict[str, Any]], None]): A function representing the rule to add.
+        '''
+        with self.lock:
+            super().add_rule(rule)
+            self.scopes.append(self._scopes(rule))
+            self.pending.append(set(self.tracked))
+
+    def mark_dirty(self, species: Any) -> None:
+        '''
+        Re-fire every rule on a species, e.g. after its prey list was changed in place.
+
+        Args:
+            species (Any): The species to re-evaluate.
+        '''
+        with self.lock:
+            self._index_prey(species)
+            for pending in self.pending:
+                pending.add(id(species))
+
+    @staticmethod
+    def _scopes(rule: Callable) -> tuple[frozenset, frozenset, frozenset] | None:
+        '''Return the attributes a rule depends on for the species itself, its prey and the resources,
+        or None if the rule must run on every species.'''
+        if getattr(rule, 'volatile', True):
+            return None
+        own, prey, resources = set(rule.writes), set(), set()
+        for name in rule.reads:
+            scope, _, attribute = name.rpartition('.')
+            {'': own, 'prey': prey, 'resources': resources}[scope].add(attribute)
+        return frozenset(own), frozenset(prey), frozenset(resources)
+
+    def _watch(self, entity: Any) -> None:
+        '''Start listening to an entity's changes.'''
+        if id(entity) in self.watched:
+            return
+        if not hasattr(entity, 'watch'):
+            self.exhaustive = True
+            return
+        self.watched[id(entity)] = entity
+        entity.watch(self._changed)
+
+    def _release(self, entity: Any) -> None:
+        '''Stop listening to an entity that is no longer tracked, a resource or the prey of a tracked species.'''
+        key = id(entity)
+        if key in self.tracked or key in self.resources or self.predators.get(key):
+            return
+        self.predators.pop(key, None)
+        if self.watched.pop(key, None) is not None:
+            entity.unwatch(self._changed)
+
+    def _unindex_prey(self, species: Any) -> None:
+        '''Remove a predator's entries from the reverse prey index.'''
+        key = id(species)
+        for prey in self.indexed_prey.pop(key, ()):
+            self.predators.get(id(prey), set()).discard(key)
+            self._release(prey)
+
+    def _index_prey(self, species: Any) -> None:
+        '''Bring a predator's entries in the reverse prey index up to date.'''
+        key = id(species)
+        previous = self.indexed_prey.get(key, ())
+        self.indexed_prey[key] = list(species.prey)
+        for prey in species.prey:
+            self._watch(prey)
+            self.predators.setdefault(id(prey), set()).add(key)
+        for prey in previous:
+            if all(prey is not current for current in species.prey):
+                self.predators.get(id(prey), set()).discard(key)
+                self._release(prey)
+
+    def untrack(self, species: Any) -> None:
+        '''
+        Stop tracking a species. It is unwatched unless it is still the prey of a tracked species.
+
+        Args:
+            species (Any): The species to forget.
+        '''
+        with self.lock:
+            key = id(species)
+            if self.tracked.pop(key, None) is None:
+                return
+            self._unindex_prey(species)
+            for pending in self.pending:
+                pending.discard(key)
+            self._release(species)
+
+    def close(self) -> None:
+        '''
+        Untrack every species and resource and stop listening to them all.
+        '''
+        with self.lock:
+            for species in list(self.tracked.values()):
+                self.untrack(species)
+            resources, self.resources = list(self.resources.values()), {}
+            for resource in resources:
+                self._release(resource)
+
+    def _changed(self, entity: Any, name: str) -> None:
+        '''
+        Mark the rules and species affected by a changed attribute.
+
+        Args:
+            entity (Any): The species or resource that changed.
+            name (str): The name of the changed attribute.
+        '''
+        key = id(entity)
+        with self.lock:
+            if name == 'prey' and key in self.tracked:
+                self._index_prey(entity)
+            for index, scopes in enumerate(self.scopes):
+                if scopes is None:
+                    continue
+                own, prey, resources = scopes
+                pending = self.pending[index]
+                # A rule's own writes are its results, not new inputs
+                if name in own and key in self.tracked and index != self.running:
+                    pending.add(key)
+                if name in prey:
+                    pending.update(self.predators.get(key, ()))
+                if name in resources and key in self.resources:
+                    pending.update(self.tracked)
+
+    def _track(self, context: Dict[str, Any]) -> None:
+        '''Track the species and resources of a context, dropping those that have left it.'''
+        current = {id(species) for species in context['species']}
+        for key in [key for key in self.tracked if key not in current]:
+            self.untrack(self.tracked[key])
+        current = {id(resource) for resource in context['resources']}
+        left = [resource for key, resource in self.resources.items() if key not in current]
+        for resource in left:
+            del self.resources[id(resource)]
+            self._release(resource)
+        if left:
+            for index, scopes in enumerate(self.scopes):
+                if scopes is not None and scopes[2]:
+                    self.pending[index].update(self.tracked)
+
+        for species in context['species']:
+            key = id(species)
+            if key not in self.tracked:
+                self.tracked[key] = species
+                self._watch(species)
+                self._index_prey(species)
+                for pending in self.pending:
+                    pending.add(key)
+        for resource in context['resources']:
+            key = id(resource)
+            if key not in self.resources:
+                self.resources[key] = resource
+                self._watch(resource)
+                for index, scopes in enumerate(self.scopes):
+                    if scopes is not None and scopes[2]:
+                        self.pending[index].update(self.tracked)
+
+    def evaluate(self, context: Dict[str, Any]) -> None:
+        '''
+        Evaluate the rules in the given context, each only on the species it has to re-fire on.
+
+        Args:
+            context (Dict[str, Any]): The context in which to evaluate the rules.
+        '''
+        with self.lock:
+            self._track(context)
+        species = context['species']
+        stats = dict.fromkeys(('rules_fired', 'rules_skipped', 'entities_evaluated', 'entities_skipped'), 0)
+        for index, rule in enumerate(self.rules):
+            with self.lock:
+                pending = self.pending[index]
+                if self.exhaustive or self.scopes[index] is None:
+                    subset = species
+                else:
+                    subset = [s for s in species if id(s) in pending] if pending else []
+                # Species marked while the rule runs stay pending for its next evaluation
+                self.pending[index] = pending.difference(map(id, subset)) if pending else set()
+
+            stats['entities_evaluated'] += len(subset)
+            stats['entities_skipped'] += len(species) - len(subset)
+            if not subset:
+                stats['rules_skipped'] += 1
+                continue
+            stats['rules_fired'] += 1
+            profiler = self.profiler
+            if profiler is not None:
+                start = time.perf_counter_ns()
+            self.running = index
+            try:
+                rule(context if subset is species else dict(context, species=subset))
+            finally:
+                self.running = None
+            if profiler is not None:
+                profiler.record(rule, time.perf_counter_ns() - start, len(subset))
+
+        self.last_stats = stats
+        self.totals['evaluations'] += 1
+        for name, count in stats.items():
+            self.totals[name] += count
+
+    def stats(self) -> Dict[str, Any]:
+        '''
+        Return how much work the engine skipped.
+
+        Returns:
+            Dict[str, Any]: Counts for the last evaluation and since the engine was created, with the share
+                of rule-species evaluations skipped.
+        '''
+        total = self.totals['entities_evaluated'] + self.totals['entities_skipped']
+        return {
+            'last': dict(self.last_stats),
+            'totals': dict(self.totals),
+            'skipped_share': self.totals['entities_skipped'] / total if total else 0.0,
+        }
+
+
+def rule_dependencies(reads: tuple = (), writes: tuple = (), volatile: bool = False) -> Callable:
+    '''
+    Declare what a rule reads and writes, so IncrementalRuleEngine can skip it when nothing it uses changed.
+
+    Args:
+        reads (tuple): Attributes the rule reads. Plain names are on the species being evaluated, 'prey.<name>'
+            on its prey and 'resources.<name>' on any resource in the context.
+        writes (tuple): Attributes the rule writes on the species being evaluated.
+        volatile (bool): Whether the result is not a pure function of the reads (e.g. random draws), so the
+            rule must run on every species every time. Defaults to False.
+
+    Returns:
+        Callable: A decorator that records the declaration on the rule.
+    '''
+    def declare(rule: Callable) -> Callable:
+        rule.reads = frozenset(reads)
+        rule.writes = frozenset(writes)
+        rule.volatile = volatile
+        return rule
+    return declare
 
 
 # Rules for Symbolic AI
+@rule_dependencies(reads=('has_prey', 'can_spawn', 'resources.current_population'), writes=('health',))
 def rule_resource_health(context: Dict[str, Any]) -> None:
     '''
     If resources are low, reduce species health.
@@ -59,6 +627,8 @@ def rule_resource_health(context: Dict[str, Any]) -> None:
                     species.health = 'Healthy'
 
 
+@rule_dependencies(reads=('current_population', 'starting_population', 'starting_aggression', 'aggression_y'),
+                   writes=('aggression_x', 'current_aggression'))
 def rule_self_aggression(context: Dict[str, Any]) -> None:
     '''
     Update species' aggression based on their own population changes.
@@ -79,6 +649,9 @@ def rule_self_aggression(context: Dict[str, Any]) -> None:
         species.current_aggression = species.starting_aggression + species.aggression_x + species.aggression_y
 
 
+@rule_dependencies(reads=('prey', 'starting_aggression', 'aggression_x', 'prey.current_population',
+                          'prey.starting_population'),
+                   writes=('aggression_y', 'current_aggression'))
 def rule_predator_prey(context: Dict[str, Any]) -> None:
     '''
     Update predator's aggression based on prey's population changes.
@@ -100,6 +673,8 @@ def rule_predator_prey(context: Dict[str, Any]) -> None:
             predator.current_aggression = predator.starting_aggression + predator.aggression_x + predator.aggression_y
 
 
+@rule_dependencies(reads=('health', 'current_population', 'starting_population', 'resources.current_population'),
+                   writes=('current_population',), volatile=True)
 def rule_reproduction(context: Dict[str, Any]) -> None:
     '''
     Allow species to reproduce if conditions are met.
@@ -117,4 +692,4 @@ def rule_reproduction(context: Dict[str, Any]) -> None:
                 species.current_population < species.starting_population and 
                 species.current_population > 1 and 
                 total_resource_population > 2):
-                species.current_population += 1
\ No newline at end of file
+                species.current_population += 1
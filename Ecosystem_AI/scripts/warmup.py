@@ -0,0 +1,35 @@
+'''
+Script: warmup.py
+Description: Implements model warm-up at load time. Every inference model is exercised at the batch sizes the
+             game uses, so the first hunt runs as fast as the rest.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import time
+import numpy as np
+
+# Constants
+INPUT_FEATURES = 2  # HP and Aggression
+WARMUP_BATCH_SIZES = (1, 64)  # Single hunts and a full inference service batch (MAX_BATCH_SIZE)
+
+
+def warm_up(model, batch_sizes: tuple = WARMUP_BATCH_SIZES) -> float:
+    '''
+    Run a model once at each batch size so lazy setup and first-call allocations happen now.
+
+    Args:
+        model: Any model with a predict method, and optionally predict_labels.
+        batch_sizes (tuple): Batch sizes to run. Defaults to WARMUP_BATCH_SIZES.
+
+    Returns:
+        float: Seconds spent warming up.
+    '''
+    start = time.perf_counter()
+    for batch_size in batch_sizes:
+        rows = np.full((batch_size, INPUT_FEATURES), 0.5)
+        model.predict(rows, verbose=0)
+        if hasattr(model, 'predict_labels'):
+            model.predict_labels(rows)
+    return time.perf_counter() - start
\ No newline at end of file
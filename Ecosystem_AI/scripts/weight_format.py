@@ -0,0 +1,184 @@
+'''
+Script: weight_format.py
+Description: Implements a compact, versioned file format for the classifier's Dense-layer weights, used for
+             the model cache. All arrays are little-endian float32, 64-byte aligned after a small header, so a
+             file can be memory-mapped and shared read-only between processes without deserializing a Keras
+             model. Ensembles are stored as their stacked 3-D kernels and 2-D biases.
+             Run from the project folder with: python -m scripts.weight_format export|info <path>
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import os
+import struct
+import sys
+import tempfile
+import zlib
+import numpy as np
+from scripts.numpy_model import NumpyModel
+from scripts.ensemble import EnsembleModel
+
+# Constants
+MAGIC = b'TFWT'  # Identifies a weights file
+FORMAT_VERSION = 3  # Bump when the layout changes; older readers refuse newer files. 2: CRC covers the header,
+# 3: arrays of up to three dimensions
+ALIGNMENT = 64  # Byte alignment of every array, one cache line
+DTYPE = np.dtype('<f4')  # Stored element type
+HEADER = struct.Struct('<4sHHI')  # Magic, version, array count, CRC32 of the file with this field zeroed
+CHECKSUM_OFFSET = 8  # Byte offset of the CRC32 field in HEADER
+ARRAY_ENTRY = struct.Struct('<QIIII')  # Byte offset, dimensions, then the shape padded with zeros to three
+LEGACY_ARRAY_ENTRY = struct.Struct('<QII')  # Versions 1 and 2: byte offset, rows, columns (0 columns for 1-D)
+MAX_DIMENSIONS = 3
+
+
+def _align(offset: int) -> int:
+    '''Round an offset up to the next ALIGNMENT boundary.'''
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _checksum(data) -> int:
+    '''Return the CRC32 of a whole file, header and array table included, with the checksum field read as zero.'''
+    checksum = zlib.crc32(data[:CHECKSUM_OFFSET])
+    checksum = zlib.crc32(bytes(4), checksum)
+    return zlib.crc32(data[CHECKSUM_OFFSET + 4:], checksum)
+
+
+def save_weights(path: str, weights: list[np.ndarray]) -> None:
+    '''
+    Write weights to a file, replacing it atomically so readers never see a partial file.
+
+    Args:
+        path (str): The file to write.
+        weights (list[np.ndarray]): 1-D to 3-D arrays, e.g. alternating kernels and biases.
+    '''
+    arrays = [np.ascontiguousarray(w, dtype=DTYPE) for w in weights]
+    for array in arrays:
+        if not 1 <= array.ndim <= MAX_DIMENSIONS:
+            raise ValueError(f'Only 1-D to {MAX_DIMENSIONS}-D arrays can be stored, got shape {array.shape}.')
+
+    # Lay out the arrays after the header, each on an aligned offset
+    offset = _align(HEADER.size + ARRAY_ENTRY.size * len(arrays))
+    entries = []
+    for array in arrays:
+        entries.append((offset, array.ndim, *array.shape, *(0,) * (MAX_DIMENSIONS - array.ndim)))
+        offset = _align(offset + array.nbytes)
+
+    data = bytearray(offset)
+    for (start, *_), array in zip(entries, arrays):
+        data[start:start + array.nbytes] = array.tobytes()
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(arrays), 0)
+    header += b''.join(ARRAY_ENTRY.pack(*entry) for entry in entries)
+    data[:len(header)] = header
+    struct.pack_into('<I', data, CHECKSUM_OFFSET, _checksum(data))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as weights_file:
+            weights_file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def load_weights(path: str, mmap: bool = True, verify: bool = True) -> list[np.ndarray]:
+    '''
+    Read weights from a file.
+
+    Args:
+        path (str): The file to read.
+        mmap (bool): Map the file instead of reading it. The arrays are then read-only views
+            that share pages with every other process mapping the same file. Defaults to True.
+        verify (bool): Check the CRC32 of the file. Defaults to True.
+
+    Returns:
+        list[np.ndarray]: The arrays, read-only, in the order they were saved.
+
+    Raises:
+        ValueError: If the file is not a weights file, is from a newer version or is corrupt.
+    '''
+    if mmap:
+        data = np.memmap(path, dtype=np.uint8, mode='r')
+    else:
+        with open(path, 'rb') as weights_file:
+            data = np.frombuffer(weights_file.read(), dtype=np.uint8)
+
+    if len(data) < HEADER.size:
+        raise ValueError(f'{path} is too short to be a weights file.')
+    magic, version, count, checksum = HEADER.unpack(data[:HEADER.size].tobytes())
+    if magic != MAGIC:
+        raise ValueError(f'{path} is not a weights file.')
+    if version > FORMAT_VERSION:
+        raise ValueError(f'{path} uses format version {version}, this reader supports up to {FORMAT_VERSION}.')
+
+    entry_format = ARRAY_ENTRY if version >= 3 else LEGACY_ARRAY_ENTRY
+    table_end = HEADER.size + entry_format.size * count
+    if len(data) < table_end:
+        raise ValueError(f'{path} is truncated.')
+    table = data[:table_end].tobytes()
+    entries = [entry_format.unpack_from(table, HEADER.size + i * entry_format.size) for i in range(count)]
+    if verify:
+        if version >= 2:
+            actual = _checksum(data)
+        else:  # Version 1 files only checksum the array data
+            actual = zlib.crc32(data[entries[0][0] if entries else len(data):])
+        if actual != checksum:
+            raise ValueError(f'{path} failed its checksum.')
+
+    weights = []
+    for offset, *layout in entries:
+        if version >= 3:
+            dimensions, *sizes = layout
+            shape = tuple(sizes[:dimensions])
+        else:
+            rows, columns = layout
+            shape = (rows,) if columns == 0 else (rows, columns)
+        end = offset + int(np.prod(shape)) * DTYPE.itemsize
+        if end > len(data):
+            raise ValueError(f'{path} is truncated.')
+        weights.append(data[offset:end].view(DTYPE).reshape(shape))
+    return weights
+
+
+def load_model(path: str, mmap: bool = True) -> NumpyModel | EnsembleModel:
+    '''
+    Load a model from a weights file. With mmap the model uses the mapped pages directly.
+
+    Args:
+        path (str): The file to read.
+        mmap (bool): Map the file instead of reading it. Defaults to True.
+
+    Returns:
+        NumpyModel | EnsembleModel: The model, an ensemble if the file holds stacked 3-D kernels.
+
+    Raises:
+        ValueError: If the file is not a weights file, is from a newer version or is corrupt.
+    '''
+    weights = load_weights(path, mmap)
+    if weights and weights[0].ndim == 3:
+        return EnsembleModel.from_stacked(weights)
+    return NumpyModel(weights)
+
+
+def main() -> None:
+    '''
+    Export the trained model to a weights file, or describe an existing one.
+    '''
+    if len(sys.argv) != 3 or sys.argv[1] not in ('export', 'info'):
+        print('Usage: python -m scripts.weight_format export|info <path>')
+        return
+
+    command, path = sys.argv[1:]
+    if command == 'export':
+        from scripts.neuralnetwork import load_or_train
+        save_weights(path, load_or_train().get_weights())
+    for i, array in enumerate(load_weights(path)):
+        print(f'{"kernel" if i % 2 == 0 else "bias":<6} {i // 2}: shape {array.shape}')
+    print(f'{os.path.getsize(path)} bytes')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+'''
+Script: helpers.py
+Description: Shared fixtures for the tests: small classifiers trained with the NumPy trainer on the built-in dataset.
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+from functools import lru_cache
+import numpy as np
+from scripts.numpy_model import NumpyModel
+from scripts.numpy_trainer import train_numpy
+from scripts.neuralnetwork import TRAINING_DATA, TRAINING_LABELS, HIDDEN_LAYERS, LEARNING_RATE
+
+# Constants
+TEST_EPOCHS = 200  # Epochs for the fixture models, enough to separate all three classes
+
+
+@lru_cache(maxsize=None)
+def trained_weights(seed: int = 0) -> tuple:
+    '''
+    Train the classifier once per seed.
+
+    Args:
+        seed (int): Seed for weight initialization. Defaults to 0.
+
+    Returns:
+        tuple: The weights in Keras order, read-only so tests cannot change the cached copy.
+    '''
+    weights = train_numpy(TRAINING_DATA, TRAINING_LABELS, HIDDEN_LAYERS, TEST_EPOCHS, LEARNING_RATE, seed=seed)
+    for array in weights:
+        array.flags.writeable = False
+    return tuple(weights)
+
+
+def trained_model(seed: int = 0) -> NumpyModel:
+    '''
+    Return a NumpyModel of the classifier trained with the given seed.
+
+    Args:
+        seed (int): Seed for weight initialization. Defaults to 0.
+
+    Returns:
+        NumpyModel: The model.
+    '''
+    return NumpyModel(list(trained_weights(seed)))
+
+
+def grid(hp_max: int = 150, aggression_max: int = 100, offset: float = 0.0) -> np.ndarray:
+    '''
+    Return the (HP, Aggression) grid scaled like model inputs.
+
+    Args:
+        hp_max (int): The highest HP value. Defaults to 150.
+        aggression_max (int): The highest aggression value. Defaults to 100.
+        offset (float): Added to every point in game units, e.g. 0.5 for points between grid points. Defaults to 0.
+
+    Returns:
+        np.ndarray: Rows of (HP, Aggression) divided by 100.
+    '''
+    hp, aggression = np.meshgrid(np.arange(hp_max + 1), np.arange(aggression_max + 1), indexing='ij')
+    return (np.stack([hp.ravel(), aggression.ravel()], axis=1) + offset) / 100.0
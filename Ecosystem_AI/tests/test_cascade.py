@@ -0,0 +1,76 @@
+'''
+Script: test_cascade.py
+Description: Checks that the CascadeModel makes the wrapped model's decisions, runs the model once per batch
+             and only on rows no rule decided, and drops rules that disagree with the model.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import unittest
+import numpy as np
+from scripts.cascade import CascadeModel, ClearCutRule, CLEAR_CUT_RULES
+from scripts.numpy_model import ActionLabel
+from helpers import trained_model, grid
+
+
+class CountingModel:
+    '''
+    Wraps a model and records the rows of every predict call.
+    '''
+
+    def __init__(self, model) -> None:
+        '''Wrap the model with an empty call log.'''
+        self.model = model
+        self.calls = []
+
+    def predict(self, test_data: np.ndarray, verbose: int = 0) -> np.ndarray:
+        '''Record the batch size and return the wrapped model's probabilities.'''
+        self.calls.append(len(test_data))
+        return self.model.predict(test_data, verbose=verbose)
+
+
+class CascadeModelTest(unittest.TestCase):
+    '''
+    Rule-decided and model-decided rows together must reproduce the model.
+    '''
+
+    def setUp(self) -> None:
+        self.model = trained_model()
+        self.counting = CountingModel(self.model)
+        self.cascade = CascadeModel(self.counting)
+        self.cascade.calibrate()
+        self.counting.calls.clear()
+
+    def test_matches_model(self) -> None:
+        rows = grid()
+        predictions = self.cascade.classify(rows)
+        np.testing.assert_array_equal(predictions.labels, self.model.predict_labels(rows))
+        np.testing.assert_array_equal(predictions.labels, np.argmax(predictions.probabilities, axis=1))
+        np.testing.assert_array_equal(self.cascade.predict_labels(rows), predictions.labels)
+
+    def test_model_runs_once_on_ambiguous_rows(self) -> None:
+        rows = grid()
+        self.cascade.classify(rows)
+        stats = self.cascade.stats()
+        self.assertEqual(len(self.counting.calls), 1)
+        self.assertEqual(self.counting.calls[0], len(rows) - stats['short_circuited'])
+        self.assertGreater(stats['short_circuited'], 0)
+        self.assertEqual(stats['model_calls'], 1)
+
+    def test_clear_cut_batch_skips_the_model(self) -> None:
+        predictions = self.cascade.classify(np.array([[0.1, 1.0], [1.5, 0.0]]))
+        np.testing.assert_array_equal(predictions.labels, [ActionLabel.ACTION, ActionLabel.NOTHING])
+        self.assertEqual(self.counting.calls, [])
+
+    def test_calibrate_drops_disagreeing_rules(self) -> None:
+        wrong = ClearCutRule('wrong', ActionLabel.WARNING, lambda hp, aggression: aggression >= hp * 0.8 + 20)
+        cascade = CascadeModel(self.model, (wrong,) + CLEAR_CUT_RULES)
+        agreement = cascade.calibrate()
+        self.assertLess(agreement['wrong'], 1.0)
+        self.assertNotIn(wrong, cascade.rules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+'''
+Script: test_decision_table.py
+Description: Checks that the DecisionTable returns the wrapped model's decisions on the grid and passes rows off
+             the grid or out of range to the model.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import unittest
+import numpy as np
+from scripts.decision_table import DecisionTable
+from scripts.neuralnetwork import AI_classify
+from helpers import trained_model, grid
+
+
+class DecisionTableTest(unittest.TestCase):
+    '''
+    Table lookups must match the model on the grid, and everything else must come from the model.
+    '''
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.model = trained_model()
+        cls.table = DecisionTable(cls.model)
+
+    def test_matches_model_on_the_grid(self) -> None:
+        rows = grid()
+        predictions = self.table.classify(rows)
+        np.testing.assert_array_equal(predictions.labels, self.model.predict_labels(rows))
+        np.testing.assert_allclose(predictions.probabilities, self.model.predict(rows), rtol=1e-6)
+        self.assertEqual(predictions.labels.dtype, np.int8)
+        self.assertEqual(predictions.probabilities.dtype, np.float32)
+
+    def test_falls_back_off_the_grid(self) -> None:
+        rows = np.array([[0.5, 0.15], [0.505, 0.15], [1.51, 0.2], [-0.01, 0.3], [0.8, 1.01], [1.5, 1.0]])
+        predictions = AI_classify(self.table, rows)
+        np.testing.assert_array_equal(predictions.labels, self.model.predict_labels(rows))
+        np.testing.assert_allclose(predictions.probabilities, self.model.predict(rows), rtol=1e-6)
+
+    def test_predict_and_labels_match_classify(self) -> None:
+        rows = grid(offset=0.5)[::53]
+        predictions = self.table.classify(rows)
+        np.testing.assert_array_equal(self.table.predict(rows), predictions.probabilities)
+        np.testing.assert_array_equal(self.table.predict_labels(rows), predictions.labels)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+'''
+Script: test_distill.py
+Description: Checks that the distilled TreePolicy reproduces the network's decisions on and off the grid,
+             and that its fast paths agree with each other.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import unittest
+import numpy as np
+from scripts.distill import distill, MIN_AGREEMENT, SCALAR_ROWS
+from scripts.neuralnetwork import AI_classify
+from helpers import trained_model, grid
+
+
+class TreePolicyTest(unittest.TestCase):
+    '''
+    The tree must agree with the network it was distilled from, on the grid and between grid points.
+    '''
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.model = trained_model()
+        cls.policy = distill(cls.model)
+
+    def test_agreement_on_and_off_the_grid(self) -> None:
+        self.assertGreaterEqual(self.policy.agreement, MIN_AGREEMENT)
+        self.assertGreaterEqual(self.policy.holdout_agreement, MIN_AGREEMENT)
+        # Quarter steps sit between grid points without landing on the tree's midpoint thresholds
+        quarter_steps = grid(149, 99, offset=0.25)
+        agreement = np.mean(self.policy.predict_labels(quarter_steps) == self.model.predict_labels(quarter_steps))
+        self.assertGreaterEqual(agreement, MIN_AGREEMENT)
+
+    def test_fast_paths_agree(self) -> None:
+        rows = np.random.default_rng(0).uniform(0, 1.5, size=(200, 2))
+        batched = self.policy.classify(rows)
+        for start in range(0, len(rows), SCALAR_ROWS // 2):
+            small = self.policy.classify(rows[start:start + SCALAR_ROWS // 2])
+            np.testing.assert_array_equal(small.labels, batched.labels[start:start + SCALAR_ROWS // 2])
+            np.testing.assert_array_equal(small.probabilities, batched.probabilities[start:start + SCALAR_ROWS // 2])
+        np.testing.assert_array_equal(batched.labels, [self.policy.decide(*row) for row in rows.tolist()])
+
+    def test_classify_matches_predict(self) -> None:
+        rows = grid()[::97]
+        predictions = AI_classify(self.policy, rows)
+        np.testing.assert_array_equal(predictions.probabilities, self.policy.predict(rows))
+        np.testing.assert_array_equal(predictions.labels, self.policy.predict_labels(rows))
+        self.assertEqual(predictions.labels.dtype, np.int8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+'''
+Script: test_ensemble.py
+Description: Checks that the batched EnsembleModel averages its members' probabilities, scores their
+             disagreement, and keeps its members through stacking and training.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import unittest
+import numpy as np
+from scripts.ensemble import EnsembleModel, member_weights, train_ensemble
+from scripts.numpy_model import NumpyModel
+from scripts.numpy_trainer import train_numpy
+from scripts.neuralnetwork import TRAINING_DATA, TRAINING_LABELS, HIDDEN_LAYERS, LEARNING_RATE
+from helpers import trained_weights, grid
+
+# Constants
+SEEDS = (0, 1, 2)  # One member per seed
+
+
+class EnsembleModelTest(unittest.TestCase):
+    '''
+    One batched pass over stacked weights must equal running every member on its own.
+    '''
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.members = [list(trained_weights(seed)) for seed in SEEDS]
+        cls.ensemble = EnsembleModel(cls.members)
+
+    def test_averages_member_probabilities(self) -> None:
+        rows = grid()
+        expected = np.mean([NumpyModel(member).predict(rows) for member in self.members], axis=0)
+        np.testing.assert_allclose(self.ensemble.predict(rows), expected, rtol=1e-5, atol=1e-7)
+        np.testing.assert_array_equal(self.ensemble.predict_labels(rows), np.argmax(expected, axis=1))
+
+    def test_disagreement(self) -> None:
+        rows = grid()
+        probabilities, disagreement = self.ensemble.predict_with_disagreement(rows)
+        member_labels = np.array([NumpyModel(member).predict_labels(rows) for member in self.members])
+        expected = np.mean(member_labels != np.argmax(probabilities, axis=1), axis=0)
+        np.testing.assert_allclose(disagreement, expected)
+        self.assertLessEqual(disagreement.max(), (len(SEEDS) - 1) / len(SEEDS))
+
+        unanimous = EnsembleModel([self.members[0]] * 2)
+        self.assertEqual(unanimous.predict_with_disagreement(rows)[1].max(), 0.0)
+
+    def test_stacked_round_trip(self) -> None:
+        stacked = self.ensemble.get_weights()
+        self.assertEqual(stacked[0].shape[0], len(SEEDS))
+        rebuilt = EnsembleModel.from_stacked(stacked)
+        rows = grid()[::13]
+        np.testing.assert_array_equal(rebuilt.predict(rows), self.ensemble.predict(rows))
+        self.assertEqual(len(member_weights(self.members[0])), 1)  # A single network is one member
+
+    def test_train_ensemble_members_follow_their_seeds(self) -> None:
+        ensemble = train_ensemble(TRAINING_DATA, TRAINING_LABELS, HIDDEN_LAYERS, 20, LEARNING_RATE, size=2,
+                                  early_stopping=False, workers=2)
+        self.assertEqual(ensemble.size, 2)
+        for seed, member in enumerate(member_weights(ensemble.get_weights())):
+            expected = train_numpy(TRAINING_DATA, TRAINING_LABELS, HIDDEN_LAYERS, 20, LEARNING_RATE, seed=seed)
+            for expected_array, actual in zip(expected, member):
+                np.testing.assert_array_equal(actual, expected_array)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+'''
+Script: test_incremental_rules.py
+Description: Checks that IncrementalRuleEngine reaches the same ecosystem state as RuleEngine, and that
+             species are watched only while an engine tracks them.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import copy
+import random
+import unittest
+from scripts.species_creation import Species, WatchedSpecies
+from scripts.symbolic_ai_test import (RuleEngine, IncrementalRuleEngine, rule_resource_health, rule_self_aggression,
+                                      rule_predator_prey, rule_reproduction)
+
+# Constants
+RULES = (rule_resource_health, rule_self_aggression, rule_predator_prey, rule_reproduction)
+STATE = ('current_population', 'health', 'aggression_x', 'aggression_y', 'current_aggression')  # Compared attributes
+TICKS = 60  # Evaluations per simulation
+
+
+def build_world(seed: int, count: int = 40) -> dict:
+    '''
+    Build a random context of species, each hunting up to two others, and two resources.
+
+    Args:
+        seed (int): Seed for the world's random layout.
+        count (int): Number of species. Defaults to 40.
+
+    Returns:
+        dict: A context with 'species' and 'resources' lists.
+    '''
+    rng = random.Random(seed)
+    species = [Species(f'Species {i}', starting_population=rng.randint(2, 20), aggression=rng.randint(0, 50),
+                       has_prey=rng.random() < 0.7, can_spawn=rng.random() < 0.8) for i in range(count)]
+    for predator in species:
+        if predator.has_prey:
+            predator.prey = rng.sample(species, rng.randint(1, 2))
+    resources = [Species(name, starting_population=10, has_prey=False) for name in ('Oak Trees', 'Berries')]
+    return {'species': species, 'resources': resources}
+
+
+def disturb(context: dict, rng: random.Random) -> None:
+    '''
+    Change the world the way play does between evaluations: hunts, resource gathering and diet changes.
+
+    Args:
+        context (dict): The context to change.
+        rng (random.Random): Source of the changes.
+    '''
+    for species in rng.sample(context['species'], 3):
+        species.current_population = max(0, species.current_population - rng.randint(1, 3))
+    resource = rng.choice(context['resources'])
+    resource.current_population = rng.randint(0, 10)
+    if rng.random() < 0.2:
+        predator = rng.choice([s for s in context['species'] if s.has_prey])
+        predator.prey = predator.prey + [rng.choice(context['species'])]
+
+
+def make_engine(engine_class: type) -> RuleEngine:
+    '''Return an engine of the given class with the built-in rules.'''
+    engine = engine_class()
+    for rule in RULES:
+        engine.add_rule(rule)
+    return engine
+
+
+class IncrementalEquivalenceTest(unittest.TestCase):
+    '''
+    IncrementalRuleEngine must leave every species exactly as RuleEngine does.
+    '''
+
+    def simulate(self, seed: int) -> None:
+        '''Run both engines on copies of one world with the same random draws and compare after every tick.'''
+        full_world = build_world(seed)
+        incremental_world = copy.deepcopy(full_world)
+        full, incremental = make_engine(RuleEngine), make_engine(IncrementalRuleEngine)
+        full_changes, incremental_changes = random.Random(seed), random.Random(seed)
+        for tick in range(TICKS):
+            random.seed(seed * 1000 + tick)
+            full.evaluate(full_world)
+            random.seed(seed * 1000 + tick)
+            incremental.evaluate(incremental_world)
+            for expected, actual in zip(full_world['species'], incremental_world['species']):
+                for name in STATE:
+                    self.assertEqual(getattr(expected, name), getattr(actual, name),
+                                     f'seed {seed}, tick {tick}: {expected.name}.{name}')
+            disturb(full_world, full_changes)
+            disturb(incremental_world, incremental_changes)
+        self.assertGreater(incremental.stats()['skipped_share'], 0)
+
+    def test_matches_rule_engine(self) -> None:
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                self.simulate(seed)
+
+
+class WatchLifecycleTest(unittest.TestCase):
+    '''
+    Species are watched only while an engine needs them, and copies are never watched.
+    '''
+
+    def test_unwatched_species_use_plain_writes(self) -> None:
+        species = Species('Deer', starting_population=10)
+        self.assertIs(type(species), Species)
+        species.watch(print)
+        self.assertIs(type(species), WatchedSpecies)
+        species.unwatch(print)
+        self.assertIs(type(species), Species)
+        self.assertNotIn('watchers', species.__dict__)
+
+    def test_copies_are_not_watched(self) -> None:
+        context = build_world(0)
+        engine = make_engine(IncrementalRuleEngine)
+        engine.evaluate(context)
+        copied = copy.deepcopy(context)
+        for species in copied['species'] + copied['resources']:
+            self.assertIs(type(species), Species)
+            self.assertNotIn('watchers', species.__dict__)
+
+    def assert_watching(self, engine: IncrementalRuleEngine, world: list, kept: list) -> None:
+        '''Check the engine tracks exactly the kept species and watches only them and their prey.'''
+        needed = {id(s) for s in kept} | {id(prey) for s in kept for prey in s.prey}
+        self.assertEqual(set(engine.tracked), {id(s) for s in kept})
+        for species in world:
+            self.assertEqual(id(species) in engine.watched, id(species) in needed, species.name)
+            self.assertEqual(type(species) is WatchedSpecies, id(species) in needed, species.name)
+        for pending in engine.pending:
+            self.assertLessEqual(pending, set(engine.tracked))
+
+    def test_species_leaving_the_context_are_released(self) -> None:
+        context = build_world(1)
+        engine = make_engine(IncrementalRuleEngine)
+        engine.evaluate(context)
+        # Species no longer in the context, and hunted by nothing that is, must be dropped
+        kept = context['species'][:10]
+        engine.evaluate({'species': kept, 'resources': context['resources']})
+        self.assert_watching(engine, context['species'], kept)
+        # So must prey a predator stops hunting
+        for predator in kept:
+            predator.prey = []
+        engine.evaluate({'species': kept, 'resources': context['resources']})
+        self.assert_watching(engine, context['species'], kept)
+
+    def test_close_releases_everything(self) -> None:
+        context = build_world(2)
+        engine = make_engine(IncrementalRuleEngine)
+        engine.evaluate(context)
+        engine.close()
+        self.assertFalse(engine.watched or engine.tracked or engine.resources or engine.predators)
+        for species in context['species'] + context['resources']:
+            self.assertIs(type(species), Species)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+'''
+Script: test_inference_service.py
+Description: Checks that the InferenceService coalesces requests into batches, answers every request with its
+             own row's result through the dispatcher, and survives missing models and model errors.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import threading
+import unittest
+import numpy as np
+from scripts.inference_service import InferenceService
+from scripts.numpy_model import ActionLabel
+from helpers import trained_model, grid
+
+# Constants
+TIMEOUT = 5.0  # Seconds to wait for the worker
+
+
+class RecordingDispatcher:
+    '''
+    Stands in for GuiDispatcher: runs posted callbacks straight away and remembers which thread posted them.
+    '''
+
+    def __init__(self) -> None:
+        '''Start with no posts.'''
+        self.threads = []
+
+    def post(self, callback, *args) -> None:
+        '''Record the posting thread and run the callback.'''
+        self.threads.append(threading.current_thread())
+        callback(*args)
+
+
+class BatchRecordingModel:
+    '''
+    Wraps a model, records the size of every batch and can be held until released.
+    '''
+
+    def __init__(self, model) -> None:
+        '''Wrap the model, initially released.'''
+        self.model = model
+        self.batches = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def predict(self, test_data: np.ndarray, verbose: int = 0) -> np.ndarray:
+        '''Wait until released, then record the batch and predict.'''
+        self.release.wait(TIMEOUT)
+        self.batches.append(len(test_data))
+        return self.model.predict(test_data)
+
+
+class InferenceServiceTest(unittest.TestCase):
+    '''
+    Requests must be batched, and each callback must get the result for its own row.
+    '''
+
+    def setUp(self) -> None:
+        self.dispatcher = RecordingDispatcher()
+        self.model = BatchRecordingModel(trained_model())
+        self.results = {}
+        self.done = threading.Event()
+
+    def make_service(self, get_model, **kwargs) -> InferenceService:
+        '''Start a service that is stopped when the test ends.'''
+        service = InferenceService(self.dispatcher, get_model, **kwargs)
+        self.addCleanup(service.worker.join, TIMEOUT)
+        self.addCleanup(service.stop)
+        return service
+
+    def submit_all(self, service: InferenceService, rows: np.ndarray) -> None:
+        '''Submit every row, recording each answer under the row's index.'''
+        def answer(index: int):
+            '''Return the callback for one row.'''
+            def callback(action, probability) -> None:
+                self.results[index] = (action, probability)
+                if len(self.results) == len(rows):
+                    self.done.set()
+            return callback
+        for index, row in enumerate(rows):
+            service.submit(row, answer(index))
+        self.assertTrue(self.done.wait(TIMEOUT))
+
+    def test_results_follow_their_requests(self) -> None:
+        rows = grid()[::151]  # Covers all three actions
+        service = self.make_service(lambda: self.model, batch_window=0.05)
+        self.model.release.clear()  # Hold the first batch so the rest queue up behind it
+        service.submit(rows[0], lambda action, probability: None)
+        threading.Timer(0.1, self.model.release.set).start()
+        self.submit_all(service, rows)
+
+        expected = self.model.model.predict(rows)
+        for index in range(len(rows)):
+            action, probability = self.results[index]
+            self.assertIsInstance(action, ActionLabel)
+            self.assertEqual(action, np.argmax(expected[index]))
+            np.testing.assert_allclose(probability, expected[index], rtol=1e-6)
+        self.assertGreater(max(self.model.batches), 1)
+        self.assertLessEqual(max(self.model.batches), service.max_batch_size)
+        self.assertNotIn(threading.current_thread(), self.dispatcher.threads)
+
+        stats = service.stats()
+        self.assertEqual(stats['completed'], len(rows) + 1)
+        self.assertEqual(stats['batches'], len(self.model.batches))
+
+    def test_batches_are_capped(self) -> None:
+        rows = grid()[:40]
+        service = self.make_service(lambda: self.model, batch_window=0.05, max_batch_size=8)
+        self.model.release.clear()
+        service.submit(rows[0], lambda action, probability: None)
+        threading.Timer(0.1, self.model.release.set).start()
+        self.submit_all(service, rows)
+        self.assertEqual(max(self.model.batches), 8)
+
+    def test_no_model_answers_none(self) -> None:
+        service = self.make_service(lambda: None)
+        self.submit_all(service, grid()[:3])
+        self.assertEqual(set(self.results.values()), {(None, None)})
+
+    def test_model_error_answers_none_and_keeps_running(self) -> None:
+        class Broken:
+            '''A model whose every call fails.'''
+
+            def predict(self, test_data: np.ndarray, verbose: int = 0) -> np.ndarray:
+                '''Fail.'''
+                raise RuntimeError('broken')
+        models = [Broken()]
+        service = self.make_service(lambda: models[0])
+        self.submit_all(service, grid()[:2])
+        self.assertEqual(set(self.results.values()), {(None, None)})
+
+        models[0] = self.model.model
+        self.results.clear()
+        self.done.clear()
+        self.submit_all(service, grid()[:2])
+        self.assertIsInstance(self.results[0][0], ActionLabel)
+
+
+if __name__ == '__main__':
+    unittest.main()
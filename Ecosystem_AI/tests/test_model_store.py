@@ -0,0 +1,93 @@
+'''
+Script: test_model_store.py
+Description: Checks that the model cache returns what was saved, discards corrupt entries and evicts the
+             least recently used entries without ever evicting the one just saved.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+from scripts.ensemble import EnsembleModel
+from scripts.model_store import ModelStore, ENTRY_SUFFIX
+from scripts.numpy_model import NumpyModel
+from helpers import trained_weights
+
+
+class ModelStoreTest(unittest.TestCase):
+    '''
+    Cached entries must round-trip, fail closed when damaged and stay within the store's limits.
+    '''
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = ModelStore(self.directory.name)
+        self.weights = list(trained_weights())
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def entries(self) -> set[str]:
+        '''Return the keys of the entries on disk.'''
+        return {name[:-len(ENTRY_SUFFIX)] for name in os.listdir(self.directory.name) if name.endswith(ENTRY_SUFFIX)}
+
+    def test_round_trip(self) -> None:
+        self.assertIsNone(self.store.load('missing'))
+        self.store.save('single', self.weights)
+        for expected, actual in zip(self.weights, self.store.load('single')):
+            np.testing.assert_array_equal(actual, expected)
+        self.assertIsInstance(self.store.load_model('single'), NumpyModel)
+
+        ensemble = EnsembleModel([self.weights, list(trained_weights(1))])
+        self.store.save('ensemble', ensemble.get_weights())
+        self.assertIsInstance(self.store.load_model('ensemble'), EnsembleModel)
+
+    def test_corrupt_entry_is_discarded(self) -> None:
+        self.store.save('key', self.weights)
+        path = os.path.join(self.directory.name, 'key' + ENTRY_SUFFIX)
+        with open(path, 'r+b') as entry:
+            entry.seek(os.path.getsize(path) // 2)
+            entry.write(b'\xff\xff')
+        self.assertIsNone(self.store.load_model('key'))
+        self.assertFalse(os.path.exists(path))
+
+    def test_fingerprint_changes_with_hyperparameters(self) -> None:
+        data, labels = np.zeros((4, 2)), np.eye(3)[[0, 1, 2, 0]]
+        base = ModelStore.fingerprint(data, labels, (2, 3), {'epochs': 10})
+        self.assertEqual(base, ModelStore.fingerprint(data, labels, (2, 3), {'epochs': 10}))
+        self.assertNotEqual(base, ModelStore.fingerprint(data, labels, (2, 3), {'epochs': 11}))
+        self.assertNotEqual(base, ModelStore.fingerprint(data + 1, labels, (2, 3), {'epochs': 10}))
+
+    def test_evicts_least_recently_used(self) -> None:
+        store = ModelStore(self.directory.name, max_entries=2)
+        now = time.time()
+        store.save('used', self.weights)
+        store.save('old', self.weights)
+        os.utime(os.path.join(self.directory.name, 'used' + ENTRY_SUFFIX), (now - 100, now - 100))
+        os.utime(os.path.join(self.directory.name, 'old' + ENTRY_SUFFIX), (now - 50, now - 50))
+        store.load('used')  # Loading marks it as the most recently used, so 'old' goes first
+        store.save('new', self.weights)
+        self.assertEqual(self.entries(), {'used', 'new'})
+
+    def test_fresh_entry_never_evicted(self) -> None:
+        store = ModelStore(self.directory.name, max_bytes=1)
+        store.save('first', self.weights)
+        self.assertEqual(self.entries(), {'first'})
+        store.save('second', self.weights)
+        self.assertEqual(self.entries(), {'second'})
+
+    def test_legacy_entries_are_removed(self) -> None:
+        legacy = os.path.join(self.directory.name, 'old.npz')
+        with open(legacy, 'wb') as entry:
+            entry.write(b'PK')
+        self.store.save('key', self.weights)
+        self.assertFalse(os.path.exists(legacy))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+'''
+Script: test_numpy_model.py
+Description: Checks that the NumPy forward pass reproduces the trainer's forward pass and, where TensorFlow is
+             installed, the Keras model carrying the same weights.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import importlib.util
+import unittest
+import numpy as np
+from scripts.numpy_model import NumpyModel, ActionLabel, ACTIONS
+from scripts.numpy_trainer import forward
+from scripts.neuralnetwork import AI_classify
+from helpers import trained_weights, trained_model, grid
+
+# Constants
+HAS_TENSORFLOW = importlib.util.find_spec('tensorflow') is not None
+
+
+class NumpyModelTest(unittest.TestCase):
+    '''
+    NumpyModel must compute exactly what the networks it copies compute.
+    '''
+
+    def test_matches_trainer_forward_pass(self) -> None:
+        rows = grid()
+        expected = forward(list(trained_weights()), rows)[-1]
+        np.testing.assert_allclose(trained_model().predict(rows), expected, rtol=1e-5, atol=1e-7)
+
+    @unittest.skipUnless(HAS_TENSORFLOW, 'TensorFlow is not installed')
+    def test_matches_keras(self) -> None:
+        from scripts.neuralnetwork import build_keras_model
+        weights = list(trained_weights())
+        keras_model = build_keras_model(weights)
+        rows = grid()[::7].astype(np.float32)
+        np.testing.assert_allclose(NumpyModel.from_keras(keras_model).predict(rows),
+                                   keras_model.predict(rows, verbose=0), rtol=1e-4, atol=1e-6)
+
+    def test_get_weights_round_trip(self) -> None:
+        model = trained_model()
+        for expected, actual in zip(trained_weights(), model.get_weights()):
+            np.testing.assert_array_equal(actual, expected)
+
+    def test_single_row_and_labels(self) -> None:
+        model = trained_model()
+        row = np.array([0.5, 0.15])
+        self.assertEqual(model.predict(row).shape, (1, len(ACTIONS)))
+        predictions = AI_classify(model, row[np.newaxis, :])
+        self.assertEqual(predictions.labels.dtype, np.int8)
+        self.assertEqual(str(ActionLabel(int(predictions.labels[0]))), ACTIONS[model.predict_labels(row)[0]])
+
+    def test_rejects_mismatched_weights(self) -> None:
+        weights = list(trained_weights())
+        with self.assertRaises(ValueError):
+            NumpyModel(weights[:-1])
+        with self.assertRaises(ValueError):
+            NumpyModel(weights[:-1] + [np.zeros(len(ACTIONS) + 1, dtype=np.float32)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+'''
+Script: test_numpy_trainer.py
+Description: Checks the NumPy trainer's gradients against finite differences, that it learns the built-in
+             dataset, and that early stopping halts training and keeps the best weights.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import unittest
+import numpy as np
+from scripts.convergence import ConvergenceMonitor
+from scripts.metrics import MemorySink
+from scripts.numpy_trainer import init_weights, loss_and_gradients, train_numpy
+from scripts.neuralnetwork import TRAINING_DATA, TRAINING_LABELS, HIDDEN_LAYERS, LEARNING_RATE
+from helpers import trained_weights, TEST_EPOCHS
+
+
+class NumpyTrainerTest(unittest.TestCase):
+    '''
+    The trainer's gradients must be right, and training must fit the dataset.
+    '''
+
+    def test_gradients_match_finite_differences(self) -> None:
+        weights = [w.astype(np.float64) for w in init_weights((2, 5, 4, 3), seed=0)]
+        weights[1] += 0.1  # Keep every ReLU active or inactive away from its kink
+        _, _, gradients = loss_and_gradients(weights, TRAINING_DATA, TRAINING_LABELS)
+        rng = np.random.default_rng(0)
+        step = 1e-6
+        for array, gradient in zip(weights, gradients):
+            for index in [tuple(rng.integers(0, size) for size in array.shape) for _ in range(4)]:
+                original = array[index]
+                array[index] = original + step
+                above = loss_and_gradients(weights, TRAINING_DATA, TRAINING_LABELS)[0]
+                array[index] = original - step
+                below = loss_and_gradients(weights, TRAINING_DATA, TRAINING_LABELS)[0]
+                array[index] = original
+                self.assertAlmostEqual(gradient[index], (above - below) / (2 * step), delta=1e-4)
+
+    def test_learns_the_dataset(self) -> None:
+        loss, accuracy, _ = loss_and_gradients(list(trained_weights()), TRAINING_DATA, TRAINING_LABELS)
+        self.assertEqual(accuracy, 1.0)
+        initial_loss = loss_and_gradients(init_weights((2, *HIDDEN_LAYERS, 3), seed=0), TRAINING_DATA,
+                                          TRAINING_LABELS)[0]
+        self.assertLess(loss, initial_loss / 2)
+
+    def test_same_seed_same_weights(self) -> None:
+        again = train_numpy(TRAINING_DATA, TRAINING_LABELS, HIDDEN_LAYERS, TEST_EPOCHS, LEARNING_RATE, seed=0)
+        for expected, actual in zip(trained_weights(), again):
+            np.testing.assert_array_equal(actual, expected)
+
+
+class EarlyStoppingTest(unittest.TestCase):
+    '''
+    The monitor must stop on target or plateau and hand back the weights of the best epoch.
+    '''
+
+    def test_stops_on_plateau_and_keeps_best(self) -> None:
+        monitor = ConvergenceMonitor(patience=3, target_loss=0.0)
+        losses = [1.0, 0.5, 0.4, 0.45, 0.41, 0.4]
+        stopped = [monitor.update(epoch, loss, 0.5, lambda epoch=epoch: [np.full(2, epoch)])
+                   for epoch, loss in enumerate(losses)]
+        self.assertEqual(stopped, [False] * 5 + [True])
+        self.assertEqual(monitor.stop_reason, 'loss plateaued')
+        self.assertEqual(monitor.best_epoch, 2)
+        np.testing.assert_array_equal(monitor.best_weights[0], [2, 2])
+
+    def test_ignores_improvements_below_min_delta(self) -> None:
+        monitor = ConvergenceMonitor(patience=2, min_delta=0.1, target_loss=0.0)
+        self.assertFalse(monitor.update(0, 1.0, 0.5, lambda: [np.zeros(1)]))
+        self.assertFalse(monitor.update(1, 0.95, 0.5, lambda: [np.zeros(1)]))
+        self.assertTrue(monitor.update(2, 0.91, 0.5, lambda: [np.zeros(1)]))
+        self.assertEqual(monitor.best_epoch, 0)
+
+    def test_stops_training_at_target(self) -> None:
+        monitor = ConvergenceMonitor(target_accuracy=1.0, target_loss=0.3)
+        sink = MemorySink()
+        weights = train_numpy(TRAINING_DATA, TRAINING_LABELS, HIDDEN_LAYERS, 1000, LEARNING_RATE, seed=0,
+                              monitor=monitor, sinks=[sink])
+        self.assertEqual(monitor.stop_reason, 'target reached')
+        self.assertLess(monitor.stopped_epoch, 999)
+        self.assertEqual(len(sink.as_arrays()['loss']), monitor.stopped_epoch + 1)
+        # The returned weights are the best epoch's, which score the best recorded loss
+        loss, _, _ = loss_and_gradients(weights, TRAINING_DATA, TRAINING_LABELS)
+        self.assertAlmostEqual(loss, monitor.best_loss, places=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
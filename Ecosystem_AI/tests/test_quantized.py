@@ -0,0 +1,63 @@
+'''
+Script: test_quantized.py
+Description: Checks that the int8 model makes the float model's decisions, that its single-pass classify matches
+             predict, and that quantize rejects a model below the agreement threshold.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import unittest
+import numpy as np
+from scripts.numpy_model import NumpyModel
+from scripts.quantized import QuantizedModel, quantize, calibration_grid, QUANT_MIN_AGREEMENT
+from helpers import trained_model, grid
+
+
+class QuantizedModelTest(unittest.TestCase):
+    '''
+    The int8 model must agree with the float model's argmax, and quantize must refuse one that does not.
+    '''
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.model = trained_model()
+        cls.quantized = quantize(cls.model)
+
+    def test_agrees_with_float_argmax(self) -> None:
+        self.assertIsInstance(self.quantized, QuantizedModel)
+        self.assertGreaterEqual(self.quantized.agreement, QUANT_MIN_AGREEMENT)
+        # Points between grid points were not used for calibration
+        rows = grid(149, 99, offset=0.25)
+        agreement = np.mean(self.quantized.predict_labels(rows) == self.model.predict_labels(rows))
+        self.assertGreaterEqual(agreement, QUANT_MIN_AGREEMENT)
+
+    def test_classify_matches_predict(self) -> None:
+        rows = calibration_grid()[::37]
+        predictions = self.quantized.classify(rows)
+        np.testing.assert_array_equal(predictions.labels, self.quantized.predict_labels(rows))
+        np.testing.assert_allclose(predictions.probabilities, self.quantized.predict(rows), rtol=1e-6)
+        self.assertEqual(predictions.labels.dtype, np.int8)
+        self.assertEqual(predictions.probabilities.dtype, np.float32)
+
+    def test_dequantized_weights_are_close(self) -> None:
+        for dequantized, original in zip(self.quantized.get_weights()[0::2], self.model.get_weights()[0::2]):
+            np.testing.assert_allclose(dequantized, original, atol=np.max(np.abs(original)) / 127)
+
+    def test_accepted_at_threshold(self) -> None:
+        self.assertIsInstance(quantize(self.model, min_agreement=self.quantized.agreement), QuantizedModel)
+
+    def test_rejected_below_threshold(self) -> None:
+        # Make Warning's logit differ from Action's by far less than one int8 step, so rounding decides between them
+        weights = [np.array(w) for w in self.model.get_weights()]
+        noise = np.random.default_rng(0).standard_normal(weights[-2].shape[0]).astype(np.float32)
+        weights[-2][:, 1] = weights[-2][:, 0] + 1e-4 * noise
+        weights[-1][1] = weights[-1][0]
+        weights[-1][2] = -100.0  # Never Nothing, so only the near-tie matters
+        near_tie = NumpyModel(weights)
+        self.assertIs(quantize(near_tie), near_tie)
+
+
+if __name__ == '__main__':
+    unittest.main()
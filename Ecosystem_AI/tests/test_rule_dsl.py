@@ -0,0 +1,162 @@
+'''
+Script: test_rule_dsl.py
+Description: Checks that the rules compiled from rules.toml leave species exactly as the built-in rules do,
+             in RuleEngine, ArrayRuleEngine and IncrementalRuleEngine, and that the validator rejects specs
+             that would write anything but plain attribute reads and writes into the generated code.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import copy
+import random
+import unittest
+from unittest import mock
+from scripts.rule_dsl import load_rules, compile_rule, validate, RuleSpecError, tomllib
+from scripts.species_arrays import ArrayRuleEngine
+from scripts.symbolic_ai_test import (RuleEngine, IncrementalRuleEngine, rule_resource_health, rule_self_aggression,
+                                      rule_predator_prey, rule_reproduction)
+from test_incremental_rules import build_world, disturb, STATE
+
+# Constants
+BUILT_INS = {'resource_health': rule_resource_health, 'predator_prey': rule_predator_prey,
+             'self_aggression': rule_self_aggression, 'reproduction': rule_reproduction}
+TICKS = 30  # Evaluations per simulation
+CONDITION = {'attr': 'health', 'op': '==', 'value': 'Healthy'}  # A valid species condition
+
+
+@unittest.skipIf(tomllib is None, 'Loading rule files needs Python 3.11 or higher (tomllib)')
+class RuleFileTest(unittest.TestCase):
+    '''
+    Each rule of rules.toml must reproduce its built-in rule.
+    '''
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rules = {rule.__name__: rule for rule in load_rules()}
+
+    def simulate(self, expected_rules: list, actual_engine: RuleEngine, seed: int) -> None:
+        '''Run the built-in rules and an engine with file rules on copies of one world and compare every tick.'''
+        expected_world = build_world(seed)
+        actual_world = copy.deepcopy(expected_world)
+        expected_engine = RuleEngine()
+        for rule in expected_rules:
+            expected_engine.add_rule(rule)
+        expected_changes, actual_changes = random.Random(seed), random.Random(seed)
+        for tick in range(TICKS):
+            expected_engine.evaluate(expected_world)
+            actual_engine.evaluate(actual_world)
+            for expected, actual in zip(expected_world['species'], actual_world['species']):
+                for name in STATE + ('health',):
+                    self.assertEqual(getattr(expected, name), getattr(actual, name),
+                                     f'tick {tick}: {expected.name}.{name}')
+            disturb(expected_world, expected_changes)
+            disturb(actual_world, actual_changes)
+
+    def test_covers_the_built_ins(self) -> None:
+        self.assertEqual(set(self.rules), set(BUILT_INS))
+
+    def test_deterministic_rules_match(self) -> None:
+        names = ('resource_health', 'predator_prey', 'self_aggression')
+        for engine_class in (RuleEngine, IncrementalRuleEngine, ArrayRuleEngine):
+            for seed in range(3):
+                with self.subTest(engine=engine_class.__name__, seed=seed):
+                    engine = engine_class()
+                    for name in names:
+                        engine.add_rule(self.rules[name])
+                    self.simulate([BUILT_INS[name] for name in names], engine, seed)
+
+    def test_reproduction_matches_when_every_draw_succeeds(self) -> None:
+        # The two versions draw differently, so compare them with every draw coming out in favour
+        spec = dict(self.rules['reproduction'].spec, chance=1.0)
+        engine = RuleEngine()
+        engine.add_rule(compile_rule(spec))
+        with mock.patch('random.randint', return_value=1):
+            for seed in range(3):
+                with self.subTest(seed=seed):
+                    self.simulate([rule_reproduction], engine, seed)
+
+    def test_vectorized_versions_exist(self) -> None:
+        for name, rule in self.rules.items():
+            self.assertIsNotNone(rule.vectorized, name)
+
+
+class ValidatorTest(unittest.TestCase):
+    '''
+    Specs must be rejected before anything outside plain attribute access reaches the generated code.
+    '''
+
+    def assert_rejected(self, **spec) -> None:
+        '''Check that a spec built from the keyword arguments is rejected by validate and compile_rule.'''
+        spec.setdefault('name', 'checked')
+        with self.assertRaises(RuleSpecError):
+            validate(spec)
+        with self.assertRaises(RuleSpecError):
+            compile_rule(spec)
+
+    def test_accepts_a_plain_rule(self) -> None:
+        spec = validate({'name': 'checked', 'when': [CONDITION], 'set': {'aggression_x': 1}})
+        self.assertEqual(spec['set'], {'aggression_x': 1})
+        self.assertTrue(callable(compile_rule(spec)))
+
+    def test_rejects_rule_names(self) -> None:
+        for name in (None, 3, '', 'two words', 'f(x)', 'x; import os', 'class', 'lambda',
+                     'random', 'resources', 'context', 'sum', 'any', 'all'):
+            with self.subTest(name=name):
+                self.assert_rejected(name=name)
+
+    def test_rejects_unknown_keys(self) -> None:
+        self.assert_rejected(exec='print(1)')
+        self.assert_rejected(code={'health': 'Healthy'})
+
+    def test_rejects_attributes(self) -> None:
+        for attr in ('x or __import__("os")', 'health.upper()', 'prey[0]', 'health\nimport os', 'not',
+                     '__class__', '__dict__', '_private', 3, None):
+            with self.subTest(attr=attr):
+                self.assert_rejected(when=[dict(CONDITION, attr=attr)])
+                self.assert_rejected(when=[dict(CONDITION, value=None, other=attr)])
+                self.assert_rejected(**{'if': [dict(CONDITION, attr=attr)]})
+                self.assert_rejected(set={attr: 1})
+                self.assert_rejected(add={attr: 1})
+                self.assert_rejected(sum={attr: ['aggression_x']})
+                self.assert_rejected(sum={'current_aggression': [attr]})
+                self.assert_rejected(band={'set': attr, 'bands': [[0, 100, 1]]})
+
+    def test_rejects_operators_and_calls(self) -> None:
+        for op in ('in', 'is', 'and', '+', '<= __import__("os") or 1 <', None):
+            with self.subTest(op=op):
+                self.assert_rejected(when=[dict(CONDITION, op=op)])
+
+    def test_rejects_non_literal_values(self) -> None:
+        for value in ([1], {'a': 1}, None, print, object()):
+            with self.subTest(value=value):
+                self.assert_rejected(when=[dict(CONDITION, value=value)])
+                self.assert_rejected(set={'health': value})
+                self.assert_rejected(band={'set': 'health', 'bands': [[0, 100, value]]})
+                self.assert_rejected(band={'set': 'health', 'bands': [], 'default': value})
+
+    def test_string_values_stay_literals(self) -> None:
+        # A string that looks like code is written into the generated function as a string literal
+        rule = compile_rule({'name': 'checked', 'set': {'health': "' + __import__('os').getcwd() + '"}})
+        species = build_world(0)['species'][0]
+        rule({'species': [species], 'resources': []})
+        self.assertEqual(species.health, "' + __import__('os').getcwd() + '")
+
+    def test_rejects_bands_and_chances(self) -> None:
+        self.assert_rejected(band={'of': 'predator', 'set': 'health', 'bands': []})
+        self.assert_rejected(band={'set': 'health', 'bands': [['0', 100, 1]]})
+        self.assert_rejected(band={'set': 'health', 'bands': [[0, True, 1]]})
+        for chance in (-0.1, 1.5, '0.5', True):
+            with self.subTest(chance=chance):
+                self.assert_rejected(chance=chance)
+
+    def test_rejects_misplaced_resource_conditions(self) -> None:
+        resource = {'attr': 'current_population', 'op': '>', 'value': 0, 'resources': 'any'}
+        self.assert_rejected(**{'if': [resource]})
+        self.assert_rejected(when=[dict(resource, resources='max')])
+        self.assert_rejected(when=[dict(resource, value=None, other='starting_population')])
+
+
+if __name__ == '__main__':
+    unittest.main()
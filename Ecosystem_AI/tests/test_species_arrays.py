@@ -0,0 +1,78 @@
+'''
+Script: test_species_arrays.py
+Description: Checks that the vectorized rules of ArrayRuleEngine leave species as the object rules do, and that
+             the engine keeps its arrays while the species set is unchanged.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import copy
+import random
+import unittest
+from scripts.species_arrays import ArrayRuleEngine
+from scripts.symbolic_ai_test import RuleEngine, rule_resource_health, rule_self_aggression, rule_predator_prey
+from test_incremental_rules import build_world, disturb, STATE
+
+# Constants
+RULES = (rule_resource_health, rule_self_aggression, rule_predator_prey)  # rule_reproduction draws differently
+TICKS = 30  # Evaluations per simulation
+
+
+def make_engine(engine: RuleEngine) -> RuleEngine:
+    '''Add the deterministic built-in rules to an engine and return it.'''
+    for rule in RULES:
+        engine.add_rule(rule)
+    return engine
+
+
+class ArrayRuleEngineTest(unittest.TestCase):
+    '''
+    Array rules must match the object rules, across ticks with the world changing in between.
+    '''
+
+    def assert_same_state(self, expected_world: dict, actual_world: dict, message: str) -> None:
+        '''Compare every compared attribute of both worlds' species.'''
+        for expected, actual in zip(expected_world['species'], actual_world['species']):
+            for name in STATE + ('health',):
+                self.assertEqual(getattr(expected, name), getattr(actual, name), f'{message}: {expected.name}.{name}')
+
+    def test_matches_object_rules(self) -> None:
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                object_world = build_world(seed)
+                array_world = copy.deepcopy(object_world)
+                objects, arrays = make_engine(RuleEngine()), make_engine(ArrayRuleEngine(seed=seed))
+                object_changes, array_changes = random.Random(seed), random.Random(seed)
+                for tick in range(TICKS):
+                    objects.evaluate(object_world)
+                    arrays.evaluate(array_world)
+                    self.assert_same_state(object_world, array_world, f'seed {seed}, tick {tick}')
+                    disturb(object_world, object_changes)
+                    disturb(array_world, array_changes)
+
+    def test_arrays_kept_until_species_change(self) -> None:
+        world = build_world(0)
+        engine = make_engine(ArrayRuleEngine(seed=0))
+        engine.evaluate(world)
+        state = engine.state
+        # Population changes between ticks are reloaded into the same arrays
+        world['species'][0].current_population = 1
+        engine.evaluate(world)
+        self.assertIs(engine.state, state)
+        self.assertEqual(state.current_population[0], 1)
+        # A new prey, or a species leaving, rebuilds them
+        hunter = next(s for s in world['species'] if s.has_prey)
+        hunter.prey = hunter.prey + [world['species'][-1]]
+        engine.evaluate(world)
+        self.assertIsNot(engine.state, state)
+        state = engine.state
+        engine.evaluate({'species': world['species'][1:], 'resources': world['resources']})
+        self.assertIsNot(engine.state, state)
+        engine.close()
+        self.assertIsNone(engine.state)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+'''
+Script: test_weight_format.py
+Description: Checks that weights files round-trip, that corruption and newer versions are refused, and that
+             files written by older versions still load.
+             Run from the project folder with: python -m unittest discover tests
+Author: Patrick Davis
+Date: October 18, 2026
+Version: 1.0
+'''
+
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+import numpy as np
+from scripts.ensemble import EnsembleModel
+from scripts.numpy_model import NumpyModel
+from scripts.weight_format import (save_weights, load_weights, load_model, HEADER, LEGACY_ARRAY_ENTRY, MAGIC,
+                                   FORMAT_VERSION, CHECKSUM_OFFSET, ALIGNMENT)
+from helpers import trained_weights, grid
+
+
+class WeightFormatTest(unittest.TestCase):
+    '''
+    Saved weights must load back unchanged, and damaged or unknown files must be refused.
+    '''
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'model.weights')
+        self.weights = list(trained_weights())
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def patch(self, offset: int, data: bytes) -> None:
+        '''Overwrite bytes of the saved file.'''
+        with open(self.path, 'r+b') as weights_file:
+            weights_file.seek(offset)
+            weights_file.write(data)
+
+    def test_round_trip(self) -> None:
+        save_weights(self.path, self.weights)
+        for mmap in (True, False):
+            with self.subTest(mmap=mmap):
+                loaded = load_weights(self.path, mmap=mmap)
+                self.assertEqual(len(loaded), len(self.weights))
+                for expected, actual in zip(self.weights, loaded):
+                    np.testing.assert_array_equal(actual, expected)
+                    if mmap:  # Mapped pages start page-aligned, so every array lands on its aligned offset
+                        self.assertEqual(actual.ctypes.data % ALIGNMENT, 0)
+                    self.assertFalse(actual.flags.writeable)
+                del loaded
+
+    def test_load_model(self) -> None:
+        save_weights(self.path, self.weights)
+        model = load_model(self.path, mmap=False)
+        self.assertIsInstance(model, NumpyModel)
+        rows = grid()[::101]
+        np.testing.assert_array_equal(model.predict(rows), NumpyModel(self.weights).predict(rows))
+
+    def test_ensemble_round_trip(self) -> None:
+        ensemble = EnsembleModel([self.weights, list(trained_weights(1))])
+        save_weights(self.path, ensemble.get_weights())
+        loaded = load_model(self.path, mmap=False)
+        self.assertIsInstance(loaded, EnsembleModel)
+        self.assertEqual(loaded.size, 2)
+        rows = grid()[::101]
+        np.testing.assert_allclose(loaded.predict(rows), ensemble.predict(rows), rtol=1e-6)
+
+    def test_flipped_byte_fails_checksum(self) -> None:
+        save_weights(self.path, self.weights)
+        size = os.path.getsize(self.path)
+        # One byte in the array table, one in the middle of the data and the last byte of the file
+        for offset in (HEADER.size + 1, size // 2, size - 1):
+            with self.subTest(offset=offset):
+                save_weights(self.path, self.weights)
+                with open(self.path, 'rb') as weights_file:
+                    weights_file.seek(offset)
+                    original = weights_file.read(1)
+                self.patch(offset, bytes([original[0] ^ 0x01]))
+                with self.assertRaisesRegex(ValueError, 'checksum'):
+                    load_weights(self.path, mmap=False)
+                load_weights(self.path, mmap=False, verify=False)  # Still readable when not verified
+
+    def test_newer_version_refused(self) -> None:
+        save_weights(self.path, self.weights)
+        self.patch(len(MAGIC), struct.pack('<H', FORMAT_VERSION + 1))
+        with self.assertRaisesRegex(ValueError, 'version'):
+            load_weights(self.path, mmap=False)
+
+    def test_not_a_weights_file(self) -> None:
+        with open(self.path, 'wb') as weights_file:
+            weights_file.write(b'PK\x03\x04' + bytes(60))
+        with self.assertRaisesRegex(ValueError, 'not a weights file'):
+            load_weights(self.path, mmap=False)
+
+    def test_version_2_file_loads(self) -> None:
+        # Lay a file out the way version 2 wrote it: rows and columns per array, CRC over the whole file
+        arrays = [np.ascontiguousarray(w, dtype='<f4') for w in self.weights]
+        offset = -(-(HEADER.size + LEGACY_ARRAY_ENTRY.size * len(arrays)) // ALIGNMENT) * ALIGNMENT
+        entries, chunks = [], []
+        for array in arrays:
+            entries.append((offset, array.shape[0], array.shape[1] if array.ndim == 2 else 0))
+            chunks.append((offset, array.tobytes()))
+            offset = -(-(offset + array.nbytes) // ALIGNMENT) * ALIGNMENT
+        data = bytearray(offset)
+        for start, chunk in chunks:
+            data[start:start + len(chunk)] = chunk
+        header = HEADER.pack(MAGIC, 2, len(arrays), 0) + b''.join(LEGACY_ARRAY_ENTRY.pack(*e) for e in entries)
+        data[:len(header)] = header
+        struct.pack_into('<I', data, CHECKSUM_OFFSET, zlib.crc32(bytes(data)))
+        with open(self.path, 'wb') as weights_file:
+            weights_file.write(data)
+
+        for expected, actual in zip(self.weights, load_weights(self.path, mmap=False)):
+            np.testing.assert_array_equal(actual, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()